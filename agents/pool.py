@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import os
+import queue
+from contextlib import contextmanager
+
+from agents.researcher import create_researcher
+from agents.validator import create_validator
+from config import get_llm
+
+
+def build_agents():
+    """
+    Build a fresh (researcher, validator) pair sharing one LLM client.
+    """
+    llm = get_llm()
+    return create_researcher(llm=llm), create_validator(llm=llm)
+
+
+class AgentPool:
+    """
+    Pool of warm researcher/validator pairs.
+
+    CrewAI agents hold per-run state, so a pair is leased exclusively by one
+    lookup at a time. Pairs are returned after use and reused by later lookups
+    (on any thread), so agent construction and LLM client setup are paid once
+    per concurrent worker rather than once per lookup.
+    """
+
+    def __init__(self, max_idle: int = 8):
+        self.max_idle = max_idle
+        # LIFO keeps the most recently used (warmest) pair at the front.
+        self._idle: queue.LifoQueue = queue.LifoQueue()
+
+    @contextmanager
+    def lease(self):
+        try:
+            agents = self._idle.get_nowait()
+        except queue.Empty:
+            agents = build_agents()
+
+        yield agents
+
+        # Only pairs that finished cleanly go back; a failed run may have left
+        # an agent in a half-configured state.
+        if self._idle.qsize() < self.max_idle:
+            self._idle.put_nowait(agents)
+
+    def warm(self, count: int) -> None:
+        """Pre-build up to ``count`` idle pairs, e.g. at worker start-up."""
+        while self._idle.qsize() < min(count, self.max_idle):
+            self._idle.put_nowait(build_agents())
+
+    def clear(self) -> None:
+        while True:
+            try:
+                self._idle.get_nowait()
+            except queue.Empty:
+                return
+
+
+agent_pool = AgentPool(max_idle=int(os.getenv("AGENT_POOL_SIZE", "8")))
@@ -1,6 +1,6 @@
 from crewai import Agent
 from config import get_llm
-from tools.search_tool import duckduckgo_search_tool
+from tools.search_tool import duckduckgo_multi_search_tool, duckduckgo_search_tool
 import re
 
 
@@ -16,7 +16,7 @@ def extract_urls(text: str):
     return cleaned_urls
 
 
-def create_validator():
+def create_validator(llm=None):
     return Agent(
         role="Source Validation Analyst",
         goal=(
@@ -29,7 +29,7 @@ def create_validator():
             "public sources such as official websites, Wikipedia, and reputable news outlets. "
             "You reject weak or single-source claims."
         ),
-        tools=[duckduckgo_search_tool],
-        llm=get_llm(),
+        tools=[duckduckgo_search_tool, duckduckgo_multi_search_tool],
+        llm=llm or get_llm(),
         verbose=True
     )
\ No newline at end of file
@@ -2,14 +2,18 @@ from __future__ import annotations
 
 import csv
 import json
+import os
+import queue
 import re
+import threading
 import uuid
 from io import BytesIO, StringIO
 from pathlib import Path
 
-from flask import Flask, jsonify, render_template, request, send_file, url_for
+from flask import Flask, Response, jsonify, render_template, request, send_file, url_for
 
-from tools.lookup import run_lookup
+from tools import cache, jobs, metrics
+from tools.lookup import run_lookup, run_lookup_many
 from agents.reporter import build_report  # moved into agents/
 from tools.report_pdf import generate_batch_csv_pdf, generate_report_pdf
 
@@ -26,6 +30,18 @@ app = Flask(
 _BATCH_CSV_DOWNLOADS: dict[str, bytes] = {}
 _BATCH_PDF_DOWNLOADS: dict[str, bytes] = {}
 
+# Largest number of rows accepted by a single /lookup/batch request.
+BATCH_MAX_ROWS = 500
+
+# Largest number of rows accepted by a single background job.
+JOB_MAX_ROWS = 10000
+
+# Only the first N rows of an uploaded CSV are processed to save LLM calls.
+CSV_ROW_LIMIT = 5
+
+# Seconds between SSE keep-alive comments while a lookup stage is running.
+SSE_KEEPALIVE_SECONDS = 15
+
 
 @app.route("/", methods=["GET"])
 def index():
@@ -38,6 +54,8 @@ def lookup():
 
     company = (data.get("company") or "").strip()
     role = (data.get("role") or "").strip()
+    # Retry even if this lookup recently failed (skips the negative cache).
+    force = bool(data.get("force"))
 
     if not company or not role:
         return (
@@ -54,15 +72,8 @@ def lookup():
         )
 
     try:
-        result = run_lookup(company=company, role=role)
-        # Attach a presenter-friendly report object for the UI.
-        try:
-            report = build_report(result)
-            result["report"] = report
-        except Exception:
-            # Reporting is non-critical; if it fails, we still return core result.
-            pass
-        return jsonify(result)
+        result = run_lookup(company=company, role=role, force=force)
+        return jsonify(_attach_report(result))
     except Exception as exc:  # noqa: B902
         # Do NOT modify or inspect internal logic; just surface a structured error.
         return (
@@ -80,6 +91,129 @@ def lookup():
         )
 
 
+def _attach_report(result: dict) -> dict:
+    """Attach a presenter-friendly report object for the UI."""
+    try:
+        result["report"] = build_report(result)
+    except Exception:
+        # Reporting is non-critical; if it fails, we still return core result.
+        pass
+    return result
+
+
+@app.route("/lookup/batch", methods=["POST"])
+def lookup_batch():
+    """
+    Run many lookups concurrently and return all results in request order.
+
+    Body: { "items": [ { "company": "...", "role": "..." }, ... ] }
+    Rows missing a company or role are returned as error payloads without
+    running a lookup.
+    """
+    data = request.get_json(silent=True) or {}
+    items = data.get("items") or []
+    if not isinstance(items, list) or not items:
+        return jsonify({"error": "Missing or empty 'items' array."}), 400
+    if len(items) > BATCH_MAX_ROWS:
+        return jsonify({"error": f"At most {BATCH_MAX_ROWS} items per batch."}), 400
+
+    results: list[dict | None] = [None] * len(items)
+    pending: list[tuple[int, str, str]] = []
+
+    for idx, item in enumerate(items):
+        item = item if isinstance(item, dict) else {}
+        company = (item.get("company") or "").strip()
+        role = (item.get("role") or "").strip()
+        if not company or not role:
+            results[idx] = {
+                "error": "Both 'company' and 'role' are required.",
+                "company": company,
+                "current_title": role,
+                "confidence_score": 0.0,
+                "attempts": 0,
+            }
+            continue
+        pending.append((idx, company, role))
+
+    looked_up = run_lookup_many([(company, role) for _, company, role in pending])
+    for (idx, _, _), result in zip(pending, looked_up):
+        results[idx] = _attach_report(result)
+
+    return jsonify({"results": results})
+
+
+def _sse_event(stage: str, data: dict) -> str:
+    return f"event: {stage}\ndata: {json.dumps(data)}\n\n"
+
+
+@app.route("/lookup/stream", methods=["GET"])
+def lookup_stream():
+    """
+    Stream lookup progress as Server-Sent Events.
+
+    Query: ?company=...&role=...[&force=1]
+    Emits one event per pipeline stage ("cache", "fast_path", "attempt",
+    "research", "validation", "confidence"), then a final "result" event
+    with the same payload as POST /lookup (or an "error" event).
+
+    The lookup runs on its own thread. If the client disconnects early the
+    stream stops; the lookup itself still finishes and fills the cache, so
+    asking again returns instantly.
+    """
+    company = (request.args.get("company") or "").strip()
+    role = (request.args.get("role") or "").strip()
+    force = request.args.get("force", "").lower() in ("1", "true", "yes")
+
+    if not company or not role:
+        return jsonify({"error": "Both 'company' and 'role' are required."}), 400
+
+    events: queue.Queue = queue.Queue()
+
+    def on_event(stage: str, data: dict) -> None:
+        events.put((stage, data))
+
+    def worker() -> None:
+        try:
+            result = run_lookup(company=company, role=role, on_event=on_event, force=force)
+            events.put(("result", _attach_report(result)))
+        except Exception as exc:  # noqa: B902
+            events.put(
+                (
+                    "error",
+                    {
+                        "error": "Lookup failed",
+                        "detail": str(exc),
+                        "company": company,
+                        "current_title": role,
+                        "confidence_score": 0.0,
+                        "attempts": 0,
+                    },
+                )
+            )
+        finally:
+            events.put(None)
+
+    threading.Thread(target=worker, name="lookup-stream", daemon=True).start()
+
+    def stream():
+        while True:
+            try:
+                item = events.get(timeout=SSE_KEEPALIVE_SECONDS)
+            except queue.Empty:
+                # Comment line: keeps proxies from closing an idle connection.
+                yield ": keep-alive\n\n"
+                continue
+            if item is None:
+                return
+            yield _sse_event(*item)
+
+    return Response(
+        stream(),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @app.route("/report", methods=["POST"])
 def report_pdf():
   """
@@ -139,59 +273,52 @@ def csv_report():
         return "Invalid CSV file", 400
 
     rows_for_report = []
+    pending = []
 
-    # Only process the first 5 data rows to save LLM calls.
+    # Only process the first few data rows to save LLM calls.
     for idx, row in enumerate(reader, start=1):
-        if idx > 5:
+        if idx > CSV_ROW_LIMIT:
             break
 
         title = (row.get("Title") or "").strip()
         company_name = (row.get("Company Name") or "").strip()
 
         # Preserve any existing values, but typically these are blank in the template.
-        first_name = (row.get("First Name") or "").strip()
-        last_name = (row.get("Last Name") or "").strip()
-        source_val = (row.get("Source") or "").strip()
-
-        # If either key field is missing, just carry the row through unchanged.
-        if not title or not company_name:
-            rows_for_report.append(
-                {
-                    "Title": title,
-                    "Company Name": company_name,
-                    "First Name": first_name,
-                    "Last Name": last_name,
-                    "Source": source_val,
-                }
-            )
-            continue
-
-        try:
-            result = run_lookup(company=company_name, role=title)
-            first_name = (result.get("first_name") or "").strip()
-            last_name = (result.get("last_name") or "").strip()
-
-            primary = (result.get("primary_source") or "").strip()
-            validation_sources = result.get("validation_sources") or []
-            first_validation = ""
-            if validation_sources:
-                first_validation = (validation_sources[0] or "").strip()
-
-            source_val = primary or first_validation or source_val
-        except Exception as exc:  # noqa: B902
-            # On failure, surface an inline note in the Source column
-            source_val = f"Lookup error: {exc}"
-
         rows_for_report.append(
             {
                 "Title": title,
                 "Company Name": company_name,
-                "First Name": first_name,
-                "Last Name": last_name,
-                "Source": source_val,
+                "First Name": (row.get("First Name") or "").strip(),
+                "Last Name": (row.get("Last Name") or "").strip(),
+                "Source": (row.get("Source") or "").strip(),
             }
         )
 
+        # If either key field is missing, just carry the row through unchanged.
+        if title and company_name:
+            pending.append(len(rows_for_report) - 1)
+
+    results = run_lookup_many(
+        [(rows_for_report[i]["Company Name"], rows_for_report[i]["Title"]) for i in pending]
+    )
+    for i, result in zip(pending, results):
+        row = rows_for_report[i]
+        if result.get("detail"):
+            # On failure, surface an inline note in the Source column
+            row["Source"] = f"Lookup error: {result['detail']}"
+            continue
+
+        row["First Name"] = (result.get("first_name") or "").strip()
+        row["Last Name"] = (result.get("last_name") or "").strip()
+
+        primary = (result.get("primary_source") or "").strip()
+        validation_sources = result.get("validation_sources") or []
+        first_validation = ""
+        if validation_sources:
+            first_validation = (validation_sources[0] or "").strip()
+
+        row["Source"] = primary or first_validation or row["Source"]
+
     # Build an enriched CSV alongside the PDF.
     fieldnames = ["Title", "Company Name", "First Name", "Last Name", "Source"]
     csv_buffer = StringIO()
@@ -267,6 +394,26 @@ def batch_report_pdf():
     if not items:
         return jsonify({"error": "Missing or empty 'results' array."}), 400
 
+    rows_for_report = _items_to_report_rows(items)
+    csv_bytes = _rows_to_csv_bytes(rows_for_report)
+
+    csv_token = uuid.uuid4().hex
+    _BATCH_CSV_DOWNLOADS[csv_token] = csv_bytes
+
+    download_url = url_for("csv_download", token=csv_token, _external=True)
+    pdf_bytes = generate_batch_csv_pdf(rows_for_report, download_url=download_url)
+
+    pdf_token = uuid.uuid4().hex
+    _BATCH_PDF_DOWNLOADS[pdf_token] = pdf_bytes
+
+    return jsonify({"pdf_token": pdf_token, "csv_token": csv_token})
+
+
+def _items_to_report_rows(items: list[dict]) -> list[dict]:
+    """
+    Build report rows from { title, company_name, result | error } items,
+    surfacing failures in the Source column.
+    """
     rows_for_report = []
     for item in items:
         title = (item.get("title") or "").strip()
@@ -291,25 +438,17 @@ def batch_report_pdf():
             })
             continue
         rows_for_report.append(_result_to_report_row(result, title, company_name))
+    return rows_for_report
 
+
+def _rows_to_csv_bytes(rows_for_report: list[dict]) -> bytes:
     fieldnames = ["Title", "Company Name", "First Name", "Last Name", "Source"]
     csv_buffer = StringIO()
     writer = csv.DictWriter(csv_buffer, fieldnames=fieldnames)
     writer.writeheader()
     for row in rows_for_report:
         writer.writerow({k: row.get(k, "") for k in fieldnames})
-    csv_bytes = csv_buffer.getvalue().encode("utf-8-sig")
-
-    csv_token = uuid.uuid4().hex
-    _BATCH_CSV_DOWNLOADS[csv_token] = csv_bytes
-
-    download_url = url_for("csv_download", token=csv_token, _external=True)
-    pdf_bytes = generate_batch_csv_pdf(rows_for_report, download_url=download_url)
-
-    pdf_token = uuid.uuid4().hex
-    _BATCH_PDF_DOWNLOADS[pdf_token] = pdf_bytes
-
-    return jsonify({"pdf_token": pdf_token, "csv_token": csv_token})
+    return csv_buffer.getvalue().encode("utf-8-sig")
 
 
 @app.route("/pdf-download/<token>", methods=["GET"])
@@ -325,6 +464,137 @@ def pdf_download(token: str):
     )
 
 
+@app.route("/metrics", methods=["GET"])
+def metrics_endpoint():
+    """Prometheus scrape endpoint: stage latency histograms and pipeline counters."""
+    return Response(metrics.render(), mimetype="text/plain; version=0.0.4")
+
+
+@app.route("/health/cache", methods=["GET"])
+def cache_health():
+    """
+    Redis circuit breaker state. Lookups keep working while it is open,
+    they just bypass the cache.
+    """
+    return jsonify(cache.redis_breaker.state())
+
+
+# -----------------------
+# Background jobs
+# -----------------------
+
+@app.route("/jobs", methods=["POST"])
+def submit_batch_job():
+    """
+    Queue a CSV batch for background processing and return its job id.
+
+    Accepts either a multipart upload ('csv_file', Title / Company Name
+    columns) or JSON: { "items": [ { "company": "...", "role": "..." }, ... ] }.
+    Rows missing a title or company are skipped.
+    """
+    pairs: list[tuple[str, str]] = []
+    skipped = 0
+
+    uploaded = request.files.get("csv_file")
+    if uploaded and uploaded.filename:
+        try:
+            reader = csv.DictReader(StringIO(uploaded.read().decode("utf-8-sig")))
+            items = [
+                {"role": row.get("Title"), "company": row.get("Company Name")}
+                for row in reader
+            ]
+        except Exception:
+            return jsonify({"error": "Invalid CSV file"}), 400
+    else:
+        data = request.get_json(silent=True) or {}
+        items = data.get("items") or []
+
+    if not isinstance(items, list) or not items:
+        return jsonify({"error": "No rows to process."}), 400
+    if len(items) > JOB_MAX_ROWS:
+        return jsonify({"error": f"At most {JOB_MAX_ROWS} rows per job."}), 400
+
+    for item in items:
+        item = item if isinstance(item, dict) else {}
+        title = (item.get("role") or "").strip()
+        company_name = (item.get("company") or "").strip()
+        if not title or not company_name:
+            skipped += 1
+            continue
+        pairs.append((title, company_name))
+
+    job_id = jobs.submit_job(pairs)
+    return (
+        jsonify(
+            {
+                "job_id": job_id,
+                "total": len(pairs),
+                "skipped": skipped,
+                "status_url": url_for("job_status", job_id=job_id),
+            }
+        ),
+        202,
+    )
+
+
+@app.route("/jobs/<job_id>", methods=["GET"])
+def job_status(job_id: str):
+    """
+    Poll a job: status, progress counts and, unless ?rows=0, per-row results.
+    """
+    include_rows = request.args.get("rows", "1") != "0"
+    job = jobs.get_job(job_id, include_rows=include_rows)
+    if job is None:
+        return jsonify({"error": "Job not found."}), 404
+    return jsonify(job)
+
+
+def _job_report_rows(job: dict) -> list[dict]:
+    items = []
+    for row in job.get("rows") or []:
+        item = {"title": row["title"], "company_name": row["company_name"], "result": row["result"]}
+        if row["status"] != "done":
+            item["error"] = "Pending"
+        items.append(item)
+    return _items_to_report_rows(items)
+
+
+@app.route("/jobs/<job_id>/csv", methods=["GET"])
+def job_csv(job_id: str):
+    job = jobs.get_job(job_id)
+    if job is None:
+        return "Job not found.", 404
+    return send_file(
+        BytesIO(_rows_to_csv_bytes(_job_report_rows(job))),
+        mimetype="text/csv",
+        as_attachment=True,
+        download_name=f"role_scout_job_{job_id}.csv",
+    )
+
+
+@app.route("/jobs/<job_id>/pdf", methods=["GET"])
+def job_pdf(job_id: str):
+    job = jobs.get_job(job_id)
+    if job is None:
+        return "Job not found.", 404
+    pdf_bytes = generate_batch_csv_pdf(
+        _job_report_rows(job),
+        download_url=url_for("job_csv", job_id=job_id, _external=True),
+        note=f"Job {job_id}: {job['done']} of {job['total']} rows processed.",
+    )
+    return send_file(
+        BytesIO(pdf_bytes),
+        mimetype="application/pdf",
+        as_attachment=False,
+        download_name=f"role_scout_job_{job_id}.pdf",
+    )
+
+
+# Resume any unfinished jobs left over from a previous run.
+if os.getenv("JOBS_INPROCESS_WORKER", "1") != "0":
+    jobs.start_worker()
+
+
 if __name__ == "__main__":
     # Development entrypoint:
     #   python app.py
@@ -0,0 +1,101 @@
+"""
+Run the whole offline benchmark suite and write the results as JSON.
+
+Usage:
+    python -m benchmarks --output bench_results.json
+    python -m benchmarks --output new.json --compare bench_results.json
+
+With --compare, every latency / throughput figure is compared against the
+earlier run; the exit code is 1 if any of them regressed by more than
+--tolerance (default 20%).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import sys
+import time
+
+# Imported first: sets placeholder LLM settings before any agent module loads.
+from benchmarks import common  # noqa: F401
+
+from benchmarks import bench_agent_setup, bench_lookup, bench_micro
+
+# Figures where a larger number is better; every other *_ms figure is "lower is better".
+_HIGHER_IS_BETTER = ("throughput_per_s", "ops_per_s")
+
+
+def _flatten(data, prefix=""):
+    for key, value in data.items():
+        path = f"{prefix}.{key}" if prefix else key
+        if isinstance(value, dict):
+            yield from _flatten(value, path)
+        elif isinstance(value, (int, float)) and (key.endswith("_ms") or key in _HIGHER_IS_BETTER):
+            yield path, float(value)
+
+
+def compare(baseline: dict, current: dict, tolerance: float) -> list[str]:
+    """
+    Return human-readable regressions of ``current`` against ``baseline``.
+    """
+    before = dict(_flatten(baseline))
+    regressions = []
+    for path, value in _flatten(current):
+        old = before.get(path)
+        if not old:
+            continue
+        higher_is_better = path.rsplit(".", 1)[-1] in _HIGHER_IS_BETTER
+        change = (old - value) / old if higher_is_better else (value - old) / old
+        if change > tolerance:
+            regressions.append(f"{path}: {old:g} -> {value:g} ({change:+.0%} worse)")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the offline benchmark suite.")
+    parser.add_argument("--output", default="bench_results.json")
+    parser.add_argument("--compare", help="Earlier results JSON to check for regressions.")
+    parser.add_argument("--tolerance", type=float, default=0.20)
+    parser.add_argument("--lookups", type=int, default=64)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16])
+    parser.add_argument("--llm-latency", type=float, default=0.05)
+    parser.add_argument("--search-latency", type=float, default=0.01)
+    parser.add_argument("--iterations", type=int, default=500)
+    args = parser.parse_args()
+
+    results = {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        "lookup": bench_lookup.run(
+            lookups=args.lookups,
+            concurrency=args.concurrency,
+            llm_latency=args.llm_latency,
+            search_latency=args.search_latency,
+        ),
+        "micro": bench_micro.run(args.iterations),
+        "agent_setup": bench_agent_setup.run(min(args.iterations, 200)),
+    }
+
+    with open(args.output, "w", encoding="utf-8") as fh:
+        json.dump(results, fh, indent=2)
+    print(f"Wrote {args.output}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as fh:
+            baseline = json.load(fh)
+        regressions = compare(baseline, results, args.tolerance)
+        if regressions:
+            print("Regressions:")
+            for line in regressions:
+                print(f"  {line}")
+            sys.exit(1)
+        print(f"No regressions beyond {args.tolerance:.0%} against {args.compare}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Micro-benchmark: per-lookup agent/LLM setup time, rebuilt vs pooled.
+
+Measures only object construction (no LLM or search calls), i.e. the cost
+run_lookup paid before its first crew.kickoff():
+
+- rebuilt:    create_researcher() + create_validator() on every lookup
+  (two fresh crewai.LLM clients), as the pipeline used to do.
+- pooled:     the same number of lookups leasing from a new, empty
+  AgentPool, so the first lease pays for building the pair.
+- lease_only: leasing an already-warm pair; pool overhead alone, not a
+  like-for-like comparison with rebuilt.
+
+Usage:
+    python -m benchmarks.bench_agent_setup --iterations 200
+"""
+
+from __future__ import annotations
+
+import argparse
+
+# Imported first: sets placeholder LLM settings before any agent module loads.
+from benchmarks.common import summarize, time_calls_ms
+
+from agents.pool import AgentPool
+from agents.researcher import create_researcher
+from agents.validator import create_validator
+
+
+def run(iterations: int = 200) -> dict:
+    def rebuilt():
+        create_researcher()
+        create_validator()
+
+    def leasing(pool):
+        def lease():
+            with pool.lease():
+                pass
+        return lease
+
+    # Cold: the pool starts empty, so the samples include one full build.
+    pooled = time_calls_ms(leasing(AgentPool(max_idle=1)), iterations)
+
+    warm_pool = AgentPool(max_idle=1)
+    warm_pool.warm(1)
+
+    return {
+        "iterations": iterations,
+        "rebuilt": summarize(time_calls_ms(rebuilt, iterations)),
+        "pooled": summarize(pooled),
+        "lease_only": summarize(time_calls_ms(leasing(warm_pool), iterations)),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    results = run(args.iterations)
+    print(f"Per-lookup setup over {results['iterations']} iterations")
+    for name in ("rebuilt", "pooled", "lease_only"):
+        stats = results[name]
+        print(
+            f"  {name:<10} mean {stats['mean_ms']:>9.3f} ms   "
+            f"p50 {stats['p50_ms']:>9.3f} ms   p99 {stats['p99_ms']:>9.3f} ms"
+        )
+    print("  (pooled includes the cold pool fill; lease_only is pool overhead alone)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+End-to-end run_lookup benchmark against offline fakes.
+
+Runs the real pipeline (cache, single-flight, fast path, retry loop,
+scoring) with FakeCrew / FakeDDGS / FakeRedis from benchmarks.fakes, and
+reports throughput and p50/p99 latency per concurrency level, once with a
+cold cache and once warm.
+
+Usage:
+    python -m benchmarks.bench_lookup --lookups 64 --concurrency 1 4 16
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# Imported first: sets placeholder LLM settings before any agent module loads.
+from benchmarks.common import summarize
+
+from benchmarks import fakes
+from tools import cache, domain_index, lookup, search_tool
+
+
+def _measure(pairs, concurrency: int) -> dict:
+    latencies: list[float] = []
+
+    def one(pair):
+        start = time.perf_counter()
+        lookup.run_lookup(*pair)
+        latencies.append((time.perf_counter() - start) * 1000)
+
+    searches_before = fakes.FakeDDGS.calls
+    # The pipeline logs every stage to stdout; keep the benchmark output readable.
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            list(pool.map(one, pairs))
+        wall = time.perf_counter() - start
+
+    return {
+        "lookups": len(pairs),
+        "wall_s": round(wall, 3),
+        "throughput_per_s": round(len(pairs) / wall, 2) if wall else 0.0,
+        "searches": fakes.FakeDDGS.calls - searches_before,
+        **summarize(latencies),
+    }
+
+
+def run(
+    lookups: int = 64,
+    concurrency=(1, 4, 16),
+    llm_latency: float = 0.05,
+    search_latency: float = 0.01,
+    fast_path: bool = True,
+) -> dict:
+    fake_redis = fakes.install(llm_latency=llm_latency, search_latency=search_latency)
+    lookup.fast_path_enabled = fast_path
+    pairs = fakes.synthetic_pairs(lookups)
+
+    levels = {}
+    for level in concurrency:
+        fake_redis.flushall()
+        search_tool.clear_search_cache()
+        domain_index.clear_memo()
+        cache.clear_local_cache()
+        levels[str(level)] = {
+            "cold": _measure(pairs, level),
+            "warm": _measure(pairs, level),
+        }
+
+    return {
+        "config": {
+            "lookups": lookups,
+            "llm_latency_s": llm_latency,
+            "search_latency_s": search_latency,
+            "fast_path": fast_path,
+        },
+        "concurrency": levels,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--lookups", type=int, default=64)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16])
+    parser.add_argument("--llm-latency", type=float, default=0.05)
+    parser.add_argument("--search-latency", type=float, default=0.01)
+    parser.add_argument("--no-fast-path", action="store_true")
+    args = parser.parse_args()
+
+    results = run(
+        lookups=args.lookups,
+        concurrency=args.concurrency,
+        llm_latency=args.llm_latency,
+        search_latency=args.search_latency,
+        fast_path=not args.no_fast_path,
+    )
+    for level, phases in results["concurrency"].items():
+        for phase, stats in phases.items():
+            print(
+                f"concurrency {level:>3} {phase:<4}  {stats['throughput_per_s']:>8.2f} lookups/s   "
+                f"p50 {stats['p50_ms']:>9.2f} ms   p99 {stats['p99_ms']:>9.2f} ms   "
+                f"searches {stats['searches']}"
+            )
+
+
+if __name__ == "__main__":
+    main()
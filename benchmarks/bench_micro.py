@@ -0,0 +1,106 @@
+"""
+Micro-benchmarks for the pure-Python hot spots: scoring, title matching,
+report building and the two PDF generators.
+
+discover_official_domain is served by FakeDDGS with zero latency, so
+calculate_confidence is measured without network time.
+
+Usage:
+    python -m benchmarks.bench_micro --iterations 500
+"""
+
+from __future__ import annotations
+
+import argparse
+
+# Imported first: sets placeholder LLM settings before any agent module loads.
+from benchmarks.common import summarize, time_calls_ms
+
+from agents.reporter import build_report
+from benchmarks import fakes
+from tools.alias import title_matches
+from tools.report_pdf import generate_batch_csv_pdf, generate_report_pdf
+from tools.scoring import calculate_confidence, calculate_confidence_batch
+
+_URLS = [
+    "https://www.benchco0000.com/leadership",
+    "https://en.wikipedia.org/wiki/benchco0000",
+    "https://www.reuters.com/business/benchco0000",
+    "https://www.linkedin.com/in/benchco0000",
+]
+
+_VALIDATION_TEXT = (
+    '{"validated": true, "full_name": "Ada Lovelace", '
+    '"confirming_urls": ["https://www.benchco0000.com/leadership"], '
+    '"reasoning": "Ada Lovelace is the Chief Executive Officer & Founder of Benchco 0000 '
+    'according to the official leadership page and Wikipedia."}'
+)
+
+_RESULT = {
+    "first_name": "Ada",
+    "last_name": "Lovelace",
+    "company": "benchco 0000",
+    "current_title": "ceo",
+    "primary_source": _URLS[0],
+    "confidence_score": 0.87,
+    "validation_sources": _URLS,
+    "attempts": 1,
+}
+
+
+def _cases():
+    report = build_report(_RESULT)
+    batch_rows = [
+        {
+            "Title": "CEO",
+            "Company Name": f"Benchco {i:04d}",
+            "First Name": "Ada",
+            "Last Name": "Lovelace",
+            "Source": _URLS[0],
+        }
+        for i in range(50)
+    ]
+    score_records = [(_URLS, "Benchco 0000")] * 1000
+    return {
+        "calculate_confidence": lambda: calculate_confidence(_URLS, "Benchco 0000"),
+        "calculate_confidence_batch_1000": lambda: calculate_confidence_batch(score_records),
+        "title_matches": lambda: title_matches("CEO & Founder", _VALIDATION_TEXT),
+        "title_matches_miss": lambda: title_matches("Head of Procurement", _VALIDATION_TEXT),
+        "build_report": lambda: build_report(_RESULT),
+        "generate_report_pdf": lambda: generate_report_pdf(report),
+        "generate_batch_csv_pdf_50_rows": lambda: generate_batch_csv_pdf(
+            batch_rows, download_url="http://localhost/csv"
+        ),
+    }
+
+
+def run(iterations: int = 500) -> dict:
+    fakes.install()
+    fakes.synthetic_pairs(1)
+
+    results = {}
+    for name, fn in _cases().items():
+        # PDFs are ~1000x slower than the rest; keep total runtime sane.
+        n = max(10, iterations // 20) if "pdf" in name else iterations
+        fn()  # warm-up
+        stats = summarize(time_calls_ms(fn, n))
+        stats["iterations"] = n
+        stats["ops_per_s"] = round(1000 / stats["mean_ms"], 1) if stats["mean_ms"] else 0.0
+        results[name] = stats
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=500)
+    args = parser.parse_args()
+
+    for name, stats in run(args.iterations).items():
+        print(
+            f"{name:<32} mean {stats['mean_ms']:>9.4f} ms   p99 {stats['p99_ms']:>9.4f} ms   "
+            f"{stats['ops_per_s']:>10.1f} ops/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""
+Shared helpers for the benchmark scripts.
+
+Importing this module first sets placeholder LLM settings: agents and LLM
+clients are constructed during benchmarks, but no provider is ever called.
+"""
+
+from __future__ import annotations
+
+import os
+import statistics
+import time
+
+os.environ.setdefault("MODEL", "openai/gpt-4o-mini")
+os.environ.setdefault("API_KEY", "sk-benchmark")
+
+
+def percentile(ordered: list[float], pct: float) -> float:
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+def summarize(samples_ms: list[float]) -> dict:
+    """
+    Mean / p50 / p99 of a list of millisecond samples.
+    """
+    ordered = sorted(samples_ms)
+    return {
+        "mean_ms": round(statistics.fmean(ordered), 3) if ordered else 0.0,
+        "p50_ms": round(percentile(ordered, 0.50), 3),
+        "p99_ms": round(percentile(ordered, 0.99), 3),
+    }
+
+
+def time_calls_ms(fn, iterations: int) -> list[float]:
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
@@ -0,0 +1,361 @@
+"""
+Deterministic local stand-ins for everything run_lookup talks to over the
+network, so the pipeline can be benchmarked offline.
+
+- FakeDDGS replaces ddgs.DDGS behind the DDGS search backend
+  (tools.search_backends), which tools.scoring also searches through.
+- FakeCrew replaces crewai.Crew in tools.lookup; it plays both agents,
+  sleeping for the configured LLM latency and calling the (fake) search
+  tool the way the real agents do.
+- FakeRedis replaces tools.cache.redis_client with an in-memory dict.
+
+Every synthetic company has a known answer. Even-numbered companies have the
+name in their search snippets (fast path can answer); odd ones need the
+crew, and every fifth one fails validation on the first attempt so the
+retry path is exercised too.
+"""
+
+from __future__ import annotations
+
+import json
+import queue
+import re
+import threading
+import time
+from types import SimpleNamespace
+
+# company (lower-case) -> {"company", "role", "first", "last", "slug", "easy", "retry"}
+PEOPLE: dict[str, dict] = {}
+
+_FIRST_NAMES = ["Ada", "Grace", "Alan", "Linus", "Margaret", "Dennis", "Barbara", "Ken"]
+_LAST_NAMES = ["Lovelace", "Hopper", "Turing", "Torvalds", "Hamilton", "Ritchie", "Liskov", "Thompson"]
+_ROLES = ["CEO", "CTO", "CFO", "Chief Marketing Officer", "Head of Engineering"]
+
+
+def synthetic_pairs(count: int) -> list[tuple[str, str]]:
+    """
+    Register ``count`` synthetic companies and return their (company, role) pairs.
+    """
+    pairs = []
+    for i in range(count):
+        company = f"Benchco {i:04d}"
+        role = _ROLES[i % len(_ROLES)]
+        PEOPLE[company.lower()] = {
+            "company": company,
+            "role": role,
+            "first": _FIRST_NAMES[i % len(_FIRST_NAMES)],
+            "last": _LAST_NAMES[(i // len(_FIRST_NAMES)) % len(_LAST_NAMES)],
+            "slug": f"benchco{i:04d}",
+            "easy": i % 2 == 0,
+            "retry": i % 5 == 0,
+        }
+        pairs.append((company, role))
+    return pairs
+
+
+def _find_person(text: str):
+    text = text.lower()
+    # Longest match first so "Benchco 0012" never matches "Benchco 001".
+    for company in sorted(PEOPLE, key=len, reverse=True):
+        if company in text:
+            return PEOPLE[company]
+    return None
+
+
+# -----------------------
+# Search
+# -----------------------
+
+class FakeDDGS:
+    latency = 0.0
+    calls = 0
+    _calls_lock = threading.Lock()
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def text(self, query: str, max_results: int = 5):
+        with FakeDDGS._calls_lock:
+            FakeDDGS.calls += 1
+        if self.latency:
+            time.sleep(self.latency)
+
+        person = _find_person(query)
+        if person is None:
+            return [
+                {"title": f"Result {i}", "body": f"Nothing relevant for {query}.", "href": f"https://example.org/{i}"}
+                for i in range(max_results)
+            ]
+
+        name = f"{person['first']} {person['last']}"
+        mention = name if person["easy"] else "the leadership team"
+        title = f"{person['role']} of {person['company']}"
+        results = [
+            {
+                "title": f"{person['company']} – Leadership",
+                "body": f"{mention}, {title}, leads the company.",
+                "href": f"https://www.{person['slug']}.com/leadership",
+            },
+            {
+                "title": f"{person['company']} - Wikipedia",
+                "body": f"{person['company']} is a company. Its {person['role']} is {mention}.",
+                "href": f"https://en.wikipedia.org/wiki/{person['slug']}",
+            },
+            {
+                "title": f"{person['company']} names new {person['role']}",
+                "body": f"{mention} was appointed {title}.",
+                "href": f"https://www.reuters.com/business/{person['slug']}",
+            },
+            {
+                "title": f"{mention} - LinkedIn",
+                "body": f"{title}.",
+                "href": f"https://www.linkedin.com/in/{person['slug']}",
+            },
+            {
+                "title": "Industry roundup",
+                "body": "Unrelated news.",
+                "href": "https://blog.example.org/roundup",
+            },
+        ]
+        return results[:max_results]
+
+
+# -----------------------
+# Crew (stands in for both LLM agents)
+# -----------------------
+
+_QUERY_LINE = re.compile(r"^\d+\. (.+)$", re.MULTILINE)
+
+
+class FakeCrew:
+    latency = 0.0
+
+    def __init__(self, agents=None, tasks=None, verbose=False, **kwargs):
+        self.tasks = list(tasks or [])
+
+    def _think(self):
+        if self.latency:
+            time.sleep(self.latency)
+
+    def _search(self, description: str):
+        from tools.search_tool import search_many
+
+        # One multi-search tool call, as the prompts ask for.
+        queries = [q.strip() for q in _QUERY_LINE.findall(description)]
+        search_many(queries, max_results=5, return_exceptions=True)
+
+    def kickoff(self):
+        outputs = []
+        person = _find_person(self.tasks[-1].description) if self.tasks else None
+
+        if len(self.tasks) == 2:
+            research = self.tasks[0]
+            self._search(research.description)
+            self._think()
+            if person:
+                raw = f"{person['first']} {person['last']} https://www.{person['slug']}.com/leadership"
+            else:
+                raw = "Unknown"
+            outputs.append(SimpleNamespace(raw=raw))
+
+        validation = self.tasks[-1]
+        retry = "Candidate names from earlier attempts" in validation.description
+        self._search(validation.description)
+        self._think()
+
+        if person is None:
+            payload = {"validated": False, "full_name": None, "confirming_urls": [], "reasoning": "Unknown"}
+        elif person["retry"] and not retry:
+            payload = {
+                "validated": False,
+                "full_name": f"{person['first']} {person['last']}",
+                "confirming_urls": [f"https://www.linkedin.com/in/{person['slug']}"],
+                "reasoning": "Only one weak source.",
+            }
+        else:
+            payload = {
+                "validated": True,
+                "full_name": f"{person['first']} {person['last']}",
+                "confirming_urls": [
+                    f"https://www.{person['slug']}.com/leadership",
+                    f"https://en.wikipedia.org/wiki/{person['slug']}",
+                ],
+                "reasoning": f"Confirmed as {person['role']} of {person['company']}.",
+            }
+        outputs.append(SimpleNamespace(raw=json.dumps(payload)))
+        return SimpleNamespace(tasks_output=outputs)
+
+
+# -----------------------
+# Redis
+# -----------------------
+
+class FakeRedis:
+    """
+    The subset of redis.Redis used by the cache and single-flight layers.
+    """
+
+    def __init__(self):
+        self._data: dict[str, tuple[str, float | None]] = {}
+        self._subscribers: list = []
+        self._lock = threading.Lock()
+
+    def _live(self, key):
+        item = self._data.get(key)
+        if item is None:
+            return None
+        value, expires = item
+        if expires is not None and expires <= time.time():
+            del self._data[key]
+            return None
+        return value
+
+    def get(self, key):
+        with self._lock:
+            return self._live(key)
+
+    def mget(self, keys):
+        with self._lock:
+            return [self._live(key) for key in keys]
+
+    def ttl(self, key):
+        with self._lock:
+            if self._live(key) is None:
+                return -2
+            expires = self._data[key][1]
+            return -1 if expires is None else max(0, int(expires - time.time()))
+
+    def scan_iter(self, match="*", count=None):
+        prefix = match.rstrip("*")
+        with self._lock:
+            keys = [key for key in self._data if key.startswith(prefix)]
+        return iter(keys)
+
+    def setex(self, key, ttl, value):
+        with self._lock:
+            self._data[key] = (value, time.time() + ttl)
+        return True
+
+    def set(self, key, value, nx=False, ex=None):
+        with self._lock:
+            if nx and self._live(key) is not None:
+                return None
+            self._data[key] = (value, time.time() + ex if ex else None)
+        return True
+
+    def exists(self, key):
+        with self._lock:
+            return int(self._live(key) is not None)
+
+    def delete(self, *keys):
+        with self._lock:
+            return sum(1 for key in keys if self._data.pop(key, None) is not None)
+
+    def eval(self, script, numkeys, key, token):
+        # Only used for single-flight's compare-and-delete release.
+        with self._lock:
+            if self._live(key) == token:
+                del self._data[key]
+                return 1
+        return 0
+
+    def flushall(self):
+        with self._lock:
+            self._data.clear()
+
+    def publish(self, channel, message):
+        with self._lock:
+            subscribers = [s for s in self._subscribers if channel in s.channels]
+        for sub in subscribers:
+            sub.messages.put({"type": "message", "channel": channel, "data": message})
+        return len(subscribers)
+
+    def pipeline(self, transaction=False):
+        return FakePipeline(self)
+
+    def pubsub(self, ignore_subscribe_messages=False):
+        sub = FakePubSub()
+        with self._lock:
+            self._subscribers.append(sub)
+        return sub
+
+
+class FakePipeline:
+    """
+    Queues commands and runs them against the fake on execute().
+    """
+
+    def __init__(self, redis):
+        self._redis = redis
+        self._commands = []
+
+    def __getattr__(self, name):
+        method = getattr(self._redis, name)
+
+        def queue_command(*args, **kwargs):
+            self._commands.append((method, args, kwargs))
+            return self
+
+        return queue_command
+
+    def execute(self):
+        commands, self._commands = self._commands, []
+        return [method(*args, **kwargs) for method, args, kwargs in commands]
+
+
+class FakePubSub:
+    def __init__(self):
+        self.channels = set()
+        self.messages = queue.Queue()
+
+    def subscribe(self, *channels):
+        self.channels.update(channels)
+
+    def listen(self):
+        while True:
+            yield self.messages.get()
+
+    def get_message(self, timeout=0.0):
+        try:
+            return self.messages.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+
+# -----------------------
+# Install
+# -----------------------
+
+def install(llm_latency: float = 0.0, search_latency: float = 0.0) -> FakeRedis:
+    """
+    Patch the pipeline modules to use the fakes and return the fake Redis.
+    """
+    import tools.cache
+    import tools.domain_index
+    import tools.lookup
+    import tools.scoring
+    import tools.search_backends
+    import tools.search_tool
+    from tools.rate_limit import TokenBucket
+
+    FakeCrew.latency = llm_latency
+    FakeDDGS.latency = search_latency
+
+    fake_redis = FakeRedis()
+    tools.cache.redis_client = tools.cache.GuardedRedis(fake_redis, tools.cache.redis_breaker)
+    tools.cache.clear_local_cache()
+    tools.lookup.Crew = FakeCrew
+    tools.search_backends.DDGS = FakeDDGS
+    tools.search_backends.search_clients.clear()
+    # Fake searches are free; measure the pipeline, not the throttle.
+    tools.search_backends.search_limiter = TokenBucket(rate=0)
+    tools.search_backends.set_search_backend(tools.search_backends.DDGSBackend())
+    tools.search_tool.clear_search_cache()
+    tools.domain_index.clear_memo()
+    return fake_redis
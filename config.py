@@ -4,10 +4,40 @@ from crewai import LLM
 
 load_dotenv()
 
+# Size of the shared keep-alive connection pool used for LLM HTTP calls.
+LLM_HTTP_POOL_SIZE = int(os.getenv("LLM_HTTP_POOL_SIZE", "20"))
+
+
+def _configure_http_pool():
+    """
+    Route LLM calls through one pooled HTTP client so repeated lookups reuse
+    keep-alive connections instead of paying a new TLS handshake each time.
+    """
+    try:
+        import httpx
+        import litellm
+    except ImportError:
+        return
+
+    if getattr(litellm, "client_session", None) is not None:
+        return
+
+    litellm.client_session = httpx.Client(
+        limits=httpx.Limits(
+            max_connections=LLM_HTTP_POOL_SIZE,
+            max_keepalive_connections=LLM_HTTP_POOL_SIZE,
+        ),
+        timeout=httpx.Timeout(600.0, connect=10.0),
+    )
+
+
+_configure_http_pool()
+
+
 def get_llm():
     return LLM(
         model=os.getenv("MODEL"),
         api_key=os.getenv("API_KEY"),
         base_url=os.getenv("BASE_URL"),
         temperature=0.2
-    )
\ No newline at end of file
+    )
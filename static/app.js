@@ -244,6 +244,66 @@
     }
   }
 
+  const stageMessages = {
+    cache: (d) => (d.hit ? "Found a cached result." : "No cached result, searching…"),
+    fast_path: (d) => (d.answered ? "Answered from search results." : "Starting research agents…"),
+    attempt: (d) => `Attempt ${d.attempt}: researching…`,
+    research: (d) => `Attempt ${d.attempt}: research done, validating…`,
+    validation: (d) =>
+      d.full_name ? `Attempt ${d.attempt}: checking ${d.full_name}…` : `Attempt ${d.attempt}: validating…`,
+    confidence: (d) => `Attempt ${d.attempt}: confidence ${formatScore(d.confidence_score)}`,
+  };
+
+  async function lookupOnce(company, role) {
+    const response = await fetch("/lookup", {
+      method: "POST",
+      headers: {
+        "Content-Type": "application/json",
+      },
+      body: JSON.stringify({ company, role }),
+    });
+    const data = await response.json();
+    return { ok: response.ok, data };
+  }
+
+  function lookupWithProgress(company, role) {
+    // Streams stage events from /lookup/stream and shows them in the run tip.
+    return new Promise((resolve, reject) => {
+      const params = new URLSearchParams({ company, role });
+      const source = new EventSource(`/lookup/stream?${params.toString()}`);
+      let finished = false;
+
+      Object.keys(stageMessages).forEach((stage) => {
+        source.addEventListener(stage, (event) => {
+          if (!runTipText) return;
+          try {
+            runTipText.textContent = stageMessages[stage](JSON.parse(event.data));
+          } catch (e) {
+            console.error("Bad progress event", e);
+          }
+        });
+      });
+
+      source.addEventListener("result", (event) => {
+        finished = true;
+        source.close();
+        resolve({ ok: true, data: JSON.parse(event.data) });
+      });
+
+      source.addEventListener("error", (event) => {
+        if (finished) return;
+        finished = true;
+        source.close();
+        // Server-sent "error" events carry data; connection errors do not.
+        if (event.data) {
+          resolve({ ok: false, data: JSON.parse(event.data) });
+        } else {
+          reject(new Error("Lookup stream failed"));
+        }
+      });
+    });
+  }
+
   form.addEventListener("submit", async (event) => {
     event.preventDefault();
     clearError();
@@ -259,17 +319,11 @@
     setLoading(true);
 
     try {
-      const response = await fetch("/lookup", {
-        method: "POST",
-        headers: {
-          "Content-Type": "application/json",
-        },
-        body: JSON.stringify({ company, role }),
-      });
-
-      const data = await response.json();
+      const { ok, data } = window.EventSource
+        ? await lookupWithProgress(company, role)
+        : await lookupOnce(company, role);
 
-      if (!response.ok) {
+      if (!ok) {
         const message = data && data.error ? data.error : "Lookup failed.";
         showError(message);
         resultContent.classList.add("hidden");
@@ -455,28 +509,36 @@
       csvViewReportBtn.disabled = true;
       lastBatchPdfToken = null;
 
-      const results = [];
-      for (let i = 0; i < rows.length; i++) {
-        csvProgressLabel.textContent = `Processing ${i + 1}/${total} rows…`;
-        csvProgressBarFill.style.width = `${((i + 1) / total) * 100}%`;
+      // All rows are looked up concurrently on the server in one request.
+      csvProgressLabel.textContent = `Processing ${total} rows…`;
+      csvProgressBarFill.style.width = "10%";
 
-        const { title, company_name } = rows[i];
-        try {
-          const res = await fetch("/lookup", {
-            method: "POST",
-            headers: { "Content-Type": "application/json" },
-            body: JSON.stringify({ company: company_name, role: title }),
-          });
-          const data = await res.json();
-          if (!res.ok) {
-            results.push({ title, company_name, error: data.error || data.detail || "Lookup failed" });
-          } else {
-            results.push({ title, company_name, result: data });
-          }
-        } catch (err) {
-          results.push({ title, company_name, error: err.message || "Network error" });
+      let results = [];
+      try {
+        const res = await fetch("/lookup/batch", {
+          method: "POST",
+          headers: { "Content-Type": "application/json" },
+          body: JSON.stringify({
+            items: rows.map(({ title, company_name }) => ({ company: company_name, role: title })),
+          }),
+        });
+        const data = await res.json();
+        if (!res.ok) {
+          const message = data.error || data.detail || "Lookup failed";
+          results = rows.map(({ title, company_name }) => ({ title, company_name, error: message }));
+        } else {
+          results = rows.map(({ title, company_name }, i) => ({
+            title,
+            company_name,
+            result: (data.results || [])[i],
+          }));
         }
+      } catch (err) {
+        const message = err.message || "Network error";
+        results = rows.map(({ title, company_name }) => ({ title, company_name, error: message }));
       }
+      csvProgressLabel.textContent = `Processed ${total}/${total} rows…`;
+      csvProgressBarFill.style.width = "90%";
 
       try {
         const res = await fetch("/batch-report-pdf", {
@@ -0,0 +1,66 @@
+import itertools
+
+import pytest
+
+from agents import pool as agent_pool_module
+from agents.pool import AgentPool
+
+
+@pytest.fixture
+def built(monkeypatch):
+    counter = itertools.count()
+    pairs = []
+
+    def build_agents():
+        pair = (f"researcher-{next(counter)}", "validator")
+        pairs.append(pair)
+        return pair
+
+    monkeypatch.setattr(agent_pool_module, "build_agents", build_agents)
+    return pairs
+
+
+def test_lease_reuses_returned_pair(built):
+    pool = AgentPool(max_idle=2)
+    with pool.lease() as first:
+        pass
+    with pool.lease() as second:
+        pass
+    assert first is second
+    assert len(built) == 1
+
+
+def test_concurrent_leases_get_separate_pairs(built):
+    pool = AgentPool(max_idle=2)
+    with pool.lease() as first, pool.lease() as second:
+        assert first is not second
+    assert len(built) == 2
+
+
+def test_idle_pairs_are_capped(built):
+    pool = AgentPool(max_idle=1)
+    with pool.lease(), pool.lease():
+        pass
+    with pool.lease(), pool.lease():
+        pass
+    # Only one pair was kept, so the second round built one more.
+    assert len(built) == 3
+
+
+def test_failed_lease_is_not_returned(built):
+    pool = AgentPool(max_idle=2)
+    with pytest.raises(RuntimeError):
+        with pool.lease():
+            raise RuntimeError("crew run failed")
+    with pool.lease():
+        pass
+    assert len(built) == 2
+
+
+def test_warm_prebuilds_up_to_max_idle(built):
+    pool = AgentPool(max_idle=2)
+    pool.warm(5)
+    assert len(built) == 2
+    with pool.lease(), pool.lease():
+        pass
+    assert len(built) == 2
@@ -0,0 +1,41 @@
+import pytest
+
+from benchmarks import fakes
+from tools import lookup
+
+
+def test_duplicate_rows_run_pipeline_once(monkeypatch):
+    fakes.install()
+    runs = []
+
+    def pipeline(company, designation, on_event=None):
+        runs.append((company, designation))
+        return {"first_name": "Jane", "last_name": "Doe", "company": company, "confidence_score": 0.9}
+
+    monkeypatch.setattr(lookup, "_run_pipeline", pipeline)
+
+    seen = []
+    results = lookup.run_lookup_many(
+        [("Acme", "CEO")] * 5 + [("Acme Inc.", "Chief Executive Officer")],
+        max_workers=2,
+        on_result=lambda idx, result: seen.append(idx),
+    )
+
+    assert len(runs) == 1
+    assert sorted(seen) == list(range(6))
+    assert all(r["first_name"] == "Jane" for r in results)
+    assert len({id(r) for r in results}) == 6
+
+
+def test_cached_rows_skip_pipeline(monkeypatch):
+    fakes.install()
+    lookup.set_cached_result("Initech", "CTO", {"first_name": "Bill", "last_name": "Lumbergh"})
+
+    def pipeline(*_args, **_kwargs):
+        pytest.fail("pipeline ran for a cached row")
+
+    monkeypatch.setattr(lookup, "_run_pipeline", pipeline)
+
+    results = lookup.run_lookup_many([("Initech", "CTO"), ("Initech", "Chief Technology Officer")])
+    assert [r["cache"] for r in results] == [True, True]
+
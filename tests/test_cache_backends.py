@@ -0,0 +1,67 @@
+import time
+
+import pytest
+
+from tools.cache import GuardedRedis
+from tools.cache_backends import CacheBackend, SQLiteBackend, sqlite_path
+
+
+@pytest.fixture
+def backend(tmp_path):
+    return SQLiteBackend(str(tmp_path / "cache.db"), max_entries=10)
+
+
+def test_backends_implement_the_interface(backend):
+    assert isinstance(backend, CacheBackend)
+    assert issubclass(GuardedRedis, CacheBackend)
+    with pytest.raises(TypeError):
+        CacheBackend()
+
+
+def test_get_set_and_ttl_expiry(backend):
+    backend.setex("a", 1, "x")
+    backend.set("b", "y")
+    assert backend.mget(["a", "b", "c"]) == ["x", "y", None]
+    assert 0 <= backend.ttl("a") <= 1
+    assert backend.ttl("b") == -1
+    assert backend.ttl("c") == -2
+
+    time.sleep(1.05)
+    assert backend.get("a") is None
+    assert backend.exists("a", "b") == 1
+
+
+def test_set_nx_and_compare_and_delete(backend):
+    assert backend.set("lock", "t1", nx=True, ex=30)
+    assert backend.set("lock", "t2", nx=True, ex=30) is None
+    assert backend.eval("script", 1, "lock", "t2") == 0
+    assert backend.eval("script", 1, "lock", "t1") == 1
+    assert backend.get("lock") is None
+
+
+def test_pipeline_runs_in_one_transaction(backend):
+    pipe = backend.pipeline()
+    pipe.setex("a", 30, "1")
+    pipe.setex("b", 30, "2")
+    pipe.delete("a")
+    assert pipe.execute() == [True, True, 1]
+    assert backend.mget(["a", "b"]) == [None, "2"]
+
+
+def test_prune_evicts_soonest_to_expire_first(backend):
+    backend.set("permanent", "p")
+    for i in range(15):
+        backend.setex(f"k{i}", 100 + i, "v")
+    backend.prune()
+    assert backend.get("permanent") == "p"
+    assert backend.get("k0") is None
+    assert backend.get("k14") == "v"
+    assert len(list(backend.scan_iter("*"))) == 10
+
+
+def test_sqlite_path():
+    assert sqlite_path("sqlite:///cache.db") == "cache.db"
+    assert sqlite_path("sqlite:////var/cache.db") == "/var/cache.db"
+    for url in ("sqlite://cache.db", "sqlite:///", "sqlite:cache.db", "redis://localhost"):
+        with pytest.raises(ValueError):
+            sqlite_path(url)
@@ -0,0 +1,53 @@
+import pytest
+
+from tools.cache import build_cache_key
+from tools.canonical import normalize_company
+
+
+@pytest.mark.parametrize(
+    "names, expected",
+    [
+        (["Meta", "Meta Platforms", "The Meta Platforms, Inc."], "meta"),
+        (["Wipro", "Wipro Ltd", "Wipro Limited"], "wipro"),
+        (["Tata Consultancy Services", "Tata Consultancy Services Pvt. Ltd."], "tata consultancy services"),
+    ],
+)
+def test_legal_forms_share_a_name(names, expected):
+    assert {normalize_company(n) for n in names} == {expected}
+
+
+@pytest.mark.parametrize(
+    "first, second",
+    [
+        ("Tata Technologies", "Tata Group"),
+        ("Adani Enterprises", "Adani Group"),
+        ("Wipro Enterprises", "Wipro Limited"),
+        ("HCL Technologies", "HCL Group"),
+    ],
+)
+def test_distinct_companies_keep_distinct_keys(first, second):
+    assert normalize_company(first) != normalize_company(second)
+    assert build_cache_key(first, "CEO") != build_cache_key(second, "CEO")
+
+
+@pytest.mark.parametrize(
+    "name, expected",
+    [
+        ("Nestlé SA", "nestlé"),
+        ("Société Générale", "société générale"),
+        ("腾讯", "腾讯"),
+        ("ＡＢＣ Ｃｏｒｐ", "abc"),
+    ],
+)
+def test_unicode_names_survive(name, expected):
+    assert normalize_company(name) == expected
+
+
+def test_non_latin_companies_keep_distinct_keys():
+    keys = {build_cache_key(name, "CEO") for name in ("腾讯", "阿里巴巴", "Яндекс", "삼성전자")}
+    assert len(keys) == 4
+    assert "lookup:v3::chief executive officer" not in keys
+
+
+def test_name_without_word_characters_falls_back_to_raw():
+    assert normalize_company("  !!!  ") == "!!!"
@@ -0,0 +1,55 @@
+import pytest
+import redis
+
+from tools.cache import GuardedRedis
+from tools.circuit_breaker import CircuitBreaker, CircuitOpenError
+
+
+class FailingClient:
+    def __init__(self, message):
+        self.message = message
+        self.calls = 0
+
+    def get(self, key):
+        self.calls += 1
+        raise redis.exceptions.ConnectionError(self.message)
+
+
+def _guarded(message, threshold=3, reset_timeout=60):
+    client = FailingClient(message)
+    breaker = CircuitBreaker("test", failure_threshold=threshold, reset_timeout=reset_timeout)
+    return GuardedRedis(client, breaker), client, breaker
+
+
+def test_breaker_opens_after_consecutive_failures():
+    guarded, client, breaker = _guarded("Connection refused")
+    for _ in range(3):
+        with pytest.raises(redis.exceptions.ConnectionError):
+            guarded.get("k")
+    assert breaker.state()["state"] == "open"
+
+    with pytest.raises(CircuitOpenError):
+        guarded.get("k")
+    assert client.calls == 3
+
+
+def test_pool_exhaustion_does_not_open_breaker():
+    guarded, client, breaker = _guarded("No connection available.")
+    for _ in range(10):
+        with pytest.raises(redis.exceptions.ConnectionError):
+            guarded.get("k")
+    assert breaker.state()["state"] == "closed"
+    assert client.calls == 10
+
+
+def test_pool_exhaustion_frees_half_open_trial():
+    guarded, client, breaker = _guarded("Connection refused", threshold=1, reset_timeout=0)
+    with pytest.raises(redis.exceptions.ConnectionError):
+        guarded.get("k")
+
+    client.message = "No connection available."
+    for _ in range(2):
+        # Each call is a half-open trial; the pool error must not wedge it.
+        with pytest.raises(redis.exceptions.ConnectionError):
+            guarded.get("k")
+    assert client.calls == 3
@@ -0,0 +1,74 @@
+import json
+import time
+
+import pytest
+
+from tools import domain_index
+from tools.domain_index import FileDomainStore
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    store = FileDomainStore(str(tmp_path / "domains.json"))
+    monkeypatch.setattr(domain_index, "_store", store)
+    monkeypatch.setattr(domain_index, "_seeded", True)
+    domain_index.clear_memo()
+    yield store
+    domain_index.clear_memo()
+
+
+def test_file_store_persists_across_instances(tmp_path):
+    path = str(tmp_path / "domains.json")
+    FileDomainStore(path).set("globex", "globex.com", None)
+    assert FileDomainStore(path).get("globex") == "globex.com"
+
+
+def test_file_store_expires_entries(tmp_path, monkeypatch):
+    store = FileDomainStore(str(tmp_path / "domains.json"))
+    store.set("globex", "globex.com", 60)
+    assert store.get("globex") == "globex.com"
+    now = time.time()
+    monkeypatch.setattr(domain_index.time, "time", lambda: now + 61)
+    assert store.get("globex") is None
+
+
+def test_legal_forms_share_one_entry(store):
+    domain_index.set_domain("Meta Platforms, Inc.", "Meta.com")
+    assert domain_index.get_domain("Meta") == "meta.com"
+    assert domain_index.get_domain("meta platforms") == "meta.com"
+    with open(store.path, encoding="utf-8") as f:
+        assert list(json.load(f)) == ["meta"]
+
+
+def test_memo_answers_repeat_lookups(store, monkeypatch):
+    domain_index.set_domain("Globex", "globex.com")
+
+    def fail(company):
+        pytest.fail("store read despite memo")
+
+    monkeypatch.setattr(store, "get", fail)
+    assert domain_index.get_domain("Globex Corp") == "globex.com"
+
+
+def test_unknown_company(store):
+    assert domain_index.get_domain("Initech") is None
+    assert domain_index.get_domain("") is None
+
+
+@pytest.mark.parametrize(
+    "name, content",
+    [
+        ("seed.csv", "company,domain\nGlobex Ltd, globex.com\nInitech,initech.io\n,skip.com\n"),
+        ("seed.json", json.dumps({"Globex Ltd": "globex.com", "Initech": "initech.io"})),
+    ],
+)
+def test_load_seed(store, tmp_path, name, content):
+    path = tmp_path / name
+    path.write_text(content, encoding="utf-8")
+    assert domain_index.load_seed(str(path)) == 2
+    domain_index.clear_memo()
+    assert domain_index.get_domain("Globex") == "globex.com"
+    assert domain_index.get_domain("Initech") == "initech.io"
+    # Seeded entries never expire
+    with open(store.path, encoding="utf-8") as f:
+        assert all(expires is None for _, expires in json.load(f).values())
@@ -0,0 +1,28 @@
+from tools import lookup
+
+SNIPPET = "Jane Doe, Chief Executive Officer of Acme, spoke at the annual meeting."
+
+
+def _results(*_args, **_kwargs):
+    return [[
+        {"title": "Leadership - Acme", "body": SNIPPET, "href": "https://acme.com/leadership"},
+        {"title": "Acme - Wikipedia", "body": SNIPPET, "href": "https://en.wikipedia.org/wiki/Acme"},
+    ]]
+
+
+def _patch(monkeypatch):
+    monkeypatch.setattr(lookup, "search_many", _results)
+    monkeypatch.setattr(lookup, "calculate_confidence", lambda **_kwargs: 0.95)
+
+
+def test_fast_path_accepts_matching_title(monkeypatch):
+    _patch(monkeypatch)
+    for designation in ("Chief Executive Officer", "CEO"):
+        result = lookup._fast_path("Acme", designation)
+        assert result and (result["first_name"], result["last_name"]) == ("Jane", "Doe")
+
+
+def test_fast_path_ignores_other_c_level_titles(monkeypatch):
+    _patch(monkeypatch)
+    assert lookup._fast_path("Acme", "Chief Marketing Officer") is None
+    assert lookup._fast_path("Acme", "CMO") is None
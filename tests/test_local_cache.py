@@ -0,0 +1,93 @@
+import json
+import threading
+import time
+
+import pytest
+
+from benchmarks import fakes
+from tools import cache
+
+PERSON = {"first_name": "Jane", "last_name": "Doe", "confidence_score": 0.9}
+
+
+@pytest.fixture(autouse=True)
+def no_global_listener(monkeypatch):
+    # The listener clears the local tier when it (re)connects; keep it from
+    # starting mid-test. test_listener_drops_other_workers_keys runs its own.
+    monkeypatch.setattr(cache, "_listener", object())
+
+
+def _no_redis_reads(monkeypatch, fake):
+    def fail(*args, **kwargs):
+        pytest.fail("read went to Redis")
+
+    monkeypatch.setattr(fake, "get", fail)
+    monkeypatch.setattr(fake, "mget", fail)
+
+
+def _wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return condition()
+
+
+def test_local_hit_skips_redis(monkeypatch):
+    fake = fakes.install()
+    cache.set_cached_result("Acme", "CEO", PERSON)
+    _no_redis_reads(monkeypatch, fake)
+
+    assert cache.get_cached_result("Acme", "CEO")["first_name"] == "Jane"
+    assert cache.get_cached_results_many([("Acme", "CEO")])[0]["cache"] is True
+
+
+def test_redis_hit_fills_local_tier(monkeypatch):
+    fake = fakes.install()
+    cache.set_cached_result("Acme", "CEO", PERSON)
+    cache.clear_local_cache()
+
+    assert cache.get_cached_result("Acme", "CEO")["last_name"] == "Doe"
+    _no_redis_reads(monkeypatch, fake)
+    assert cache.get_cached_result("Acme", "CEO")["last_name"] == "Doe"
+
+
+def test_local_copies_are_not_shared():
+    fakes.install()
+    cache.set_cached_result("Acme", "CEO", PERSON)
+    first = cache.get_cached_result("Acme", "CEO")
+    first["first_name"] = "Changed"
+    assert cache.get_cached_result("Acme", "CEO")["first_name"] == "Jane"
+
+
+def test_writes_publish_invalidations():
+    fake = fakes.install()
+    sub = fake.pubsub()
+    sub.subscribe(cache.CACHE_INVALIDATION_CHANNEL)
+
+    cache.set_cached_result("Acme", "CEO", PERSON)
+    cache.invalidate_cached_result("Acme", "CEO")
+
+    key = cache.build_cache_key("Acme", "CEO")
+    for _ in range(2):
+        payload = json.loads(sub.get_message(timeout=1.0)["data"])
+        assert payload == {"key": key, "from": cache._instance_id}
+    assert cache.get_cached_result("Acme", "CEO") is None
+
+
+def test_listener_drops_other_workers_keys():
+    fake = fakes.install()
+    threading.Thread(target=cache._listen_for_invalidations, daemon=True).start()
+    assert _wait_for(lambda: fake._subscribers)
+
+    cache.set_cached_result("Acme", "CEO", PERSON)
+    cache.set_cached_result("Globex", "CTO", PERSON)
+    acme = cache.build_cache_key("Acme", "CEO")
+    globex = cache.build_cache_key("Globex", "CTO")
+
+    # Our own messages are ignored ...
+    fake.publish(cache.CACHE_INVALIDATION_CHANNEL, json.dumps({"key": globex, "from": cache._instance_id}))
+    # ... another worker's drop our local copy.
+    fake.publish(cache.CACHE_INVALIDATION_CHANNEL, json.dumps({"key": acme, "from": "other-worker"}))
+
+    assert _wait_for(lambda: cache._local.get(acme) is None)
+    assert cache._local.get(globex) is not None
@@ -0,0 +1,62 @@
+import pytest
+
+from tools.public_suffix import _load_trie, _update, get_root_domain, root_domain_for_host, url_host
+
+
+@pytest.mark.parametrize(
+    "url, expected",
+    [
+        ("https://news.bbc.co.uk/article", "bbc.co.uk"),
+        ("https://www.example.com/a?b#c", "example.com"),
+        ("HTTPS://user@Sub.Example.COM:8080/path", "example.com"),
+        ("example.com.", "example.com"),
+        ("https://shop.example.com.au", "example.com.au"),
+        # Private suffixes are ignored, as in tldextract's default
+        ("https://foo.github.io", "github.io"),
+    ],
+)
+def test_root_domain(url, expected):
+    assert get_root_domain(url) == expected
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "http://192.168.0.1/admin",
+        "http://[::1]:8000/",
+        "https://intranet.unknown-tld-xyz",
+        "https://co.uk",
+        "localhost",
+        "",
+    ],
+)
+def test_no_root_domain(url):
+    assert get_root_domain(url) is None
+
+
+def test_wildcard_and_exception_rules():
+    # "*.ck": every second-level name is a suffix ...
+    assert root_domain_for_host("shop.example.co.ck") == "example.co.ck"
+    assert root_domain_for_host("co.ck") is None
+    # ... except "!www.ck", which is registrable itself.
+    assert root_domain_for_host("www.ck") == "www.ck"
+    assert root_domain_for_host("a.www.ck") == "www.ck"
+
+
+def test_url_host():
+    assert url_host("  https://a:b@Host.Example.com:443/x ") == "host.example.com"
+    assert url_host("http://[2001:db8::1]:80/") == "[2001:db8::1]"
+
+
+def test_update_keeps_only_icann_rules(tmp_path):
+    source = tmp_path / "full.dat"
+    source.write_text(
+        "// ===BEGIN ICANN DOMAINS===\ncom\n// comment\nco.uk\n*.ck\n!www.ck\n"
+        "// ===END ICANN DOMAINS===\n// ===BEGIN PRIVATE DOMAINS===\ngithub.io\n",
+        encoding="utf-8",
+    )
+    target = tmp_path / "icann.dat"
+    assert _update(str(source), str(target)) == 4
+    trie = _load_trie(str(target))
+    assert set(trie) == {"com", "uk", "ck"}
+    assert trie["ck"]["www"]["!"] and trie["ck"]["*"]["$"]
@@ -0,0 +1,35 @@
+import time
+
+from benchmarks import fakes
+from tools import cache, lookup
+
+
+def _wait_for_refreshes(timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while lookup._refreshing and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+def test_failing_refresh_runs_pipeline_once(monkeypatch):
+    fakes.install()
+    lookup._failed_refreshes.clear()
+    cache.set_cached_result(
+        "Acme", "CEO", {"first_name": "Jane", "last_name": "Doe", "confidence_score": 0.9}
+    )
+    # Every cached entry is past its soft TTL.
+    monkeypatch.setattr(cache, "CACHE_SOFT_TTL", -1)
+
+    runs = []
+
+    def failing_pipeline(company, designation, on_event=None):
+        runs.append((company, designation))
+        return lookup.build_error_output("No reliable result found", company, designation, 3)
+
+    monkeypatch.setattr(lookup, "_run_pipeline", failing_pipeline)
+
+    for _ in range(10):
+        result = lookup.run_lookup("Acme", "CEO")
+        assert result["stale"] and result["first_name"] == "Jane"
+        _wait_for_refreshes()
+
+    assert len(runs) == 1
@@ -0,0 +1,84 @@
+import pytest
+
+from tools import domain_index, scoring
+from tools.scoring import CREDIBILITY_SCORES, DomainClassifier
+
+
+def test_classifier_walks_parent_domains():
+    classifier = DomainClassifier({"reuters.com": "news", "Wikipedia.org.": "wikipedia"})
+    assert classifier.classify_host("uk.reuters.com") == "news"
+    assert classifier.classify_host("en.m.wikipedia.org") == "wikipedia"
+    assert classifier.classify_host("notreuters.com") is None
+    assert classifier.classify_host("reuters.com.evil.net") is None
+
+
+def test_classifier_rejects_unknown_category():
+    with pytest.raises(ValueError):
+        DomainClassifier({"example.com": "blog"})
+
+
+def test_classifier_from_file_extends_base(tmp_path):
+    path = tmp_path / "domains.json"
+    path.write_text('{"ft.com": "news", "reuters.com": "other"}', encoding="utf-8")
+    classifier = DomainClassifier.from_file(str(path), base={"reuters.com": "news"})
+    assert classifier.classify_host("www.ft.com") == "news"
+    assert classifier.classify_host("reuters.com") == "other"
+
+
+@pytest.mark.parametrize(
+    "url, expected",
+    [
+        ("https://about.globex.com/team", "official"),
+        ("https://en.wikipedia.org/wiki/Globex", "wikipedia"),
+        ("https://www.linkedin.com/in/someone", "linkedin"),
+        ("https://www.bbc.com/news/x", "news"),
+        ("https://blog.example.net/x", "other"),
+        ("http://10.0.0.1/x", "other"),
+    ],
+)
+def test_classify_source(url, expected):
+    assert scoring.classify_source(url, "globex.com") == expected
+
+
+@pytest.fixture
+def indexed(monkeypatch):
+    calls = []
+    domains = {"Globex": "globex.com", "Initech": "initech.io"}
+
+    def get_domain(company):
+        calls.append(company)
+        return domains.get(company)
+
+    def no_discovery(company):
+        pytest.fail("batch scoring searched the web")
+
+    monkeypatch.setattr(domain_index, "get_domain", get_domain)
+    monkeypatch.setattr(scoring, "discover_official_domain", no_discovery)
+    return calls
+
+
+def test_batch_matches_single_scores(indexed):
+    records = [
+        (["https://globex.com/about", "https://www.reuters.com/x"], "Globex"),
+        (["https://initech.io/team"], "Initech", False, False),
+        (["https://www.linkedin.com/in/x"], "Globex"),
+    ]
+    batch = scoring.calculate_confidence_batch(records)
+    single = [
+        scoring.calculate_confidence(urls, company, *flags)
+        for urls, company, *flags in records
+    ]
+    assert batch == single
+
+
+def test_batch_resolves_each_company_once(indexed):
+    records = [(["https://globex.com"], "Globex")] * 5 + [(["https://x.org"], "Unknown Co")] * 3
+    scoring.calculate_confidence_batch(records)
+    assert sorted(indexed) == ["Globex", "Unknown Co"]
+
+
+def test_batch_custom_weights(indexed):
+    weights = {**CREDIBILITY_SCORES, "linkedin": 0.5}
+    records = [(["https://www.linkedin.com/in/x"], "Globex", False, False)]
+    assert scoring.calculate_confidence_batch(records) == [0.15]
+    assert scoring.calculate_confidence_batch(records, weights=weights) == [0.5]
@@ -0,0 +1,57 @@
+import pytest
+
+from tools.search_backends import FallbackBackend, LocalIndexBackend, SearchBackend
+
+
+class StaticBackend(SearchBackend):
+    name = "static"
+
+    def __init__(self, results):
+        self.results = results
+        self.queries = []
+
+    def text(self, query, max_results=5):
+        self.queries.append(query)
+        return self.results
+
+
+@pytest.fixture
+def index(tmp_path):
+    backend = LocalIndexBackend(str(tmp_path / "index.db"))
+    backend.add_pages([
+        {"href": "https://globex.com/team", "title": "Globex leadership",
+         "body": "Hank Scorpio is the CEO of Globex Corporation."},
+    ])
+    return backend
+
+
+def test_local_index_matches_company_and_role(index):
+    results = index.text("CEO of Globex full name official website")
+    assert [r["href"] for r in results] == ["https://globex.com/team"]
+    # One of the role words is enough.
+    assert index.text("Globex CEO and founder")
+
+
+def test_local_index_ignores_other_companies(index):
+    assert index.text("CEO of Initech full name official website") == []
+
+
+def test_fallback_reaches_next_backend_for_unknown_company(index):
+    live = StaticBackend([{"title": "Initech", "body": "Bill Lumbergh", "href": "https://initech.com"}])
+    backend = FallbackBackend([index, live])
+
+    assert backend.text("Initech CEO LinkedIn profile")[0]["href"] == "https://initech.com"
+    assert backend.text("Globex CEO LinkedIn profile")[0]["href"] == "https://globex.com/team"
+    assert live.queries == ["Initech CEO LinkedIn profile"]
+
+
+def test_add_pages_dedupes_by_href(tmp_path):
+    backend = LocalIndexBackend(str(tmp_path / "index.db"))
+    page = {"href": "https://acme.com", "title": "Acme", "body": "Acme CEO"}
+    assert backend.add_pages([page, dict(page, body="Acme CEO Jane Doe")]) == 1
+    assert backend.text("Acme Jane")[0]["body"] == "Acme CEO Jane Doe"
+
+
+def test_search_backend_is_abstract():
+    with pytest.raises(TypeError):
+        SearchBackend()
@@ -0,0 +1,40 @@
+import json
+import time
+
+from benchmarks import fakes
+from tools import search_tool
+
+
+def _local_ttl(key):
+    _, expires = search_tool._query_cache._data[key]
+    return expires - time.monotonic()
+
+
+def test_empty_results_are_stored_briefly():
+    fake_redis = fakes.install()
+    empty = search_tool._search_cache_key("nobody knows", 5)
+    found = search_tool._search_cache_key("acme ceo", 5)
+
+    search_tool._store_search(empty, [])
+    search_tool._store_search(found, [{"title": "t", "body": "b", "href": "https://acme.com"}])
+
+    assert fake_redis.ttl(empty) <= search_tool.SEARCH_CACHE_EMPTY_TTL
+    assert _local_ttl(empty) <= search_tool.SEARCH_CACHE_EMPTY_TTL
+    assert fake_redis.ttl(found) > search_tool.SEARCH_CACHE_EMPTY_TTL
+
+
+def test_empty_redis_hit_is_promoted_briefly():
+    fake_redis = fakes.install()
+    key = search_tool._search_cache_key("nobody knows", 5)
+    fake_redis.setex(key, 59, json.dumps([]))
+
+    assert search_tool._cached_search(key) == []
+    assert _local_ttl(key) <= search_tool.SEARCH_CACHE_EMPTY_TTL
+
+
+def test_multi_search_without_queries():
+    fakes.install()
+    multi_search = getattr(search_tool.duckduckgo_multi_search_tool, "func",
+                           search_tool.duckduckgo_multi_search_tool)
+    assert multi_search([]) == "No queries given."
+    assert multi_search(["", "  "]) == "No queries given."
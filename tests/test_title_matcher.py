@@ -0,0 +1,43 @@
+import pytest
+
+from tools.alias import TitleMatcher, title_matches
+
+
+@pytest.mark.parametrize(
+    "designation, text",
+    [
+        ("VP Engineering", "Jane Doe, Vice President Engineering at Globex"),
+        ("Vice President Engineering", "Jane Doe, VP Engineering at Globex"),
+        ("MD", "John Roe is Managing Director of Initech"),
+        ("Managing Director", "John Roe, MD, Initech"),
+        ("CEO", "the Chief Executive Officer of Globex"),
+        ("Chief Executive Officer", "Globex CEO Jane Doe"),
+        ("CTO | Co-Founder", "a co-founder of Globex"),
+    ],
+)
+def test_aliases_match(designation, text):
+    assert title_matches(designation, text)
+
+
+def test_alias_variants_match_whole_words_only():
+    assert not title_matches("Managing Director", "run the cmd tool")
+    assert not title_matches("Vice President Sales", "mvp sales numbers")
+    assert title_matches("Vice President Sales", "Globex VP Sales Jane Doe")
+
+
+def test_strict_leaves_out_seniority_keywords():
+    text = "Jane Doe, Chief Executive Officer at Globex"
+    assert title_matches("Chief Marketing Officer", text)
+    assert not title_matches("Chief Marketing Officer", text, strict=True)
+    assert not title_matches("CMO", text, strict=True)
+    assert title_matches("CMO", "Globex chief marketing officer Jane Doe", strict=True)
+
+
+def test_custom_alias_groups():
+    matcher = TitleMatcher("sde", groups=[frozenset({"sde", "software engineer"})])
+    assert matcher.matches("Senior Software Engineer at Globex")
+    assert not TitleMatcher("sde", groups=[]).matches("Senior Software Engineer at Globex")
+
+
+def test_empty_designation_matches_everything():
+    assert title_matches("", "anything at all")
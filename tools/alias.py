@@ -1,6 +1,9 @@
 # tools/alias.py
 
+import json
+import os
 import re
+from functools import lru_cache
 
 # Core role families
 C_LEVEL_MAP = {
@@ -27,6 +30,36 @@ SENIORITY_KEYWORDS = [
 ]
 
 
+# Larger alias dictionary ({"abbreviation or title": ["equivalent", ...]}),
+# matched on whole words. Override with TITLE_ALIASES_PATH.
+TITLE_ALIASES_PATH = os.getenv(
+    "TITLE_ALIASES_PATH",
+    os.path.join(os.path.dirname(__file__), "data", "title_aliases.json"),
+)
+
+# Cap on designation variants generated from aliases.
+MAX_ALIAS_VARIANTS = 64
+
+
+def load_title_aliases(path: str = TITLE_ALIASES_PATH) -> list[frozenset]:
+    """
+    Load alias groups: each key and its equivalents form one group.
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        data = {}
+
+    groups = [
+        frozenset(normalize_text(t) for t in [key, *values] if normalize_text(t))
+        for key, values in data.items()
+    ]
+    # C_LEVEL_MAP stays the core set even if the data file is missing.
+    groups.extend(frozenset(pair) for pair in C_LEVEL_MAP.items())
+    return groups
+
+
 def normalize_text(text: str) -> str:
     text = text.lower()
     text = re.sub(r"[|,&]", " ", text)
@@ -60,30 +93,118 @@ def split_compound_title(designation: str):
     return [p.strip() for p in parts if p.strip()]
 
 
-def title_matches(designation: str, text: str) -> bool:
-    text = normalize_text(text)
-    designation = normalize_text(designation)
+# -----------------------
+# Compiled matcher
+# -----------------------
+
+# One or more of the separators normalize_text collapses into a space.
+_SEPARATOR = r"[\s|,&]+"
+
+
+def _trie_regex(phrases, prune_prefixes: bool) -> str:
+    """
+    Regex matching any of ``phrases``, built from a character trie so the
+    engine does a bounded amount of work per text position however many
+    phrases there are.
+
+    With ``prune_prefixes`` (plain substring search) a phrase that extends a
+    shorter one is dropped, since the shorter one already matches.
+    """
+    trie: dict = {}
+    for phrase in phrases:
+        node = trie
+        for ch in phrase:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def build(node) -> str:
+        if "" in node and prune_prefixes:
+            return ""
+        branches = [
+            (_SEPARATOR if ch == " " else re.escape(ch)) + build(child)
+            for ch, child in sorted(node.items())
+            if ch
+        ]
+        if not branches:
+            return ""
+        if len(branches) == 1 and "" not in node:
+            return branches[0]
+        return "(?:" + "|".join(branches) + ")" + ("?" if "" in node else "")
+
+    return build(trie)
+
+
+def _alias_variants(designation: str, groups) -> set[str]:
+    """
+    ``designation`` with each alias it contains swapped for its
+    equivalents, e.g. "vp engineering" -> "vice president engineering".
+    """
+    variants = {designation}
+    for group in groups:
+        for member in group:
+            pattern = re.compile(r"\b" + re.escape(member) + r"\b")
+            if not pattern.search(designation):
+                continue
+            for variant in list(variants):
+                for other in group - {member}:
+                    if len(variants) >= MAX_ALIAS_VARIANTS:
+                        return variants
+                    variants.add(pattern.sub(other, variant))
+    return variants
+
+
+class TitleMatcher:
+    """
+    All the ways a designation can appear in text, compiled once into a
+    single regex and checked in one scan:
+
+    - as substrings (normalised): the designation, its compound parts, its
+      C-level expansions and any seniority keyword it contains;
+    - as whole words: variants built from the alias dictionary.
+
+    With ``strict`` the seniority keywords are left out, so a bare "Chief"
+    or "Officer" near a name does not count as the requested title.
+    """
+
+    def __init__(self, designation: str, groups=None, strict: bool = False):
+        self.designation = normalize_text(designation)
+        groups = _ALIAS_GROUPS if groups is None else groups
+
+        substrings = {self.designation}
+        substrings.update(split_compound_title(self.designation))
+        substrings.update(expand_c_level(self.designation))
+        if not strict:
+            substrings.update(k for k in SENIORITY_KEYWORDS if k in self.designation)
+        substrings.discard("")
+
+        words = {
+            v for v in _alias_variants(self.designation, groups)
+            if v and v not in substrings
+        }
+
+        alternatives = []
+        if substrings:
+            alternatives.append(_trie_regex(substrings, prune_prefixes=True))
+        if words:
+            alternatives.append(r"\b" + _trie_regex(words, prune_prefixes=False) + r"\b")
+        self._regex = (
+            re.compile("|".join(alternatives), re.IGNORECASE) if alternatives else None
+        )
+
+    def matches(self, text: str) -> bool:
+        if not self.designation:
+            # Same as the substring check it replaces: "" is in every text.
+            return True
+        return self._regex.search(text) is not None
 
-    # 1️⃣ Direct match
-    if designation in text:
-        return True
 
-    # 2️⃣ Compound role handling
-    parts = split_compound_title(designation)
+_ALIAS_GROUPS = load_title_aliases()
 
-    for part in parts:
-        if part in text:
-            return True
 
-    # 3️⃣ C-level expansion
-    expanded = expand_c_level(designation)
-    for variant in expanded:
-        if variant in text:
-            return True
+@lru_cache(maxsize=1024)
+def get_title_matcher(designation: str, strict: bool = False) -> TitleMatcher:
+    return TitleMatcher(designation, strict=strict)
 
-    # 4️⃣ Seniority fallback check
-    for keyword in SENIORITY_KEYWORDS:
-        if keyword in designation and keyword in text:
-            return True
 
-    return False
\ No newline at end of file
+def title_matches(designation: str, text: str, strict: bool = False) -> bool:
+    return get_title_matcher(designation, strict).matches(text)
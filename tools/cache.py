@@ -1,21 +1,330 @@
 import json
 import os
+import re
+import sys
+import threading
+import time
+import uuid
+from urllib.parse import urlsplit
 
 import redis
 
+from tools.cache_backends import CacheBackend, SQLiteBackend, sqlite_path
+from tools.canonical import canonical_role, normalize_company
+from tools.circuit_breaker import CircuitBreaker, CircuitOpenError
+from tools.metrics import inc, timed
+from tools.ttl_cache import TTLCache
+
 REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
 
-redis_client = redis.Redis.from_url(REDIS_URL, decode_responses=True)
+# Cache backend by URL scheme: redis://... (default: REDIS_URL) or
+# sqlite:///path/to/cache.db for a single node without Redis.
+CACHE_URL = os.getenv("CACHE_URL", REDIS_URL)
+
+# Row limit of the SQLite backend; entries closest to expiry go first.
+CACHE_SQLITE_MAX_ENTRIES = int(os.getenv("CACHE_SQLITE_MAX_ENTRIES", "100000"))
+
+# Connection pool and timeouts (seconds). The cache is an optimisation, so a
+# slow Redis must fail fast rather than hold up lookups.
+REDIS_MAX_CONNECTIONS = int(os.getenv("REDIS_MAX_CONNECTIONS", "32"))
+REDIS_POOL_TIMEOUT = float(os.getenv("REDIS_POOL_TIMEOUT", "0.2"))
+REDIS_SOCKET_TIMEOUT = float(os.getenv("REDIS_SOCKET_TIMEOUT", "0.25"))
+REDIS_CONNECT_TIMEOUT = float(os.getenv("REDIS_CONNECT_TIMEOUT", "0.25"))
+
+# Skip Redis entirely for REDIS_BREAKER_RESET seconds after this many
+# consecutive connection failures or timeouts.
+REDIS_BREAKER_FAILURES = int(os.getenv("REDIS_BREAKER_FAILURES", "5"))
+REDIS_BREAKER_RESET = float(os.getenv("REDIS_BREAKER_RESET", "30"))
+
+# Also read keys written before canonical keys existed (migrated on hit).
+CACHE_LEGACY_READ = os.getenv("CACHE_LEGACY_READ", "1").lower() not in ("0", "false", "no")
+
+# Stale-while-revalidate: results older than the soft TTL are still served
+# (marked "stale") while one background refresh runs; Redis drops them at
+# the hard TTL.
+CACHE_SOFT_TTL = int(os.getenv("CACHE_SOFT_TTL", "86400"))
+CACHE_HARD_TTL = int(os.getenv("CACHE_HARD_TTL", str(7 * 86400)))
+
+# How long one worker may hold a key's refresh before another can take it.
+CACHE_REFRESH_LOCK_TTL = int(os.getenv("CACHE_REFRESH_LOCK_TTL", "300"))
+
+# In-process tier in front of Redis: hot results without a round trip.
+# Kept short-lived so a missed invalidation message only matters briefly.
+CACHE_LOCAL_SIZE = int(os.getenv("CACHE_LOCAL_SIZE", "1024"))
+CACHE_LOCAL_TTL = float(os.getenv("CACHE_LOCAL_TTL", "30"))
+
+# Failed lookups are cached briefly, per error class, so reruns and
+# duplicate rows do not pay for full crew runs again (0 disables a class).
+# Rate limits clear quickly, so that TTL is capped whatever the setting.
+RATE_LIMIT_NEGATIVE_TTL_CAP = 120
+NEGATIVE_CACHE_TTLS = {
+    "no_result": int(os.getenv("NEGATIVE_TTL_NO_RESULT", "3600")),
+    "parse_failure": int(os.getenv("NEGATIVE_TTL_PARSE_FAILURE", "600")),
+    "rate_limit": min(int(os.getenv("NEGATIVE_TTL_RATE_LIMIT", "30")), RATE_LIMIT_NEGATIVE_TTL_CAP),
+}
+
+# Error message (see tools.lookup) -> negative cache class.
+_ERROR_CLASSES = {
+    "No reliable result found": "no_result",
+    "Validation output parsing failed": "parse_failure",
+    "LLM rate limit reached": "rate_limit",
+}
+
+# Redis pub/sub channel on which workers announce rewritten/deleted keys.
+CACHE_INVALIDATION_CHANNEL = os.getenv("CACHE_INVALIDATION_CHANNEL", "role_scout:cache_invalidate")
+
+
+
+def _pool_exhausted(exc: Exception) -> bool:
+    # BlockingConnectionPool's error when no connection frees up within
+    # REDIS_POOL_TIMEOUT; raised before any command reaches Redis.
+    return isinstance(exc, redis.exceptions.ConnectionError) and "No connection available" in str(exc)
+
+
+class GuardedRedis(CacheBackend):
+    """
+    Wraps a Redis client so every command goes through a circuit breaker.
+
+    While the breaker is open, commands raise CircuitOpenError at once
+    instead of waiting on a dead connection; callers already treat any
+    Redis error as a cache miss. Only connection errors and timeouts count
+    as failures; waiting too long for a free pooled connection does not,
+    since a local burst of requests would otherwise open the breaker while
+    Redis is healthy.
+    """
+
+    name = "redis"
+
+    def __init__(self, client, breaker: CircuitBreaker):
+        self._client = client
+        self.breaker = breaker
+
+    def _call(self, fn, *args, **kwargs):
+        if not self.breaker.allow():
+            raise CircuitOpenError("Redis circuit breaker is open")
+        try:
+            result = fn(*args, **kwargs)
+        except (redis.exceptions.ConnectionError, redis.exceptions.TimeoutError) as exc:
+            if _pool_exhausted(exc):
+                # Busy here, not a sign that Redis is down.
+                self.breaker.record_ignored()
+            else:
+                self.breaker.record_failure()
+            raise
+        except Exception:
+            # Redis answered, even if with an error.
+            self.breaker.record_success()
+            raise
+        self.breaker.record_success()
+        return result
+
+    def __getattr__(self, name):
+        # Anything outside the CacheBackend interface (e.g. flushall).
+        attr = getattr(self._client, name)
+        if not callable(attr):
+            return attr
+        return lambda *args, **kwargs: self._call(attr, *args, **kwargs)
+
+    def get(self, key):
+        return self._call(self._client.get, key)
+
+    def mget(self, keys):
+        return self._call(self._client.mget, keys)
+
+    def set(self, key, value, nx=False, ex=None):
+        return self._call(self._client.set, key, value, nx=nx, ex=ex)
+
+    def setex(self, key, ttl, value):
+        return self._call(self._client.setex, key, ttl, value)
+
+    def exists(self, *keys):
+        return self._call(self._client.exists, *keys)
+
+    def delete(self, *keys):
+        return self._call(self._client.delete, *keys)
+
+    def ttl(self, key):
+        return self._call(self._client.ttl, key)
+
+    def scan_iter(self, match="*", count=None):
+        return self._call(self._client.scan_iter, match=match, count=count)
+
+    def eval(self, script, numkeys, *keys_and_args):
+        return self._call(self._client.eval, script, numkeys, *keys_and_args)
+
+    def publish(self, channel, message):
+        return self._call(self._client.publish, channel, message)
+
+    def pubsub(self, ignore_subscribe_messages=False):
+        return self._call(self._client.pubsub, ignore_subscribe_messages=ignore_subscribe_messages)
+
+    def pipeline(self, transaction: bool = False):
+        # Queuing commands does no I/O; only execute() is guarded.
+        return _GuardedPipeline(self._client.pipeline(transaction=transaction), self)
+
+
+class _GuardedPipeline:
+    def __init__(self, pipe, guard: GuardedRedis):
+        self._pipe = pipe
+        self._guard = guard
+
+    def __getattr__(self, name):
+        return getattr(self._pipe, name)
+
+    def execute(self):
+        return self._guard._call(self._pipe.execute)
+
+
+def _connect():
+    pool = redis.BlockingConnectionPool.from_url(
+        CACHE_URL,
+        max_connections=REDIS_MAX_CONNECTIONS,
+        timeout=REDIS_POOL_TIMEOUT,
+        socket_timeout=REDIS_SOCKET_TIMEOUT,
+        socket_connect_timeout=REDIS_CONNECT_TIMEOUT,
+        health_check_interval=30,
+        decode_responses=True,
+    )
+    return redis.Redis(connection_pool=pool)
+
+
+redis_breaker = CircuitBreaker(
+    "redis", failure_threshold=REDIS_BREAKER_FAILURES, reset_timeout=REDIS_BREAKER_RESET
+)
+
+# Named for Redis, but may be the SQLite backend (tools.cache_backends):
+# both speak the same subset of the redis-py API.
+if urlsplit(CACHE_URL).scheme == "sqlite":
+    redis_client = SQLiteBackend(sqlite_path(CACHE_URL), max_entries=CACHE_SQLITE_MAX_ENTRIES)
+else:
+    redis_client = GuardedRedis(_connect(), redis_breaker)
+
+_local = TTLCache(maxsize=CACHE_LOCAL_SIZE, ttl=CACHE_LOCAL_TTL)
+
+# Identifies this process's own invalidation messages.
+_instance_id = uuid.uuid4().hex
+
+
+# Bumped when canonical forms change: v2 keys stripped descriptive words
+# ("Group", "Technologies") and could mix up different companies.
+CACHE_KEY_VERSION = "v3"
+_VERSIONED_KEY = re.compile(r"^lookup:v\d+:")
 
 
 def build_cache_key(company: str, role: str) -> str:
+    """
+    Canonical key: equivalent spellings of a company ("Meta", "Meta
+    Platforms, Inc.") and role ("CEO", "Chief Executive Officer") share it.
+    """
+    return f"lookup:{CACHE_KEY_VERSION}:{normalize_company(company)}:{canonical_role(role)}"
+
+
+def build_legacy_cache_key(company: str, role: str) -> str:
     return f"lookup:{company.lower()}:{role.lower()}"
 
 
+def _read_with_legacy(company: str, role: str, key: str):
+    """
+    Read the canonical key and the pre-canonical one in a single round
+    trip; a legacy-only hit is copied to ``key`` with its remaining TTL.
+    """
+    legacy_key = build_legacy_cache_key(company, role)
+    data, legacy = redis_client.mget([key, legacy_key])
+    if data or not legacy:
+        return data
+
+    ttl = redis_client.ttl(legacy_key)
+    if ttl and ttl > 0:
+        redis_client.setex(key, ttl, legacy)
+    return legacy
+
+
+# -----------------------
+# Cross-worker invalidation
+# -----------------------
+
+_listener: threading.Thread | None = None
+_listener_lock = threading.Lock()
+
+
+def _publish_invalidation(key: str) -> None:
+    try:
+        redis_client.publish(CACHE_INVALIDATION_CHANNEL, json.dumps({"key": key, "from": _instance_id}))
+    except Exception:
+        # Other workers' local copies still expire after CACHE_LOCAL_TTL.
+        return
+
+
+def _listen_for_invalidations() -> None:
+    backoff = 1.0
+    while True:
+        try:
+            pubsub = redis_client.pubsub(ignore_subscribe_messages=True)
+            pubsub.subscribe(CACHE_INVALIDATION_CHANNEL)
+            # A reconnect may have missed messages; start clean.
+            _local.clear()
+            backoff = 1.0
+            while True:
+                # Poll rather than listen(): the short socket timeout would
+                # otherwise break a blocking read on an idle channel.
+                message = pubsub.get_message(timeout=1.0)
+                if message is None:
+                    continue
+                try:
+                    payload = json.loads(message["data"])
+                except (TypeError, ValueError, KeyError):
+                    continue
+                if payload.get("from") != _instance_id:
+                    _local.delete(payload.get("key"))
+        except Exception as exc:  # noqa: B902
+            print(f"Cache invalidation listener error: {exc}")
+        time.sleep(backoff)
+        backoff = min(30.0, backoff * 2)
+
+
+def _ensure_listener() -> None:
+    """
+    Start the invalidation subscriber on first use (one daemon thread per
+    process). Skipped when the local tier is disabled.
+    """
+    global _listener
+    if _listener is not None or CACHE_LOCAL_SIZE <= 0:
+        return
+    with _listener_lock:
+        if _listener is None:
+            _listener = threading.Thread(
+                target=_listen_for_invalidations, name="cache-invalidation", daemon=True
+            )
+            _listener.start()
+
+
+def clear_local_cache() -> None:
+    _local.clear()
+
+
+# -----------------------
+# Lookup cache
+# -----------------------
+
 def get_cached_result(company: str, role: str):
+    """
+    Cached lookup result (marked ``cache: true``) or None. Served from the
+    in-process tier when possible, else from Redis.
+    """
+    _ensure_listener()
     key = build_cache_key(company, role)
+
+    result = _local.get(key)
+    if result is not None:
+        inc("role_scout_cache_local_hits_total")
+        return _served(result)
+
     try:
-        data = redis_client.get(key)
+        with timed("cache_get"):
+            if CACHE_LEGACY_READ:
+                data = _read_with_legacy(company, role, key)
+            else:
+                data = redis_client.get(key)
     except Exception:
         # Fail-soft if Redis is unavailable
         return None
@@ -28,39 +337,301 @@ def get_cached_result(company: str, role: str):
         return None
 
     if isinstance(result, dict):
-        # Mark responses served from cache
-        result["cache"] = True
+        _local.set(key, result)
+        result = _served(result)
+    return result
+
+
+def _served(stored: dict) -> dict:
+    """
+    Copy of a stored result as handed to callers: marked ``cache: true``,
+    plus ``stale: true`` once it is older than the soft TTL.
+    """
+    # Shallow copy: callers add top-level fields (e.g. "report").
+    result = {**stored, "cache": True}
+    cached_at = result.pop("_cached_at", None)
+    if cached_at is not None and time.time() - cached_at > CACHE_SOFT_TTL:
+        inc("role_scout_cache_stale_hits_total")
+        result["stale"] = True
     return result
 
 
-def set_cached_result(company: str, role: str, result: dict, ttl: int = 86400):
+def _decode(data):
+    if not data:
+        return None
+    try:
+        return json.loads(data)
+    except Exception:
+        return None
+
+
+def get_cached_results_many(pairs, negative: bool = False) -> list:
     """
-    Store successful lookup results in Redis.
+    Cached results for many (company, role) pairs, in order (None for a
+    miss), resolved with a single MGET for everything the local tier
+    cannot answer.
+
+    The same MGET also reads the pre-canonical keys (while
+    CACHE_LEGACY_READ is on) and, with ``negative=True``, each pair's
+    negative cache keys, so a row with no cached result can still come
+    back as a cached failure.
+    """
+    _ensure_listener()
+    pairs = list(pairs)
+    keys = [build_cache_key(company, role) for company, role in pairs]
+    results: list = [None] * len(pairs)
+
+    missing = []
+    for i, key in enumerate(keys):
+        stored = _local.get(key)
+        if stored is not None:
+            inc("role_scout_cache_local_hits_total")
+            results[i] = _served(stored)
+        else:
+            missing.append(i)
+    if not missing:
+        return results
+
+    n = len(missing)
+    fetch = [keys[i] for i in missing]
+    if CACHE_LEGACY_READ:
+        fetch += [build_legacy_cache_key(*pairs[i]) for i in missing]
+    if negative:
+        for i in missing:
+            fetch += _negative_keys(*pairs[i])
+    try:
+        with timed("cache_get"):
+            values = redis_client.mget(fetch)
+    except Exception:
+        # Fail-soft if Redis is unavailable
+        return results
+
+    legacy = values[n:2 * n] if CACHE_LEGACY_READ else [None] * n
+    negatives = values[2 * n if CACHE_LEGACY_READ else n:]
+    per_pair = len(NEGATIVE_CACHE_TTLS)
+    copy_forward = []
+
+    for j, i in enumerate(missing):
+        data = values[j]
+        if not data and legacy[j]:
+            data = legacy[j]
+            copy_forward.append((keys[i], fetch[n + j], data))
+        result = _decode(data)
+        if isinstance(result, dict):
+            _local.set(keys[i], result)
+            results[i] = _served(result)
+        elif negative:
+            results[i] = _negative_hit(negatives[j * per_pair:(j + 1) * per_pair])
+
+    if copy_forward:
+        _copy_legacy(copy_forward)
+    return results
+
 
-    - Skips caching error payloads.
-    - Strips any existing 'cache' flag; that field is added dynamically
-      when reading from the cache.
-    - ttl default = 24 hours.
+def _copy_legacy(entries) -> None:
+    """
+    Copy (key, legacy_key, data) hits to their canonical keys, keeping the
+    legacy keys' remaining TTLs; two pipelined round trips in all.
+    """
+    try:
+        pipe = redis_client.pipeline()
+        for _, legacy_key, _ in entries:
+            pipe.ttl(legacy_key)
+        ttls = pipe.execute()
+
+        pipe = redis_client.pipeline()
+        for (key, _, data), ttl in zip(entries, ttls):
+            if ttl and ttl > 0:
+                pipe.setex(key, ttl, data)
+        pipe.execute()
+    except Exception:
+        return
+
+
+def set_cached_result(company: str, role: str, result: dict, ttl: int | None = None):
+    """
+    Store successful lookup results in Redis (and this process's local
+    tier), and tell other workers to drop their local copies.
+
+    - Skips timed-out partial results; error payloads go to the negative
+      cache instead (see set_negative_result).
+    - Strips any existing 'cache'/'stale' flags; those are added
+      dynamically when reading from the cache.
+    - Stamps the write time for the soft TTL (CACHE_SOFT_TTL); ``ttl`` is
+      the hard TTL and defaults to CACHE_HARD_TTL.
     """
     if not isinstance(result, dict):
         return
 
-    # Do not cache error responses
+    # Never cache partial results cut short by a deadline
+    if result.get("timed_out"):
+        return
+
+    # Errors only go to the short-lived negative cache, if their class has one
     if result.get("error"):
+        set_negative_result(company, role, result)
         return
 
-    # Only cache when we actually have a resolved person
+    # Only cache when we actually have a resolved person; unresolved
+    # results count as "no result" failures
     first = result.get("first_name")
     last = result.get("last_name")
     if not first or not last:
+        set_negative_result(company, role, result)
         return
 
     key = build_cache_key(company, role)
     to_store = dict(result)
     to_store.pop("cache", None)
+    to_store.pop("stale", None)
+    to_store["_cached_at"] = time.time()
+    _local.set(key, to_store)
     try:
-        redis_client.setex(key, ttl, json.dumps(to_store))
+        with timed("cache_set"):
+            redis_client.setex(key, ttl or CACHE_HARD_TTL, json.dumps(to_store))
+            # A success supersedes any cached failure for this lookup.
+            redis_client.delete(*_negative_keys(company, role))
     except Exception:
         # Ignore cache write failures so lookups still succeed
         return
+    _publish_invalidation(key)
+
+
+def invalidate_cached_result(company: str, role: str) -> None:
+    """
+    Drop a cached result everywhere: Redis, this process and (via pub/sub)
+    every other worker's local tier.
+    """
+    key = build_cache_key(company, role)
+    _local.delete(key)
+    try:
+        redis_client.delete(key, *_negative_keys(company, role))
+    except Exception:
+        return
+    _publish_invalidation(key)
+
+
+def claim_refresh(company: str, role: str) -> bool:
+    """
+    Claim the right to refresh a stale entry, so at most one worker
+    re-runs it at a time. True if Redis is unreachable (refresh locally).
+    """
+    try:
+        return bool(redis_client.set(
+            f"refresh:{build_cache_key(company, role)}", _instance_id,
+            nx=True, ex=CACHE_REFRESH_LOCK_TTL,
+        ))
+    except Exception:
+        return True
+
+
+def release_refresh(company: str, role: str) -> None:
+    try:
+        redis_client.delete(f"refresh:{build_cache_key(company, role)}")
+    except Exception:
+        return
+
+
+# -----------------------
+# Negative cache
+# -----------------------
+
+def classify_error(result: dict):
+    """
+    Negative cache class of a failed result ("no_result", "parse_failure",
+    "rate_limit"), or None for errors that must not be cached. A result
+    without an error but also without a resolved name is "no_result".
+    """
+    if result.get("error"):
+        return _ERROR_CLASSES.get(result["error"])
+    if not result.get("first_name") or not result.get("last_name"):
+        return "no_result"
+    return None
+
+
+def build_negative_cache_key(company: str, role: str, error_class: str) -> str:
+    return f"negative:{error_class}:{build_cache_key(company, role)}"
+
+
+def _negative_keys(company: str, role: str) -> list[str]:
+    return [build_negative_cache_key(company, role, c) for c in NEGATIVE_CACHE_TTLS]
+
+
+def set_negative_result(company: str, role: str, result: dict) -> None:
+    """
+    Store a failed lookup under its error class's key with that class's TTL.
+    """
+    error_class = classify_error(result)
+    ttl = NEGATIVE_CACHE_TTLS.get(error_class, 0)
+    if ttl <= 0:
+        return
+
+    to_store = dict(result)
+    to_store.pop("cache", None)
+    try:
+        with timed("cache_set"):
+            redis_client.setex(
+                build_negative_cache_key(company, role, error_class), ttl, json.dumps(to_store)
+            )
+    except Exception:
+        return
+
+
+def get_negative_result(company: str, role: str):
+    """
+    A recently cached failure for this lookup (marked ``cache: true`` and
+    ``negative_cache: <class>``), or None.
+    """
+    keys = _negative_keys(company, role)
+    try:
+        with timed("cache_get"):
+            values = redis_client.mget(keys)
+    except Exception:
+        return None
+    return _negative_hit(values)
+
+
+def _negative_hit(values):
+    """
+    First decodable entry among one pair's negative keys (MGET values in
+    NEGATIVE_CACHE_TTLS order), marked as served from the negative cache.
+    """
+    for error_class, data in zip(NEGATIVE_CACHE_TTLS, values):
+        result = _decode(data)
+        if isinstance(result, dict):
+            inc("role_scout_negative_cache_hits_total", error_class=error_class)
+            return {**result, "cache": True, "negative_cache": error_class}
+    return None
+
+
+def migrate_legacy_keys(batch: int = 500) -> int:
+    """
+    Copy every pre-canonical ``lookup:{company}:{role}`` key to its
+    canonical key (keeping its TTL) and delete it. Returns keys migrated.
+    """
+    migrated = 0
+    for legacy_key in redis_client.scan_iter(match="lookup:*", count=batch):
+        if _VERSIONED_KEY.match(legacy_key):
+            continue
+        company, sep, role = legacy_key[len("lookup:"):].rpartition(":")
+        if not sep:
+            continue
+        data = redis_client.get(legacy_key)
+        if not data:
+            continue
+        ttl = redis_client.ttl(legacy_key)
+        key = build_cache_key(company, role)
+        if ttl and ttl > 0:
+            redis_client.setex(key, ttl, data)
+        else:
+            redis_client.set(key, data)
+        redis_client.delete(legacy_key)
+        migrated += 1
+    return migrated
+
 
+if __name__ == "__main__":
+    if sys.argv[1:] != ["migrate"]:
+        print("Usage: python -m tools.cache migrate")
+        sys.exit(2)
+    print(f"Migrated {migrate_legacy_keys()} cache keys")
@@ -0,0 +1,319 @@
+"""
+Where the shared cache lives.
+
+``tools.cache`` (and the single-flight lock, search cache and domain index
+through it) talks to one client object with the subset of the redis-py API
+described by ``CacheBackend``. The backend is chosen by the scheme of
+``CACHE_URL`` (default: ``REDIS_URL``):
+
+- ``redis://`` / ``rediss://`` / ``unix://`` – Redis, shared by every worker.
+- ``sqlite:///path/to/cache.db`` – an on-disk SQLite file (WAL mode), for a
+  laptop, CI or a single node without Redis. Entries expire by TTL and the
+  file is bounded to ``max_entries`` rows; the entries closest to expiry
+  are evicted first.
+
+The SQLite backend has no pub/sub: ``publish`` is a no-op and ``pubsub``
+never delivers, so workers sharing one file only see each other's writes
+once their in-process tier expires (``CACHE_LOCAL_TTL``). Its ``eval``
+runs the one script the app uses, single-flight's compare-and-delete.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from urllib.parse import urlsplit
+
+# Writes between sweeps of expired rows and over-size eviction.
+_PRUNE_EVERY = 256
+
+# Stay under SQLite's bound-parameter limit in IN (...) queries.
+_CHUNK = 500
+
+_CACHE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cache (
+    key        TEXT PRIMARY KEY,
+    value      TEXT NOT NULL,
+    expires_at REAL
+);
+CREATE INDEX IF NOT EXISTS cache_expires ON cache (expires_at);
+"""
+
+_LIVE = "(expires_at IS NULL OR expires_at > ?)"
+
+
+class CacheBackend(ABC):
+    """
+    Interface: the redis-py calls the app makes, with ``decode_responses``
+    semantics (str values).
+    """
+
+    name = "base"
+
+    @abstractmethod
+    def get(self, key): ...
+
+    @abstractmethod
+    def mget(self, keys): ...
+
+    @abstractmethod
+    def set(self, key, value, nx=False, ex=None): ...
+
+    @abstractmethod
+    def setex(self, key, ttl, value): ...
+
+    @abstractmethod
+    def exists(self, *keys): ...
+
+    @abstractmethod
+    def delete(self, *keys): ...
+
+    @abstractmethod
+    def ttl(self, key): ...
+
+    @abstractmethod
+    def scan_iter(self, match="*", count=None): ...
+
+    @abstractmethod
+    def eval(self, script, numkeys, *keys_and_args): ...
+
+    @abstractmethod
+    def publish(self, channel, message): ...
+
+    @abstractmethod
+    def pubsub(self, ignore_subscribe_messages=False): ...
+
+    @abstractmethod
+    def pipeline(self, transaction=False):
+        """Object queuing the same calls, run together by ``execute()``."""
+
+
+class _NullPubSub:
+    def subscribe(self, *channels):
+        return None
+
+    def get_message(self, timeout=0.0):
+        time.sleep(timeout)
+        return None
+
+
+class SQLitePipeline:
+    """
+    Queues commands and runs them in one SQLite transaction on execute().
+    """
+
+    def __init__(self, backend: "SQLiteBackend"):
+        self._backend = backend
+        self._commands = []
+
+    def __getattr__(self, name):
+        method = getattr(self._backend, name)
+
+        def queue_command(*args, **kwargs):
+            self._commands.append((method, args, kwargs))
+            return self
+
+        return queue_command
+
+    def execute(self):
+        commands, self._commands = self._commands, []
+        with self._backend._transaction():
+            return [method(*args, **kwargs) for method, args, kwargs in commands]
+
+
+class SQLiteBackend(CacheBackend):
+    name = "sqlite"
+
+    def __init__(self, path: str, max_entries: int = 100000):
+        self.path = path
+        self.max_entries = max_entries
+        self._local = threading.local()
+        self._schema_lock = threading.Lock()
+        self._schema_ready = False
+        self._writes = 0
+        self._writes_lock = threading.Lock()
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA synchronous=NORMAL")
+            if not self._schema_ready:
+                with self._schema_lock:
+                    if not self._schema_ready:
+                        conn.execute("PRAGMA journal_mode=WAL")
+                        conn.executescript(_CACHE_SCHEMA)
+                        self._schema_ready = True
+            self._local.conn = conn
+            self._local.depth = 0
+        return conn
+
+    @contextmanager
+    def _transaction(self):
+        """
+        BEGIN IMMEDIATE ... COMMIT on this thread's connection; nested uses
+        join the outer transaction.
+        """
+        conn = self._conn()
+        self._local.depth += 1
+        if self._local.depth == 1:
+            conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            self._local.depth -= 1
+            if self._local.depth == 0:
+                conn.execute("ROLLBACK")
+            raise
+        self._local.depth -= 1
+        if self._local.depth == 0:
+            conn.execute("COMMIT")
+
+    def _wrote(self) -> None:
+        # Prune every _PRUNE_EVERY writes, outside any open transaction.
+        with self._writes_lock:
+            self._writes += 1
+            if self._writes < _PRUNE_EVERY or self._local.depth:
+                return
+            self._writes = 0
+        self.prune()
+
+    def prune(self) -> int:
+        """
+        Drop expired rows, then the rows closest to expiry (permanent ones
+        last) beyond ``max_entries``. Returns rows removed.
+        """
+        with self._transaction() as conn:
+            removed = conn.execute(
+                "DELETE FROM cache WHERE expires_at IS NOT NULL AND expires_at <= ?",
+                (time.time(),),
+            ).rowcount
+            excess = conn.execute("SELECT COUNT(*) FROM cache").fetchone()[0] - self.max_entries
+            if self.max_entries > 0 and excess > 0:
+                removed += conn.execute(
+                    "DELETE FROM cache WHERE key IN (SELECT key FROM cache "
+                    "ORDER BY expires_at IS NULL, expires_at LIMIT ?)",
+                    (excess,),
+                ).rowcount
+        return removed
+
+    # -----------------------
+    # Reads
+    # -----------------------
+
+    def get(self, key):
+        row = self._conn().execute(
+            f"SELECT value FROM cache WHERE key = ? AND {_LIVE}", (key, time.time())
+        ).fetchone()
+        return row[0] if row else None
+
+    def mget(self, keys):
+        keys = list(keys)
+        found = {}
+        now = time.time()
+        conn = self._conn()
+        for start in range(0, len(keys), _CHUNK):
+            chunk = keys[start:start + _CHUNK]
+            marks = ",".join("?" * len(chunk))
+            found.update(conn.execute(
+                f"SELECT key, value FROM cache WHERE key IN ({marks}) AND {_LIVE}",
+                (*chunk, now),
+            ).fetchall())
+        return [found.get(key) for key in keys]
+
+    def exists(self, *keys):
+        return sum(1 for value in self.mget(keys) if value is not None)
+
+    def ttl(self, key):
+        row = self._conn().execute(
+            f"SELECT expires_at FROM cache WHERE key = ? AND {_LIVE}", (key, time.time())
+        ).fetchone()
+        if row is None:
+            return -2
+        if row[0] is None:
+            return -1
+        return max(0, int(row[0] - time.time()))
+
+    def scan_iter(self, match="*", count=None):
+        # Redis glob patterns are (near enough) SQLite GLOB patterns.
+        rows = self._conn().execute(
+            f"SELECT key FROM cache WHERE key GLOB ? AND {_LIVE}", (match, time.time())
+        ).fetchall()
+        return iter([row[0] for row in rows])
+
+    # -----------------------
+    # Writes
+    # -----------------------
+
+    def set(self, key, value, nx=False, ex=None):
+        now = time.time()
+        expires = now + ex if ex else None
+        if nx:
+            # Insert, or take over the key only if the existing row expired.
+            written = self._conn().execute(
+                "INSERT INTO cache (key, value, expires_at) VALUES (?, ?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET value = excluded.value, "
+                "expires_at = excluded.expires_at "
+                "WHERE cache.expires_at IS NOT NULL AND cache.expires_at <= ?",
+                (key, value, expires, now),
+            ).rowcount
+            if not written:
+                return None
+        else:
+            self._conn().execute(
+                "INSERT OR REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, value, expires),
+            )
+        self._wrote()
+        return True
+
+    def setex(self, key, ttl, value):
+        return self.set(key, value, ex=ttl)
+
+    def delete(self, *keys):
+        if not keys:
+            return 0
+        marks = ",".join("?" * len(keys))
+        return self._conn().execute(f"DELETE FROM cache WHERE key IN ({marks})", keys).rowcount
+
+    def eval(self, script, numkeys, key, token):
+        # Only single-flight's compare-and-delete release is supported.
+        return self._conn().execute(
+            f"DELETE FROM cache WHERE key = ? AND value = ? AND {_LIVE}",
+            (key, token, time.time()),
+        ).rowcount
+
+    def pipeline(self, transaction=False):
+        return SQLitePipeline(self)
+
+    # -----------------------
+    # Pub/sub (not supported)
+    # -----------------------
+
+    def publish(self, channel, message):
+        return 0
+
+    def pubsub(self, ignore_subscribe_messages=False):
+        return _NullPubSub()
+
+
+def sqlite_path(url: str) -> str:
+    """
+    File path of a ``sqlite:///relative.db`` or ``sqlite:////abs/path.db``
+    URL. Raises ValueError for any other scheme or form.
+    """
+    parts = urlsplit(url)
+    if parts.scheme != "sqlite":
+        raise ValueError(f"Not a sqlite:// cache URL: {url!r}")
+    if not url.startswith("sqlite:///") or parts.netloc or parts.query or parts.fragment:
+        raise ValueError(
+            f"Unsupported sqlite cache URL {url!r}; use sqlite:///relative.db "
+            "or sqlite:////absolute/path.db"
+        )
+    path = parts.path[1:]
+    if not path or path.endswith("/"):
+        raise ValueError(f"sqlite cache URL {url!r} has no file path")
+    return path
@@ -0,0 +1,74 @@
+"""
+Canonical forms of company names and roles, so equivalent lookups share
+cache keys and index entries:
+
+- "Meta", "Meta Platforms" and "The Meta Platforms, Inc." -> "meta"
+- "CEO", "ceo " and "Chief Executive Officer" -> "chief executive officer"
+- "CEO & Founder" and "Founder, CEO" -> "chief executive officer & founder"
+"""
+
+from __future__ import annotations
+
+import re
+import unicodedata
+from functools import lru_cache
+
+from tools.alias import C_LEVEL_MAP, expand_c_level, split_compound_title
+
+# Trailing legal forms, which do not change which company is meant.
+# Descriptive words ("Group", "Technologies", "Enterprises") are kept: they
+# often tell sister companies apart ("Tata Group" vs "Tata Technologies").
+_COMPANY_SUFFIXES = {
+    "inc", "incorporated", "corp", "corporation", "co", "company", "ltd",
+    "limited", "llc", "llp", "plc", "lp", "sa", "ag", "nv", "bv", "gmbh",
+    "pte", "pty", "pvt", "private", "srl", "spa", "ab", "as", "oy", "kk",
+}
+
+# Names (after suffix stripping) that are known to mean the same company.
+_COMPANY_ALIASES = {
+    "meta platforms": "meta",
+}
+_NON_WORD = re.compile(r"[\W_]+")
+
+# Separators that join the parts of a compound title ("CEO & Founder").
+_COMPOUND_SEPARATOR = re.compile(r"\s*[&,]\s*")
+
+
+@lru_cache(maxsize=4096)
+def normalize_company(name: str) -> str:
+    """
+    Canonical form of a company name: NFKC-normalised, case-folded words
+    (any script), leading "the" and trailing legal-form suffixes dropped,
+    then known aliases resolved.
+    Example: "The Meta Platforms, Inc." -> "meta platforms" -> "meta".
+    A name with no word characters at all is kept as given, stripped.
+    """
+    folded = unicodedata.normalize("NFKC", name or "").casefold()
+    words = _NON_WORD.sub(" ", folded).split()
+    if not words:
+        return (name or "").strip()
+    if len(words) > 1 and words[0] == "the":
+        words = words[1:]
+    while len(words) > 1 and words[-1] in _COMPANY_SUFFIXES:
+        words.pop()
+    name = " ".join(words)
+    return _COMPANY_ALIASES.get(name, name)
+
+
+def _canonical_part(part: str) -> str:
+    if part in C_LEVEL_MAP:
+        # expand_c_level returns [abbreviation, full title] for a bare abbreviation.
+        return expand_c_level(part)[1]
+    return " ".join(C_LEVEL_MAP.get(word, word) for word in part.split())
+
+
+@lru_cache(maxsize=4096)
+def canonical_role(role: str) -> str:
+    """
+    Canonical form of a designation: C-level abbreviations spelled out and
+    the parts of a compound title de-duplicated and sorted.
+    """
+    # split_compound_title splits on " and " / "/", but normalising first
+    # turns "&" and "," into spaces, so make them explicit " and "s.
+    parts = split_compound_title(_COMPOUND_SEPARATOR.sub(" and ", role or ""))
+    return " & ".join(sorted({_canonical_part(p) for p in parts}))
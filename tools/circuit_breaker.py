@@ -0,0 +1,98 @@
+"""
+Minimal thread-safe circuit breaker.
+
+- closed: calls go through; consecutive failures are counted.
+- open: after ``failure_threshold`` consecutive failures, calls are refused
+  immediately for ``reset_timeout`` seconds.
+- half-open: once the cool-down is over a single trial call is let through;
+  success closes the breaker, failure opens it again.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+
+from tools.metrics import inc, set_gauge
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling a dependency whose breaker is open."""
+
+
+class CircuitBreaker:
+    def __init__(self, name: str, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.name = name
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+        set_gauge("role_scout_circuit_open", 0, breaker=name)
+
+    def allow(self) -> bool:
+        """True if a call may go ahead now."""
+        with self._lock:
+            if self._state == CLOSED:
+                return True
+            if self._state == OPEN:
+                if time.monotonic() - self._opened_at < self.reset_timeout:
+                    return False
+                self._state = HALF_OPEN
+                self._trial_in_flight = False
+            # Half-open: exactly one trial call at a time.
+            if self._trial_in_flight:
+                return False
+            self._trial_in_flight = True
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self._state != CLOSED:
+                set_gauge("role_scout_circuit_open", 0, breaker=self.name)
+            self._state = CLOSED
+            self._failures = 0
+            self._trial_in_flight = False
+
+    def record_ignored(self) -> None:
+        """
+        The call failed for a reason that says nothing about the dependency
+        (e.g. no free local connection): leave the state as it is, but let
+        another half-open trial through.
+        """
+        with self._lock:
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            self._trial_in_flight = False
+            if self._state == HALF_OPEN or (
+                self._state == CLOSED and self._failures >= self.failure_threshold
+            ):
+                self._state = OPEN
+                self._opened_at = time.monotonic()
+                inc("role_scout_circuit_opens_total", breaker=self.name)
+                set_gauge("role_scout_circuit_open", 1, breaker=self.name)
+
+    def state(self) -> dict:
+        """Snapshot for monitoring."""
+        with self._lock:
+            retry_in = 0.0
+            if self._state == OPEN:
+                retry_in = max(0.0, self.reset_timeout - (time.monotonic() - self._opened_at))
+            return {
+                "name": self.name,
+                "state": self._state,
+                "consecutive_failures": self._failures,
+                "failure_threshold": self.failure_threshold,
+                "reset_timeout": self.reset_timeout,
+                "retry_in": round(retry_in, 3),
+            }
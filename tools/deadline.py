@@ -0,0 +1,110 @@
+"""
+Per-lookup time budget with cooperative cancellation.
+
+``deadline_scope(seconds)`` sets an absolute deadline for the current
+context. Stages check ``remaining()`` / ``expired()`` and give up early
+instead of blocking a worker: searches return nothing, domain discovery is
+skipped, and crew runs are abandoned via ``run_with_deadline``.
+
+The deadline lives in a ContextVar, so it follows the lookup into threads
+started with ``run_with_deadline`` and never leaks between lookups.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import threading
+import time
+from contextlib import contextmanager
+
+_deadline: contextvars.ContextVar = contextvars.ContextVar("lookup_deadline", default=None)
+
+
+class DeadlineExceeded(Exception):
+    """Raised when a stage cannot finish within the lookup's time budget."""
+
+
+@contextmanager
+def deadline_scope(seconds: float | None):
+    """
+    Limit the enclosed work to ``seconds`` (None = no limit). A nested scope
+    can only shorten an outer deadline, never extend it.
+    """
+    if not seconds:
+        yield
+        return
+
+    new_deadline = time.monotonic() + seconds
+    current = _deadline.get()
+    if current is not None:
+        new_deadline = min(new_deadline, current)
+
+    token = _deadline.set(new_deadline)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def remaining() -> float | None:
+    """Seconds left in the budget, or None when there is no deadline."""
+    current = _deadline.get()
+    if current is None:
+        return None
+    return max(0.0, current - time.monotonic())
+
+
+def expired() -> bool:
+    left = remaining()
+    return left is not None and left <= 0
+
+
+def check() -> None:
+    if expired():
+        raise DeadlineExceeded("Lookup time budget exhausted")
+
+
+def bounded_timeout(default: float) -> float:
+    """
+    ``default`` capped by the remaining budget, for client timeouts.
+    """
+    left = remaining()
+    if left is None:
+        return default
+    return max(0.1, min(default, left))
+
+
+def run_with_deadline(fn):
+    """
+    Run ``fn`` and return its result, or raise DeadlineExceeded once the
+    budget runs out.
+
+    Without a deadline ``fn`` simply runs inline. With one, it runs on a
+    daemon thread (carrying the current context) and is abandoned on
+    timeout; because the deadline travels with it, its remaining searches
+    short-circuit and it winds down on its own.
+    """
+    left = remaining()
+    if left is None:
+        return fn()
+    if left <= 0:
+        raise DeadlineExceeded("Lookup time budget exhausted")
+
+    ctx = contextvars.copy_context()
+    outcome: dict = {}
+    done = threading.Event()
+
+    def target():
+        try:
+            outcome["result"] = ctx.run(fn)
+        except BaseException as exc:  # noqa: B902
+            outcome["error"] = exc
+        finally:
+            done.set()
+
+    threading.Thread(target=target, name="deadline-worker", daemon=True).start()
+    if not done.wait(left):
+        raise DeadlineExceeded("Lookup time budget exhausted")
+    if "error" in outcome:
+        raise outcome["error"]
+    return outcome["result"]
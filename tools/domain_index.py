@@ -0,0 +1,195 @@
+"""
+Persistent company -> official root domain index used by scoring.
+
+Discovering a company's domain costs a web search, but the answer hardly
+ever changes, so it is stored once and reused:
+
+- Entries are keyed by the normalised company name
+  (tools.canonical.normalize_company), so "Meta", "Meta Platforms" and
+  "Meta Platforms, Inc." share one entry.
+- Discovered entries expire after ``DOMAIN_INDEX_TTL`` seconds (default 30
+  days); seeded entries never expire.
+- The store is Redis (default) or a local JSON file, chosen with
+  ``DOMAIN_INDEX_BACKEND=redis|file``. Both sit behind a small in-process
+  memo, so repeat lookups take microseconds.
+
+A seed list (CSV ``company,domain`` or JSON ``{company: domain}``) can be
+loaded with ``python -m tools.domain_index seed <file>``, or automatically on
+first use via ``DOMAIN_SEED_PATH``.
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+import os
+import sys
+import threading
+import time
+
+from tools import cache
+from tools.canonical import normalize_company
+from tools.ttl_cache import TTLCache
+
+DOMAIN_INDEX_BACKEND = os.getenv("DOMAIN_INDEX_BACKEND", "redis")
+DOMAIN_INDEX_PATH = os.getenv("DOMAIN_INDEX_PATH", "role_scout_domains.json")
+DOMAIN_INDEX_TTL = int(os.getenv("DOMAIN_INDEX_TTL", str(30 * 86400)))
+DOMAIN_SEED_PATH = os.getenv("DOMAIN_SEED_PATH", "")
+
+# -----------------------
+# Stores
+# -----------------------
+
+class RedisDomainStore:
+    def _key(self, company: str) -> str:
+        return f"domain:{company}"
+
+    def get(self, company: str):
+        try:
+            return cache.redis_client.get(self._key(company))
+        except Exception:
+            # Fail-soft if Redis is unavailable
+            return None
+
+    def set(self, company: str, domain: str, ttl: int | None) -> None:
+        try:
+            if ttl:
+                cache.redis_client.setex(self._key(company), ttl, domain)
+            else:
+                cache.redis_client.set(self._key(company), domain)
+        except Exception:
+            return
+
+
+class FileDomainStore:
+    """
+    Whole index in one JSON file ({company: [domain, expires_at|null]}),
+    rewritten atomically on every change.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._entries: dict | None = None
+
+    def _load(self) -> dict:
+        if self._entries is None:
+            try:
+                with open(self.path, encoding="utf-8") as f:
+                    self._entries = json.load(f)
+            except (OSError, ValueError):
+                self._entries = {}
+        return self._entries
+
+    def get(self, company: str):
+        with self._lock:
+            item = self._load().get(company)
+        if not item:
+            return None
+        domain, expires = item
+        if expires is not None and expires <= time.time():
+            return None
+        return domain
+
+    def set(self, company: str, domain: str, ttl: int | None) -> None:
+        with self._lock:
+            entries = self._load()
+            entries[company] = [domain, time.time() + ttl if ttl else None]
+            tmp = f"{self.path}.tmp"
+            try:
+                with open(tmp, "w", encoding="utf-8") as f:
+                    json.dump(entries, f)
+                os.replace(tmp, self.path)
+            except OSError as exc:
+                print(f"Domain index write failed: {exc}")
+
+
+def _build_store():
+    if DOMAIN_INDEX_BACKEND == "file":
+        return FileDomainStore(DOMAIN_INDEX_PATH)
+    return RedisDomainStore()
+
+
+_store = _build_store()
+_memo = TTLCache(maxsize=4096, ttl=3600)
+_seeded = False
+_seed_lock = threading.Lock()
+
+
+# -----------------------
+# Index API
+# -----------------------
+
+def _ensure_seeded() -> None:
+    global _seeded
+    if _seeded:
+        return
+    with _seed_lock:
+        if not _seeded:
+            _seeded = True
+            if DOMAIN_SEED_PATH:
+                try:
+                    load_seed(DOMAIN_SEED_PATH)
+                except (OSError, ValueError) as exc:
+                    print(f"Domain seed load failed: {exc}")
+
+
+def get_domain(company_name: str):
+    """
+    Indexed official root domain for ``company_name``, or None.
+    """
+    _ensure_seeded()
+    company = normalize_company(company_name)
+    if not company:
+        return None
+
+    domain = _memo.get(company)
+    if domain is not None:
+        return domain
+
+    domain = _store.get(company)
+    if domain:
+        _memo.set(company, domain)
+    return domain
+
+
+def set_domain(company_name: str, domain: str, ttl: int | None = DOMAIN_INDEX_TTL) -> None:
+    """
+    Record ``domain`` for ``company_name`` (ttl=None: never expires).
+    """
+    company = normalize_company(company_name)
+    if not company or not domain:
+        return
+    _store.set(company, domain.lower(), ttl)
+    _memo.set(company, domain.lower())
+
+
+def load_seed(path: str) -> int:
+    """
+    Bulk-load permanent entries from a CSV (company,domain) or JSON
+    ({company: domain}) file. Returns the number of entries loaded.
+    """
+    if path.endswith(".json"):
+        with open(path, encoding="utf-8") as f:
+            pairs = list(json.load(f).items())
+    else:
+        with open(path, encoding="utf-8", newline="") as f:
+            pairs = [
+                (row[0], row[1]) for row in csv.reader(f)
+                if len(row) >= 2 and row[0].strip() and row[0].strip().lower() != "company"
+            ]
+
+    for company, domain in pairs:
+        set_domain(company.strip(), domain.strip(), ttl=None)
+    return len(pairs)
+
+
+def clear_memo() -> None:
+    _memo.clear()
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3 or sys.argv[1] != "seed":
+        print("Usage: python -m tools.domain_index seed <domains.csv|domains.json>")
+        sys.exit(2)
+    print(f"Loaded {load_seed(sys.argv[2])} domains")
@@ -0,0 +1,260 @@
+"""
+Persistent background jobs for CSV batch lookups.
+
+Jobs and their rows live in a local SQLite database, so progress survives
+restarts:
+
+- ``submit_job`` stores every (title, company) row as "pending".
+- Workers claim small chunks of rows, run them through
+  ``tools.lookup.run_lookup_many`` and save each row's result as soon as it
+  finishes.
+- A claimed row carries a lease; if its worker crashes or restarts, the
+  row is picked up again once the lease expires. Finished rows are never
+  re-run.
+
+Run a standalone worker with ``python -m tools.jobs``; the Flask app also
+starts one in-process.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+
+from tools.lookup import batch_max_workers, run_lookup_many
+
+JOBS_DB_PATH = os.getenv("JOBS_DB_PATH", "role_scout_jobs.db")
+
+# Rows claimed per worker round; one round runs concurrently.
+CLAIM_SIZE = int(os.getenv("JOBS_CLAIM_SIZE", str(batch_max_workers * 2)))
+
+# Seconds before a claimed-but-unfinished row is considered abandoned.
+ROW_LEASE_SECONDS = int(os.getenv("JOBS_ROW_LEASE_SECONDS", "600"))
+
+# Seconds an idle worker sleeps before checking for new rows.
+POLL_INTERVAL = float(os.getenv("JOBS_POLL_INTERVAL", "1.0"))
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    total INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS job_rows (
+    job_id TEXT NOT NULL,
+    idx INTEGER NOT NULL,
+    title TEXT NOT NULL,
+    company TEXT NOT NULL,
+    status TEXT NOT NULL,
+    claimed_at REAL,
+    result TEXT,
+    PRIMARY KEY (job_id, idx)
+);
+CREATE INDEX IF NOT EXISTS job_rows_status ON job_rows (status, claimed_at);
+"""
+
+_schema_ready = False
+_schema_lock = threading.Lock()
+
+
+def _connect() -> sqlite3.Connection:
+    global _schema_ready
+    conn = sqlite3.connect(JOBS_DB_PATH, timeout=30, isolation_level=None)
+    conn.row_factory = sqlite3.Row
+    if not _schema_ready:
+        with _schema_lock:
+            if not _schema_ready:
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.executescript(_SCHEMA)
+                _schema_ready = True
+    return conn
+
+
+# -----------------------
+# Job API
+# -----------------------
+
+def submit_job(rows) -> str:
+    """
+    Store a batch of (title, company) rows and return its job id.
+    """
+    rows = list(rows)
+    job_id = uuid.uuid4().hex
+    now = time.time()
+
+    conn = _connect()
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        conn.execute(
+            "INSERT INTO jobs (id, status, total, created_at, updated_at) VALUES (?, ?, ?, ?, ?)",
+            (job_id, "queued" if rows else "done", len(rows), now, now),
+        )
+        conn.executemany(
+            "INSERT INTO job_rows (job_id, idx, title, company, status) VALUES (?, ?, ?, ?, 'pending')",
+            [(job_id, idx, title, company) for idx, (title, company) in enumerate(rows)],
+        )
+        conn.execute("COMMIT")
+    finally:
+        conn.close()
+    return job_id
+
+
+def get_job(job_id: str, include_rows: bool = True):
+    """
+    Return job status, progress counts and (optionally) per-row results,
+    or None if the job does not exist.
+    """
+    conn = _connect()
+    try:
+        job = conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        if job is None:
+            return None
+
+        counts = {
+            r["status"]: r["n"]
+            for r in conn.execute(
+                "SELECT status, COUNT(*) AS n FROM job_rows WHERE job_id = ? GROUP BY status",
+                (job_id,),
+            )
+        }
+        output = {
+            "job_id": job["id"],
+            "status": job["status"],
+            "total": job["total"],
+            "done": counts.get("done", 0),
+            "pending": counts.get("pending", 0) + counts.get("running", 0),
+            "created_at": job["created_at"],
+            "updated_at": job["updated_at"],
+        }
+
+        if include_rows:
+            output["rows"] = [
+                {
+                    "title": r["title"],
+                    "company_name": r["company"],
+                    "status": r["status"],
+                    "result": json.loads(r["result"]) if r["result"] else None,
+                }
+                for r in conn.execute(
+                    "SELECT * FROM job_rows WHERE job_id = ? ORDER BY idx", (job_id,)
+                )
+            ]
+        return output
+    finally:
+        conn.close()
+
+
+# -----------------------
+# Worker
+# -----------------------
+
+def claim_rows(limit: int = CLAIM_SIZE) -> list[sqlite3.Row]:
+    """
+    Atomically claim up to ``limit`` pending rows (or rows whose lease has
+    expired) for this worker.
+    """
+    now = time.time()
+    conn = _connect()
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        rows = conn.execute(
+            "SELECT job_id, idx, title, company FROM job_rows "
+            "WHERE status = 'pending' OR (status = 'running' AND claimed_at < ?) "
+            "ORDER BY rowid LIMIT ?",
+            (now - ROW_LEASE_SECONDS, limit),
+        ).fetchall()
+        conn.executemany(
+            "UPDATE job_rows SET status = 'running', claimed_at = ? WHERE job_id = ? AND idx = ?",
+            [(now, r["job_id"], r["idx"]) for r in rows],
+        )
+        conn.executemany(
+            "UPDATE jobs SET status = 'running', updated_at = ? WHERE id = ? AND status = 'queued'",
+            [(now, job_id) for job_id in {r["job_id"] for r in rows}],
+        )
+        conn.execute("COMMIT")
+        return rows
+    finally:
+        conn.close()
+
+
+def save_row_result(job_id: str, idx: int, result: dict) -> None:
+    """
+    Persist one finished row and mark its job done when no rows remain.
+    """
+    now = time.time()
+    conn = _connect()
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        conn.execute(
+            "UPDATE job_rows SET status = 'done', result = ? WHERE job_id = ? AND idx = ?",
+            (json.dumps(result), job_id, idx),
+        )
+        remaining = conn.execute(
+            "SELECT COUNT(*) FROM job_rows WHERE job_id = ? AND status != 'done'",
+            (job_id,),
+        ).fetchone()[0]
+        conn.execute(
+            "UPDATE jobs SET status = ?, updated_at = ? WHERE id = ?",
+            ("done" if remaining == 0 else "running", now, job_id),
+        )
+        conn.execute("COMMIT")
+    finally:
+        conn.close()
+
+
+def process_once(limit: int = CLAIM_SIZE) -> int:
+    """
+    Claim one chunk of rows, run them concurrently and save each result as
+    it finishes. Returns the number of rows processed.
+    """
+    rows = claim_rows(limit)
+    if not rows:
+        return 0
+
+    def on_result(i, result):
+        save_row_result(rows[i]["job_id"], rows[i]["idx"], result)
+
+    run_lookup_many([(r["company"], r["title"]) for r in rows], on_result=on_result)
+    return len(rows)
+
+
+def run_worker(stop_event: threading.Event | None = None) -> None:
+    """
+    Process job rows until ``stop_event`` is set.
+    """
+    stop_event = stop_event or threading.Event()
+    while not stop_event.is_set():
+        try:
+            processed = process_once()
+        except Exception as exc:  # noqa: B902
+            # Keep the worker alive; unfinished rows are retried after their lease.
+            print(f"Job worker error: {exc}")
+            processed = 0
+        if not processed:
+            stop_event.wait(POLL_INTERVAL)
+
+
+_worker_thread: threading.Thread | None = None
+_worker_lock = threading.Lock()
+
+
+def start_worker() -> None:
+    """
+    Start one in-process background worker thread (idempotent).
+    """
+    global _worker_thread
+    with _worker_lock:
+        if _worker_thread is not None and _worker_thread.is_alive():
+            return
+        _worker_thread = threading.Thread(target=run_worker, name="job-worker", daemon=True)
+        _worker_thread.start()
+
+
+if __name__ == "__main__":
+    run_worker()
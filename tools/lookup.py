@@ -9,15 +9,34 @@ NOTE:
   and cache behavior are preserved as-is.
 """
 
+import copy
 import json
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from crewai import Crew, Task
 
-from agents.researcher import create_researcher
-from agents.validator import create_validator, extract_urls
-from tools.cache import get_cached_result, set_cached_result
+from agents.pool import agent_pool
+from agents.validator import extract_urls
+from tools.deadline import DeadlineExceeded, deadline_scope, remaining, run_with_deadline
+from tools.cache import (
+    CACHE_REFRESH_LOCK_TTL,
+    build_cache_key,
+    claim_refresh,
+    get_cached_result,
+    get_cached_results_many,
+    get_negative_result,
+    release_refresh,
+    set_cached_result,
+)
+from tools.metrics import inc, timed
+from tools.singleflight import coalesce
+from tools.ttl_cache import TTLCache
 from tools.alias import title_matches
 from tools.scoring import calculate_confidence
+from tools.search_tool import format_results, search_many, search_session
 
 
 def build_error_output(message, company, designation, attempts, confidence=0.0):
@@ -45,6 +64,59 @@ def generate_query_variations(company, designation):
     ]
 
 
+def generate_retry_queries(company, designation, attempt, names=()):
+    """
+    Extra queries for retry attempts, stricter as attempts go on. Queries
+    already run in the lookup are filtered out by the caller.
+    """
+    if attempt == 1:
+        queries = [
+            f"{company} {designation} Wikipedia",
+            f"{company} leadership team {designation}",
+        ]
+    else:
+        queries = [f"{company} official website leadership"]
+
+    for name in names:
+        queries.append(f'"{name}" {company} {designation}')
+    return queries
+
+
+class LookupEvidence:
+    """
+    Search results, candidate names and URLs gathered during one lookup.
+
+    ``searches`` is filled by tools.search_tool.search_session, so every
+    search made by the fast path or an agent is recorded once and reused.
+    """
+
+    def __init__(self):
+        self.searches: dict[str, list[dict]] = {}
+        self.names: list[str] = []
+        self.urls: list[str] = []
+        # Latest complete attempt output, returned if the deadline cuts us short.
+        self.best_output: dict | None = None
+        self.attempts = 0
+        self.timed_out = False
+
+    def add_name(self, name):
+        name = (name or "").strip()
+        if name and name not in self.names:
+            self.names.append(name)
+
+    def add_urls(self, urls):
+        for url in urls:
+            if url and url not in self.urls:
+                self.urls.append(url)
+
+    def format_searches(self) -> str:
+        blocks = []
+        for query, results in self.searches.items():
+            if results:
+                blocks.append(f"Query: {query}\n{format_results(results)}")
+        return "\n".join(blocks)
+
+
 # -----------------------
 # Config
 # -----------------------
@@ -52,117 +124,556 @@ def generate_query_variations(company, designation):
 max_retries = 2
 threshold = 0.7
 
+# Upper bound on concurrent lookups for run_lookup_many. Each lookup is
+# network- and LLM-bound, so threads spend nearly all their time waiting.
+batch_max_workers = int(os.getenv("LOOKUP_MAX_WORKERS", "8"))
+
+# Default time budget per lookup in seconds (0 = unlimited).
+default_deadline = float(os.getenv("LOOKUP_DEADLINE_SECONDS", "180")) or None
+
+# Don't start another crew attempt with less budget than this left.
+min_attempt_seconds = float(os.getenv("LOOKUP_MIN_ATTEMPT_SECONDS", "15"))
+
+# Try to answer from search snippets alone before starting the crew.
+fast_path_enabled = os.getenv("LOOKUP_FAST_PATH", "1").lower() not in ("0", "false", "no")
+
+# Background refreshes of stale cache entries allowed at once per process.
+refresh_max_workers = int(os.getenv("CACHE_REFRESH_WORKERS", "2"))
+
+
+# -----------------------
+# Fast Path (no LLM)
+# -----------------------
+
+# A capitalised word ("Satya", "O'Neil", "Smith-Jones") or an initial ("J.").
+_NAME_TOKEN = r"(?:[A-Z][a-z][\w'’-]*|[A-Z]\.)"
+_NAME_RUN_RE = re.compile(rf"\b{_NAME_TOKEN}(?:\s+{_NAME_TOKEN})*")
+
+# Capitalised words that commonly sit next to a name but are never part of it.
+_NAME_STOPWORDS = {
+    "about", "according", "announced", "appointed", "board", "ceo", "chair",
+    "chairman", "chief", "co", "co-founder", "company", "corporate", "current",
+    "director", "executive", "financial", "founder", "global", "group",
+    "head", "inc", "information", "leadership", "linkedin", "ltd", "managing",
+    "marketing", "meet", "mr", "mrs", "ms", "dr", "new", "news", "officer",
+    "official", "operating", "our", "partner", "president", "profile",
+    "senior", "team", "technology", "the", "vice", "website", "wikipedia",
+    "january", "february", "march", "april", "may", "june", "july", "august",
+    "september", "october", "november", "december",
+}
+
+# How many characters either side of a name are checked for the title.
+_TITLE_WINDOW = 80
+
+
+def _candidate_names(text: str, extra_stopwords: set[str]):
+    """
+    Yield (name, start, end) for 2-3 word capitalised runs that look like a
+    person's name once title words and company words are stripped out.
+    """
+    for match in _NAME_RUN_RE.finditer(text):
+        tokens = []
+        offset = match.start()
+        for token_match in re.finditer(r"\S+", match.group(0)):
+            tokens.append((token_match.group(0), offset + token_match.start(), offset + token_match.end()))
+
+        # Split the run on stopwords and keep clean 2-3 word chunks.
+        chunk: list[tuple[str, int, int]] = []
+        for token in tokens + [None]:
+            word = token[0].lower() if token else None
+            if token and word not in _NAME_STOPWORDS and word not in extra_stopwords:
+                chunk.append(token)
+                continue
+            if 2 <= len(chunk) <= 3 and not chunk[0][0].endswith("."):
+                yield " ".join(t[0] for t in chunk), chunk[0][1], chunk[-1][2]
+            chunk = []
+
+
+def _fast_path(company: str, designation: str):
+    """
+    Answer from DuckDuckGo snippets alone, without an LLM crew run.
+
+    Runs the usual query variations in parallel, collects names that appear
+    right next to the requested title, and accepts the leading candidate only
+    if it is seen on at least two URLs and its confidence clears the
+    threshold. Returns None to fall through to the crew.
+    """
+    company_words = {w for w in re.split(r"\W+", company.lower()) if w}
+    support: dict[str, list[str]] = {}
+    evidence: dict[str, list[str]] = {}
+
+    try:
+        result_lists = search_many(generate_query_variations(company, designation), max_results=5)
+    except Exception:
+        # Rate limits or network errors: leave it to the crew.
+        return None
+
+    for results in result_lists:
+        for r in results:
+            url = r.get("href")
+            if not url:
+                continue
+            text = f"{r.get('title', '')}. {r.get('body', '')}"
+            for name, start, end in _candidate_names(text, company_words):
+                window = text[max(0, start - _TITLE_WINDOW):end + _TITLE_WINDOW]
+                # Strict: the title itself or an alias, not just "Chief".
+                if not title_matches(designation, window, strict=True):
+                    continue
+                urls = support.setdefault(name, [])
+                if url not in urls:
+                    urls.append(url)
+                    evidence.setdefault(name, []).append(text)
+
+    if not support:
+        return None
+
+    ranked = sorted(support.items(), key=lambda item: len(item[1]), reverse=True)
+    name, urls = ranked[0]
+    if len(urls) < 2:
+        return None
+    # Ambiguous: two different names are equally well supported.
+    if len(ranked) > 1 and len(ranked[1][1]) == len(urls):
+        return None
+
+    evidence_text = " ".join(evidence[name])
+    confidence = calculate_confidence(
+        urls=urls,
+        company_name=company,
+        title_match=True,
+        company_match=company.lower() in evidence_text.lower(),
+    )
+
+    print("\n=== FAST PATH ===\n")
+    print("Candidate Name:", name)
+    print("Supporting URLs:", urls)
+    print("Confidence Score:", confidence)
+
+    if confidence < threshold:
+        return None
+
+    parts = name.split()
+    return {
+        "first_name": parts[0],
+        "last_name": parts[-1],
+        "company": company,
+        "current_title": designation,
+        "primary_source": urls[0],
+        "confidence_score": confidence,
+        "validation_sources": urls,
+        "attempts": 0,
+        "answered_by": "fast_path",
+    }
+
+
+def _emit(on_event, stage: str, **data):
+    """
+    Report pipeline progress to an optional listener. Listener errors are
+    ignored so progress reporting can never break a lookup.
+    """
+    if on_event is None:
+        return
+    try:
+        on_event(stage, data)
+    except Exception:
+        pass
+
+
+def _cached(company: str, designation: str, force: bool = False):
+    """
+    Cached result, else a recently cached failure unless ``force``.
+    """
+    cached = get_cached_result(company, designation)
+    if cached or force:
+        return cached
+    return get_negative_result(company, designation)
+
 
-def run_lookup(company: str, role: str) -> dict:
+def run_lookup(
+    company: str,
+    role: str,
+    on_event=None,
+    deadline: float | None = None,
+    force: bool = False,
+) -> dict:
     """
     Execute the full lookup pipeline for a given company and role.
+
+    Recent failures (no result, unparseable output, rate limits) are served
+    from the negative cache for a short while; ``force=True`` ignores them
+    and runs the lookup again.
+
+    ``deadline`` is a time budget in seconds (default: LOOKUP_DEADLINE_SECONDS).
+    Searches, domain discovery and crew runs stop once it is spent, and the
+    best result so far is returned with ``timed_out: true``.
+
+    ``on_event(stage, data)`` is called as stages complete: "cache",
+    "fast_path", "attempt", "research", "validation" and "confidence".
     """
     designation = role  # Preserve original variable name used throughout the logic.
 
     # -----------------------
     # Cache Check
     # -----------------------
-    cached = get_cached_result(company, designation)
+    cached = _cached(company, designation, force)
+    _emit(
+        on_event,
+        "cache",
+        hit=bool(cached),
+        negative=bool(cached and cached.get("negative_cache")),
+        stale=bool(cached and cached.get("stale")),
+    )
+    inc("role_scout_cache_hits_total" if cached else "role_scout_cache_misses_total")
+    if cached and cached.get("stale"):
+        # Serve the stale copy now; refresh it in the background.
+        schedule_refresh(company, designation)
     if cached:
         # Preserve original CLI logging behavior.
         print("\n=== FINAL STRUCTURED OUTPUT ===\n")
         print(json.dumps(cached, indent=4))
         return cached
 
-    researcher = create_researcher()
-    validator = create_validator()
+    return _lookup_uncached(company, designation, on_event, deadline, force)
+
+
+def _lookup_uncached(
+    company: str,
+    designation: str,
+    on_event=None,
+    deadline: float | None = None,
+    force: bool = False,
+) -> dict:
+    """
+    run_lookup after a cache miss: join or lead the single-flight for the
+    key and run the pipeline.
+    """
+    # -----------------------
+    # Single-flight
+    # -----------------------
+    # Identical lookups already in flight (in this process or another worker)
+    # share one crew run instead of each starting their own.
+    try:
+        with deadline_scope(deadline if deadline is not None else default_deadline):
+            return coalesce(
+                build_cache_key(company, designation),
+                lambda: _run_pipeline(company, designation, on_event),
+                lambda: _cached(company, designation, force),
+            )
+    except DeadlineExceeded:
+        # Ran out of budget while waiting on another worker's identical lookup.
+        inc("role_scout_deadline_exceeded_total")
+        output = build_error_output("Lookup timed out", company, designation, 0)
+        output["timed_out"] = True
+        return output
+
+
+# -----------------------
+# Stale-while-revalidate
+# -----------------------
+
+_refreshing: set = set()
+_refreshing_lock = threading.Lock()
+_refresh_slots = threading.BoundedSemaphore(max(1, refresh_max_workers))
+
+# Keys whose last refresh failed. They are not retried from this process
+# until CACHE_REFRESH_LOCK_TTL has passed; other workers are held off by
+# the Redis claim, which a failed refresh keeps until it expires.
+_failed_refreshes = TTLCache(maxsize=4096, ttl=CACHE_REFRESH_LOCK_TTL)
+
+
+def schedule_refresh(company: str, designation: str) -> bool:
+    """
+    Re-run a lookup whose cached result is stale on a background thread,
+    at most once per key (across workers, via a Redis claim) and at most
+    once per CACHE_REFRESH_LOCK_TTL after a failure. Returns True if a
+    refresh was started.
+    """
+    key = build_cache_key(company, designation)
+    with _refreshing_lock:
+        if key in _refreshing or _failed_refreshes.get(key):
+            return False
+        if not _refresh_slots.acquire(blocking=False):
+            # Busy; a later stale hit will try again.
+            return False
+        _refreshing.add(key)
+
+    if not claim_refresh(company, designation):
+        _finish_refresh(key)
+        return False
+
+    threading.Thread(
+        target=_refresh,
+        args=(company, designation, key),
+        name="cache-refresh",
+        daemon=True,
+    ).start()
+    return True
+
+
+def _finish_refresh(key: str) -> None:
+    with _refreshing_lock:
+        _refreshing.discard(key)
+    _refresh_slots.release()
+
+
+def _refresh(company: str, designation: str, key: str) -> None:
+    outcome = "error"
+    try:
+        with deadline_scope(default_deadline):
+            # Caches the new result itself; a failure leaves the stale copy in place.
+            result = _run_pipeline(company, designation)
+        if not result.get("error") and result.get("first_name"):
+            outcome = "ok"
+    except Exception as exc:  # noqa: B902
+        print(f"Cache refresh failed for {key}: {exc}")
+    finally:
+        if outcome == "ok":
+            release_refresh(company, designation)
+        else:
+            # Keep the claim until it expires so stale hits on a key that
+            # keeps failing do not start a crew run each time.
+            _failed_refreshes.set(key, True)
+        _finish_refresh(key)
+    inc("role_scout_cache_refreshes_total", outcome=outcome)
+
+
+def _run_pipeline(company: str, designation: str, on_event=None) -> dict:
+    """
+    Run the CrewAI retry loop for a cache miss and persist the result.
+    """
+    evidence = LookupEvidence()
+    final_output = None
+
+    # Every search in this lookup is recorded once and reused by later stages.
+    with timed("pipeline"), search_session(evidence.searches):
+        if fast_path_enabled:
+            with timed("fast_path"):
+                final_output = _fast_path(company, designation)
+            _emit(on_event, "fast_path", answered=final_output is not None)
+
+        if final_output is None:
+            try:
+                # Lease a warm researcher/validator pair instead of rebuilding agents
+                # and LLM clients for every lookup.
+                with agent_pool.lease() as (researcher, validator):
+                    final_output = _run_attempts(
+                        company, designation, researcher, validator, evidence, on_event
+                    )
+            except DeadlineExceeded:
+                # The abandoned crew thread still holds the leased agents, so
+                # the lease does not return them to the pool.
+                evidence.timed_out = True
+                final_output = evidence.best_output or build_error_output(
+                    "Lookup timed out",
+                    company,
+                    designation,
+                    evidence.attempts,
+                )
+
+    if evidence.timed_out:
+        final_output["timed_out"] = True
+        inc("role_scout_deadline_exceeded_total")
+
+    # Mark non-cached responses explicitly
+    if isinstance(final_output, dict) and "cache" not in final_output:
+        final_output["cache"] = False
+
+    # Persist successful responses to cache
+    set_cached_result(company, designation, final_output)
 
+    inc(
+        "role_scout_lookups_total",
+        answered_by=final_output.get("answered_by") or ("error" if final_output.get("error") else "crew"),
+    )
+
+    print("\n=== FINAL STRUCTURED OUTPUT ===\n")
+    print(json.dumps(final_output, indent=4))
+
+    return final_output
+
+
+def _run_attempts(
+    company: str,
+    designation: str,
+    researcher,
+    validator,
+    evidence: LookupEvidence,
+    on_event=None,
+) -> dict:
+    """
+    Retry loop with increasingly strict prompts.
+
+    The first attempt runs research + validation. Once a candidate name is
+    known, retries re-run only validation against the evidence gathered so
+    far, plus any new queries that have not been searched yet.
+    """
     final_output = None
+    research_text = ""
+
+    # Queries are fixed for the lookup; retries only add new ones.
+    query_variations = generate_query_variations(company, designation)
 
     # -----------------------
     # Retry Loop
     # -----------------------
 
     for attempt in range(max_retries + 1):
-        print(f"\n===== ATTEMPT {attempt + 1} =====\n")
+        # Not enough budget left for another crew run: keep what we have.
+        left = remaining()
+        if left is not None and left < min_attempt_seconds:
+            print("\nTime budget too low for another attempt. Stopping retries.")
+            evidence.timed_out = True
+            break
 
-        # Generate query variations
-        query_variations = generate_query_variations(company, designation)
+        print(f"\n===== ATTEMPT {attempt + 1} =====\n")
+        evidence.attempts = attempt + 1
+        _emit(on_event, "attempt", attempt=attempt + 1)
+        if attempt > 0:
+            inc("role_scout_retries_total")
 
-        # -----------------------
-        # Task 1: Research
-        # -----------------------
+        # Queries nobody has run yet in this lookup (fast path, earlier attempts).
+        if attempt == 0:
+            new_queries = [q for q in query_variations if q not in evidence.searches]
+        else:
+            new_queries = [
+                q for q in generate_retry_queries(company, designation, attempt, evidence.names)
+                if q not in evidence.searches
+            ]
 
         if attempt == 0:
-            research_description = (
-                f"Find the full name of the current {designation} of {company}. "
+            strictness = (
                 "Use the DuckDuckGo search tool if necessary and focus on authoritative sources "
                 "such as the company's official website, LinkedIn, or reputable news outlets. "
-                "Return only the person's full name and one best source URL.\n\n"
             )
-
         elif attempt == 1:
-            research_description = (
-                f"Find the full name of the current {designation} of {company}. "
+            strictness = (
                 "Prioritize the company's official website, Wikipedia, or major business news outlets. "
                 "Avoid unofficial blogs or speculative content. "
-                "Return only the most reliable source.\n\n"
             )
-
         else:
-            research_description = (
-                f"Find the full name of the current {designation} of {company}. "
+            strictness = (
                 "Strictly verify using official company domain or Wikipedia. "
-                "If confidence is low, indicate uncertainty.\n\n"
+                "If confidence is low, indicate uncertainty. "
             )
 
-        # Append query variations WITHOUT changing your original text
-        research_description += (
-            "Try the following search queries one by one using ONLY the 'duck_duck_go_search' tool:\n"
-        )
+        # -----------------------
+        # Task 1: Research
+        # -----------------------
+        # Only needed until a candidate name exists; later attempts re-run
+        # validation against the evidence already gathered.
+
+        tasks = []
+        agents = [validator]
+
+        if not evidence.names:
+            if attempt == 0:
+                research_description = (
+                    f"Find the full name of the current {designation} of {company}. "
+                    + strictness
+                    + "Return only the person's full name and one best source URL.\n\n"
+                )
+            else:
+                research_description = (
+                    f"Find the full name of the current {designation} of {company}. "
+                    + strictness
+                    + "Return only the most reliable source.\n\n"
+                )
 
-        for i, query in enumerate(query_variations, 1):
-            research_description += f"{i}. {query}\n"
+            prior_results = evidence.format_searches()
+            if prior_results:
+                research_description += (
+                    "Search results already gathered for this lookup "
+                    "(do not repeat these searches):\n" + prior_results + "\n"
+                )
 
-        research_task = Task(
-            description=research_description,
-            expected_output="Person's full name and one best source URL.",
-            agent=researcher,
-            verbose=False,
-            allow_delegation=False,
-        )
+            if new_queries:
+                research_description += (
+                    "Run the following search queries together in ONE call to the "
+                    "'DuckDuckGo Multi Search' tool (pass them as a list):\n"
+                )
+                for i, query in enumerate(new_queries, 1):
+                    research_description += f"{i}. {query}\n"
+
+            tasks.append(
+                Task(
+                    description=research_description,
+                    expected_output="Person's full name and one best source URL.",
+                    agent=researcher,
+                    verbose=False,
+                    allow_delegation=False,
+                )
+            )
+            agents.insert(0, researcher)
 
         # -----------------------
         # Task 2: Validation
         # -----------------------
 
-        validation_task = Task(
-            description=(
-                f"Validate the discovered name for the {designation} of {company}. "
-                "Search again using the name, company, and role. "
-                "Confirm the name appears in at least 2 credible sources.\n\n"
-                "Return STRICT JSON in the following format:\n"
-                "{\n"
-                '  "validated": true or false,\n'
-                '  "full_name": "Exact confirmed full name",\n'
-                '  "confirming_urls": ["url1", "url2"],\n'
-                '  "reasoning": "Short explanation"\n'
-                "}\n\n"
-                "Do not include any text outside the JSON."
-            ),
-            expected_output="Strict JSON validation result.",
-            agent=validator,
-            verbose=False,
-            allow_delegation=False,
+        validation_description = (
+            f"Validate the discovered name for the {designation} of {company}. "
+        )
+        if evidence.names:
+            validation_description += (
+                "Candidate names from earlier attempts: " + ", ".join(evidence.names) + ". "
+                + strictness
+                + "Use the evidence below first; only search again if it is not enough.\n\n"
+                "Earlier research notes:\n" + (research_text or "None") + "\n\n"
+                "Known source URLs:\n" + "\n".join(evidence.urls) + "\n\n"
+            )
+            prior_results = evidence.format_searches()
+            if prior_results:
+                validation_description += (
+                    "Search results already gathered (do not repeat these searches):\n"
+                    + prior_results + "\n"
+                )
+            if new_queries:
+                validation_description += (
+                    "New search queries you may run (in one 'DuckDuckGo Multi Search' call):\n"
+                )
+                for i, query in enumerate(new_queries, 1):
+                    validation_description += f"{i}. {query}\n"
+            validation_description += "\n"
+        else:
+            validation_description += "Search again using the name, company, and role. "
+
+        validation_description += (
+            "Confirm the name appears in at least 2 credible sources.\n\n"
+            "Return STRICT JSON in the following format:\n"
+            "{\n"
+            '  "validated": true or false,\n'
+            '  "full_name": "Exact confirmed full name",\n'
+            '  "confirming_urls": ["url1", "url2"],\n'
+            '  "reasoning": "Short explanation"\n'
+            "}\n\n"
+            "Do not include any text outside the JSON."
+        )
+
+        tasks.append(
+            Task(
+                description=validation_description,
+                expected_output="Strict JSON validation result.",
+                agent=validator,
+                verbose=False,
+                allow_delegation=False,
+            )
         )
 
         crew = Crew(
-            agents=[researcher, validator],
-            tasks=[research_task, validation_task],
+            agents=agents,
+            tasks=tasks,
             verbose=False,
         )
 
         try:
-            crew_output = crew.kickoff()
+            with timed("crew_kickoff"):
+                # Abandoned (DeadlineExceeded) if the lookup's budget runs out.
+                crew_output = run_with_deadline(crew.kickoff)
+        except DeadlineExceeded:
+            raise
         except Exception as e:
             error_message = str(e)
 
             if "ratelimit" in error_message.lower() or "429" in error_message:
+                inc("role_scout_rate_limit_errors_total", source="llm")
                 final_output = build_error_output(
                     "LLM rate limit reached",
                     company,
@@ -185,8 +696,10 @@ def run_lookup(company: str, role: str) -> dict:
                 )
             break
 
-        research_text = crew_output.tasks_output[0].raw
-        validation_text = crew_output.tasks_output[1].raw
+        if len(tasks) == 2:
+            research_text = crew_output.tasks_output[0].raw
+            _emit(on_event, "research", attempt=attempt + 1, research=research_text)
+        validation_text = crew_output.tasks_output[-1].raw
 
         print("\n=== RESEARCH OUTPUT ===\n", research_text)
         print("\n=== VALIDATION OUTPUT ===\n", validation_text)
@@ -198,6 +711,7 @@ def run_lookup(company: str, role: str) -> dict:
         try:
             validation_json = json.loads(validation_text)
         except Exception:
+            inc("role_scout_parse_failures_total")
             final_output = build_error_output(
                 "Validation output parsing failed",
                 company,
@@ -210,6 +724,15 @@ def run_lookup(company: str, role: str) -> dict:
         name = validation_json.get("full_name")
         urls = validation_json.get("confirming_urls", [])
 
+        _emit(
+            on_event,
+            "validation",
+            attempt=attempt + 1,
+            validated=validated,
+            full_name=name,
+            confirming_urls=urls,
+        )
+
         first_name = None
         last_name = None
 
@@ -225,6 +748,10 @@ def run_lookup(company: str, role: str) -> dict:
         if research_urls:
             primary_source = research_urls[0]
 
+        # Carry this attempt's findings forward so retries only re-validate.
+        evidence.add_name(name)
+        evidence.add_urls(research_urls + list(urls or []))
+
         # -----------------------
         # Dynamic Matching
         # -----------------------
@@ -246,6 +773,7 @@ def run_lookup(company: str, role: str) -> dict:
         print("\nExtracted Name:", name)
         print("Extracted URLs:", urls)
         print("Confidence Score:", confidence)
+        _emit(on_event, "confidence", attempt=attempt + 1, confidence_score=confidence)
 
         final_output = {
             "first_name": first_name,
@@ -256,7 +784,9 @@ def run_lookup(company: str, role: str) -> dict:
             "confidence_score": confidence,
             "validation_sources": urls,
             "attempts": attempt + 1,
+            "answered_by": "crew",
         }
+        evidence.best_output = final_output
 
         # -----------------------
         # Stop if confidence good
@@ -277,7 +807,15 @@ def run_lookup(company: str, role: str) -> dict:
     # Graceful No Result Handling
     # -----------------------
 
-    if not final_output:
+    if not final_output and evidence.timed_out:
+        final_output = build_error_output(
+            "Lookup timed out",
+            company,
+            designation,
+            evidence.attempts,
+            0,
+        )
+    elif not final_output:
         final_output = build_error_output(
             "No reliable result found",
             company,
@@ -286,15 +824,86 @@ def run_lookup(company: str, role: str) -> dict:
             0,
         )
 
-    # Mark non-cached responses explicitly
-    if isinstance(final_output, dict) and "cache" not in final_output:
-        final_output["cache"] = False
+    return final_output
 
-    # Persist successful responses to cache
-    set_cached_result(company, designation, final_output)
 
-    print("\n=== FINAL STRUCTURED OUTPUT ===\n")
-    print(json.dumps(final_output, indent=4))
-
-    return final_output
+# -----------------------
+# Batch Lookups
+# -----------------------
 
+def _run_lookup_safe(company: str, role: str, deadline: float | None = None) -> dict:
+    """
+    Run a single lookup already known to miss the cache, turning unexpected
+    exceptions into an error payload so one bad row cannot fail a whole
+    batch.
+    """
+    try:
+        return _lookup_uncached(company, role, deadline=deadline)
+    except Exception as exc:  # noqa: B902
+        output = build_error_output("Lookup failed", company, role, 0)
+        output["detail"] = str(exc)
+        return output
+
+
+def run_lookup_many(
+    pairs,
+    max_workers: int | None = None,
+    on_result=None,
+    deadline: float | None = None,
+) -> list[dict]:
+    """
+    Execute lookups for many (company, role) pairs concurrently.
+
+    Every row already in the cache (or negatively cached) is resolved up
+    front with one bulk cache read; only the misses run, without reading
+    the cache again, on a bounded thread pool, so a batch takes roughly as
+    long as its slowest rows rather than the sum of all of them. Results
+    are returned in the same order as ``pairs``. ``on_result(index,
+    result)`` is called as each row finishes, e.g. to persist progress.
+    ``deadline`` is the per-row time budget passed to run_lookup.
+    """
+    pairs = list(pairs)
+    if not pairs:
+        return []
+
+    results: list[dict] = get_cached_results_many(pairs, negative=True)
+    misses = []
+    for idx, cached in enumerate(results):
+        if cached is None:
+            inc("role_scout_cache_misses_total")
+            misses.append(idx)
+            continue
+        inc("role_scout_cache_hits_total")
+        if cached.get("stale"):
+            schedule_refresh(*pairs[idx])
+        if on_result is not None:
+            on_result(idx, cached)
+    if not misses:
+        return results
+
+    # Rows sharing a cache key run once. Misses skip the cache re-read, so
+    # single-flight alone would not catch a duplicate whose twin has
+    # already finished.
+    groups: dict[str, list[int]] = {}
+    for idx in misses:
+        groups.setdefault(build_cache_key(*pairs[idx]), []).append(idx)
+
+    # Results are still written per row by _run_pipeline, not in bulk
+    # (no set_cached_results_many): other workers waiting on the same
+    # lookup poll the cache and must see each result as soon as it exists.
+    workers = max_workers or batch_max_workers
+    workers = max(1, min(workers, len(groups)))
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="lookup") as pool:
+        futures = {
+            pool.submit(_run_lookup_safe, *pairs[rows[0]], deadline): rows
+            for rows in groups.values()
+        }
+        for future in as_completed(futures):
+            result = future.result()
+            for n, idx in enumerate(futures[future]):
+                # Callers decorate results (e.g. with a report); never share one dict.
+                results[idx] = result if n == 0 else copy.deepcopy(result)
+                if on_result is not None:
+                    on_result(idx, results[idx])
+        return results
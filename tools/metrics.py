@@ -0,0 +1,157 @@
+"""
+In-process latency histograms and counters, rendered in Prometheus text format.
+
+- ``timed(stage)`` wraps a pipeline stage and records its duration in
+  ``role_scout_stage_seconds{stage="..."}``.
+- ``inc(name, **labels)`` bumps a counter; ``set_gauge`` sets a gauge.
+- ``render()`` produces the body served at ``/metrics``.
+
+Metrics are per process; with several workers, scrape each one.
+"""
+
+from __future__ import annotations
+
+import bisect
+import threading
+import time
+from contextlib import contextmanager
+
+# Seconds. Covers Redis round trips (ms) up to full crew runs (minutes).
+BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300)
+
+# name -> (type, help)
+METRICS = {
+    "role_scout_stage_seconds": ("histogram", "Time spent in each lookup stage."),
+    "role_scout_lookups_total": ("counter", "Lookups finished, by answering path."),
+    "role_scout_cache_hits_total": ("counter", "Lookup cache hits."),
+    "role_scout_cache_misses_total": ("counter", "Lookup cache misses."),
+    "role_scout_cache_local_hits_total": ("counter", "Lookup cache reads served by the in-process tier."),
+    "role_scout_cache_stale_hits_total": ("counter", "Cache hits past their soft TTL (served stale while refreshing)."),
+    "role_scout_cache_refreshes_total": ("counter", "Background refreshes of stale cache entries, by outcome."),
+    "role_scout_negative_cache_hits_total": ("counter", "Lookups answered by a cached failure, by error class."),
+    "role_scout_retries_total": ("counter", "Retry attempts started after the first attempt."),
+    "role_scout_rate_limit_errors_total": ("counter", "Rate-limit errors, by source."),
+    "role_scout_parse_failures_total": ("counter", "Lookups ended by unparseable validation JSON."),
+    "role_scout_deadline_exceeded_total": ("counter", "Lookups cut short by their time budget."),
+    "role_scout_circuit_open": ("gauge", "1 while a dependency's circuit breaker is open, by breaker."),
+    "role_scout_circuit_opens_total": ("counter", "Times a circuit breaker opened, by breaker."),
+    "role_scout_search_cache_total": ("counter", "Search query cache lookups, by result (hit_memory, hit_redis, miss)."),
+}
+
+
+class _Histogram:
+    def __init__(self):
+        self.buckets = [0] * len(BUCKETS)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        idx = bisect.bisect_left(BUCKETS, value)
+        if idx < len(self.buckets):
+            self.buckets[idx] += 1
+        self.count += 1
+        self.sum += value
+
+
+_lock = threading.Lock()
+_counters: dict[tuple[str, tuple], float] = {}
+_gauges: dict[tuple[str, tuple], float] = {}
+_histograms: dict[tuple[str, tuple], _Histogram] = {}
+
+
+def _label_key(labels: dict) -> tuple:
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def inc(name: str, amount: float = 1, **labels) -> None:
+    key = (name, _label_key(labels))
+    with _lock:
+        _counters[key] = _counters.get(key, 0) + amount
+
+
+def set_gauge(name: str, value: float, **labels) -> None:
+    key = (name, _label_key(labels))
+    with _lock:
+        _gauges[key] = value
+
+
+def observe(name: str, value: float, **labels) -> None:
+    key = (name, _label_key(labels))
+    with _lock:
+        hist = _histograms.get(key)
+        if hist is None:
+            hist = _histograms[key] = _Histogram()
+        hist.observe(value)
+
+
+@contextmanager
+def timed(stage: str):
+    """
+    Record how long the wrapped block takes, including when it raises.
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        observe("role_scout_stage_seconds", time.perf_counter() - start, stage=stage)
+
+
+def reset() -> None:
+    with _lock:
+        _counters.clear()
+        _gauges.clear()
+        _histograms.clear()
+
+
+# -----------------------
+# Prometheus exposition
+# -----------------------
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: tuple, extra: tuple = ()) -> str:
+    pairs = list(labels) + list(extra)
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in pairs) + "}"
+
+
+def _format_value(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+def render() -> str:
+    with _lock:
+        counters = dict(_counters)
+        gauges = dict(_gauges)
+        histograms = {
+            key: (list(h.buckets), h.count, h.sum) for key, h in _histograms.items()
+        }
+
+    lines = []
+    for name, (kind, help_text) in METRICS.items():
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {kind}")
+
+        if kind in ("counter", "gauge"):
+            values = counters if kind == "counter" else gauges
+            for (metric, labels), value in sorted(values.items()):
+                if metric == name:
+                    lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+            continue
+
+        for (metric, labels), (buckets, count, total) in sorted(histograms.items()):
+            if metric != name:
+                continue
+            cumulative = 0
+            for bound, n in zip(BUCKETS, buckets):
+                cumulative += n
+                le = _format_labels(labels, (("le", _format_value(bound)),))
+                lines.append(f"{name}_bucket{le} {cumulative}")
+            lines.append(f"{name}_bucket{_format_labels(labels, (('le', '+Inf'),))} {count}")
+            lines.append(f"{name}_sum{_format_labels(labels)} {repr(total)}")
+            lines.append(f"{name}_count{_format_labels(labels)} {count}")
+
+    return "\n".join(lines) + "\n"
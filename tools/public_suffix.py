@@ -0,0 +1,153 @@
+"""
+Offline registrable-domain ("root domain") extraction.
+
+Uses the ICANN section of the Public Suffix List bundled in
+``tools/data/public_suffix_list.dat``, loaded once into a label trie, so it
+never fetches anything over the network. Results are memoised per host.
+
+Matches tldextract's defaults: private suffixes (e.g. github.io) are not
+treated as public suffixes, and hosts under an unknown TLD or bare IP
+addresses have no root domain.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+from functools import lru_cache
+
+SUFFIX_LIST_PATH = os.path.join(os.path.dirname(__file__), "data", "public_suffix_list.dat")
+
+# Trie node markers: "$" = a rule ends here, "!" = exception rule.
+_END = "$"
+_EXCEPTION = "!"
+
+
+def _load_trie(path: str = SUFFIX_LIST_PATH) -> dict:
+    trie: dict = {}
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            rule = line.strip()
+            if not rule or rule.startswith("//"):
+                continue
+            exception = rule.startswith("!")
+            node = trie
+            for label in reversed(rule.lstrip("!").lower().split(".")):
+                node = node.setdefault(label, {})
+            node[_EXCEPTION if exception else _END] = True
+    return trie
+
+
+_TRIE = _load_trie()
+
+
+def _lookup_label(label: str) -> str:
+    # The list stores IDN suffixes in Unicode; hosts usually arrive punycoded.
+    if label.startswith("xn--"):
+        try:
+            return label.encode("ascii").decode("idna")
+        except UnicodeError:
+            return label
+    return label
+
+
+def suffix_length(labels: list[str]) -> int:
+    """
+    Number of trailing labels of ``labels`` that form the public suffix
+    (0 if the TLD is unknown).
+    """
+    node = _TRIE
+    matched = 0
+    for i, label in enumerate(reversed(labels)):
+        key = _lookup_label(label)
+        child = node.get(key)
+        if child is not None and child.get(_EXCEPTION):
+            # "!www.ck": www.ck is registrable, its suffix is just "ck".
+            return i
+        child = child if child is not None else node.get("*")
+        if child is None:
+            break
+        node = child
+        if node.get(_END):
+            matched = i + 1
+    return matched
+
+
+def url_host(url: str) -> str:
+    """
+    Lower-case host of a URL (scheme optional), without userinfo, port or
+    trailing dot.
+    """
+    url = url.strip()
+    if "//" in url:
+        url = url.split("//", 1)[1]
+    for sep in "/?#":
+        url = url.split(sep, 1)[0]
+    url = url.rsplit("@", 1)[-1]
+    if url.startswith("["):
+        # IPv6 literal
+        return url.split("]", 1)[0] + "]"
+    return url.split(":", 1)[0].rstrip(".").lower()
+
+
+@lru_cache(maxsize=8192)
+def root_domain_for_host(host: str):
+    """
+    Registrable domain of ``host`` (e.g. news.bbc.co.uk -> bbc.co.uk), or
+    None for IPs, unknown TLDs and bare suffixes.
+    """
+    labels = [label for label in host.split(".") if label]
+    if not labels or labels[-1].isdigit():
+        return None
+    n = suffix_length(labels)
+    if n == 0 or n >= len(labels):
+        return None
+    return ".".join(labels[-(n + 1):])
+
+
+def get_root_domain(url: str):
+    return root_domain_for_host(url_host(url))
+
+
+def _update(source: str, target: str = SUFFIX_LIST_PATH) -> int:
+    """
+    Rewrite the bundled snapshot from a full public_suffix_list.dat file,
+    keeping only the ICANN rules.
+    """
+    with open(source, encoding="utf-8") as f:
+        lines = f.read().splitlines()
+
+    header = [
+        "// This Source Code Form is subject to the terms of the Mozilla Public",
+        "// License, v. 2.0. If a copy of the MPL was not distributed with this",
+        "// file, You can obtain one at https://mozilla.org/MPL/2.0/.",
+        "",
+        "// ICANN section of the Public Suffix List (https://publicsuffix.org/list/),",
+        "// bundled so root-domain extraction never needs the network.",
+        "// Refresh with: python -m tools.public_suffix update <public_suffix_list.dat>",
+        "",
+    ]
+    rules = []
+    inside = False
+    for line in lines:
+        if "===BEGIN ICANN DOMAINS===" in line:
+            inside = True
+        elif "===END ICANN DOMAINS===" in line:
+            break
+        elif inside and line.strip() and not line.strip().startswith("//"):
+            rules.append(line.strip())
+
+    if not rules:
+        raise ValueError(f"No ICANN section found in {source}")
+    with open(target, "w", encoding="utf-8") as f:
+        f.write("\n".join(
+            header + ["// ===BEGIN ICANN DOMAINS==="] + rules + ["// ===END ICANN DOMAINS==="]
+        ) + "\n")
+    return len(rules)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3 or sys.argv[1] != "update":
+        print("Usage: python -m tools.public_suffix update <public_suffix_list.dat>")
+        sys.exit(2)
+    print(f"Wrote {_update(sys.argv[2])} suffix rules to {SUFFIX_LIST_PATH}")
@@ -0,0 +1,109 @@
+"""
+Process-wide token bucket with adaptive (AIMD) backoff for outbound searches.
+
+Every search takes a token before it goes out, so concurrent lookups share
+one request rate instead of each hammering DuckDuckGo on its own. When a
+search comes back rate limited, ``penalize()`` halves the rate and pauses
+the bucket with an exponentially growing backoff; each success afterwards
+nudges the rate back up towards its configured ceiling.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+
+from tools.deadline import DeadlineExceeded, remaining
+
+
+class TokenBucket:
+    """
+    ``rate`` tokens per second with room for ``burst`` at once. A rate of
+    0 (or less) disables limiting entirely.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int = 1,
+        min_rate: float = 0.2,
+        base_backoff: float = 1.0,
+        max_backoff: float = 30.0,
+    ):
+        self.max_rate = rate
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.min_rate = min(min_rate, rate) if rate > 0 else 0
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._backoff = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_rate > 0
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def _reserve(self) -> float:
+        """
+        Take a token if one is available and return 0, else return how long
+        to wait before trying again.
+        """
+        with self._lock:
+            now = time.monotonic()
+            if now < self._paused_until:
+                return self._paused_until - now
+            self._refill(now)
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+            return (1 - self._tokens) / self.rate
+
+    def acquire(self) -> None:
+        """
+        Block until a token is available. Raises DeadlineExceeded instead of
+        waiting past the current lookup's time budget.
+        """
+        if not self.enabled:
+            return
+        while True:
+            wait = self._reserve()
+            if wait <= 0:
+                return
+            left = remaining()
+            if left is not None and left < wait:
+                raise DeadlineExceeded("Lookup time budget exhausted while throttled")
+            time.sleep(wait)
+
+    def penalize(self) -> float:
+        """
+        Record a rate-limit response: halve the rate and pause the bucket.
+        Returns the backoff in seconds.
+        """
+        if not self.enabled:
+            return 0.0
+        with self._lock:
+            self._backoff = min(self.max_backoff, max(self.base_backoff, self._backoff * 2))
+            self.rate = max(self.min_rate, self.rate / 2)
+            self._tokens = 0.0
+            self._paused_until = max(self._paused_until, time.monotonic() + self._backoff)
+            return self._backoff
+
+    def reward(self) -> None:
+        """
+        Record a successful request: reset the backoff and recover the rate
+        additively.
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            self._backoff = 0.0
+            if self.rate < self.max_rate:
+                self.rate = min(self.max_rate, self.rate + self.max_rate * 0.1)
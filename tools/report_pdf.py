@@ -104,12 +104,20 @@ def generate_report_pdf(report: Dict[str, Any]) -> bytes:
   return buffer.getvalue()
 
 
-def generate_batch_csv_pdf(rows: List[Dict[str, Any]], download_url: str | None = None) -> bytes:
+BATCH_ROW_LIMIT_NOTE = "Only the first 5 rows of the uploaded CSV are processed to limit LLM and API usage."
+
+
+def generate_batch_csv_pdf(
+  rows: List[Dict[str, Any]],
+  download_url: str | None = None,
+  note: str | None = BATCH_ROW_LIMIT_NOTE,
+) -> bytes:
   """
   Generate a PDF summarising a batch CSV lookup.
 
   Each row is expected to have:
     Title, Company Name, First Name, Last Name, Source
+  ``note`` is printed under the row count; pass None to omit it.
   """
   buffer = BytesIO()
   c = canvas.Canvas(buffer, pagesize=LETTER)
@@ -129,8 +137,9 @@ def generate_batch_csv_pdf(rows: List[Dict[str, Any]], download_url: str | None
     c.setFont("Helvetica", 10)
     c.drawString(margin_x, y, f"Total rows in this report: {len(rows)}")
     y -= 14
-    c.setFont("Helvetica-Oblique", 9)
-    c.drawString(margin_x, y, "Only the first 5 rows of the uploaded CSV are processed to limit LLM and API usage.")
+    if note:
+      c.setFont("Helvetica-Oblique", 9)
+      c.drawString(margin_x, y, note)
     y -= 24
     c.setFont("Helvetica-Bold", 9)
     # Table headers
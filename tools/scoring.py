@@ -1,5 +1,12 @@
-import tldextract
-from ddgs import DDGS
+import json
+import os
+from functools import lru_cache
+from types import MappingProxyType
+
+from tools import domain_index, public_suffix
+from tools.deadline import DeadlineExceeded, expired
+from tools.metrics import timed
+from tools.search_tool import search_text
 
 # -----------------------------
 # Source Credibility Weights
@@ -27,6 +34,16 @@ NEWS_DOMAINS = [
     "bloomberg.com"
 ]
 
+# Known source domains -> category. A domain also covers its subdomains.
+# Extend or override with a JSON file ({"domain": "category"}) named by
+# SOURCE_DOMAINS_PATH.
+SOURCE_DOMAINS = {
+    "wikipedia.org": "wikipedia",
+    "linkedin.com": "linkedin",
+    **{domain: "news" for domain in NEWS_DOMAINS},
+}
+SOURCE_DOMAINS_PATH = os.getenv("SOURCE_DOMAINS_PATH", "")
+
 # -----------------------------
 # Utility: Extract Root Domain
 # -----------------------------
@@ -38,10 +55,8 @@ def get_root_domain(url: str):
         https://about.meta.com/xyz -> meta.com
         https://news.bbc.co.uk -> bbc.co.uk
     """
-    ext = tldextract.extract(url)
-    if ext.domain and ext.suffix:
-        return f"{ext.domain}.{ext.suffix}"
-    return None
+    # Offline and memoised per host (see tools/public_suffix.py).
+    return public_suffix.get_root_domain(url)
 
 
 # -----------------------------
@@ -51,10 +66,18 @@ def get_root_domain(url: str):
 def discover_official_domain(company_name: str):
     """
     Searches for official company website and returns root domain.
+    Skipped (returns None) once the lookup's time budget is spent.
     """
+    if expired():
+        return None
+
     query = f"{company_name} official website"
-    with DDGS() as ddgs:
-        results = ddgs.text(query, max_results=5)
+    with timed("discover_official_domain"):
+        try:
+            # Shares the search_tool query cache, so repeat companies are free.
+            results = search_text(query, max_results=5)
+        except DeadlineExceeded:
+            return None
         for r in results:
             url = r.get("href")
             if url:
@@ -64,64 +87,103 @@ def discover_official_domain(company_name: str):
     return None
 
 
+def get_official_domain(company_name: str):
+    """
+    Official root domain from the persistent domain index, discovering (and
+    indexing) it only on a miss.
+    """
+    domain = domain_index.get_domain(company_name)
+    if domain:
+        return domain
+
+    domain = discover_official_domain(company_name)
+    if domain:
+        domain_index.set_domain(company_name, domain)
+    return domain
+
+
 # -----------------------------
 # Step 2: Classify Source Properly
 # -----------------------------
 
-def classify_source(url: str, official_domain: str, company_name: str | None = None):
-    root = get_root_domain(url)
+class DomainClassifier:
+    """
+    Frozen domain -> category map, matched against a host and each of its
+    parent domains, so "uk.reuters.com" falls under "reuters.com".
+    """
+
+    def __init__(self, domains: dict):
+        for category in domains.values():
+            if category not in CREDIBILITY_SCORES:
+                raise ValueError(f"Unknown source category: {category}")
+        self.domains = MappingProxyType({d.lower().strip("."): c for d, c in domains.items()})
+
+    @classmethod
+    def from_file(cls, path: str, base: dict | None = None):
+        with open(path, encoding="utf-8") as f:
+            extra = json.load(f)
+        return cls({**(base or {}), **extra})
+
+    def classify_host(self, host: str) -> str | None:
+        while host:
+            category = self.domains.get(host)
+            if category:
+                return category
+            host = host.partition(".")[2]
+        return None
+
+
+def _build_classifier() -> DomainClassifier:
+    if SOURCE_DOMAINS_PATH:
+        return DomainClassifier.from_file(SOURCE_DOMAINS_PATH, base=SOURCE_DOMAINS)
+    return DomainClassifier(SOURCE_DOMAINS)
+
+
+source_classifier = _build_classifier()
+
+
+@lru_cache(maxsize=4096)
+def _company_slug(company_name: str) -> str:
+    words = company_name.lower().split()
+    return words[0] if words else ""
+
+
+def _classify(url: str, official_domain: str | None, slug: str) -> tuple[str, str | None]:
+    """(category, root domain) for one URL."""
+    host = public_suffix.url_host(url)
+    root = public_suffix.root_domain_for_host(host)
 
     if not root:
-        return "other"
+        return "other", None
 
     # Treat as official if it matches the discovered official domain
     if official_domain and root == official_domain:
-        return "official"
+        return "official", root
 
     # Fallback: if we have no official_domain, infer it from the company name
     # so that domains like "facebook.com" or "apple.com" are still treated
     # as official even when discovery fails or is rate-limited.
-    if company_name:
-        slug = company_name.lower().split()[0]
-        if slug and slug in root:
-            return "official"
+    if slug and slug in root:
+        return "official", root
 
-    if "wikipedia.org" in root:
-        return "wikipedia"
+    return source_classifier.classify_host(host) or "other", root
 
-    if "linkedin.com" in root:
-        return "linkedin"
 
-    if any(news in root for news in NEWS_DOMAINS):
-        return "news"
-
-    return "other"
+def classify_source(url: str, official_domain: str, company_name: str | None = None):
+    return _classify(url, official_domain, _company_slug(company_name) if company_name else "")[0]
 
 
 # -----------------------------
 # Step 3: Confidence Calculation
 # -----------------------------
 
-def calculate_confidence(
-    urls,
-    company_name: str,
-    title_match: bool = True,
-    company_match: bool = True
-):
-    """
-    Calculates deterministic confidence score.
-    """
-
+def _score(urls, official_domain, slug, title_match, company_match, weights) -> float:
     score = 0.0
     unique_domains = set()
 
-    official_domain = discover_official_domain(company_name)
-
     for url in urls:
-        source_type = classify_source(url, official_domain, company_name)
-        score += CREDIBILITY_SCORES[source_type]
-
-        root = get_root_domain(url)
+        source_type, root = _classify(url, official_domain, slug)
+        score += weights[source_type]
         if root:
             unique_domains.add(root)
 
@@ -138,4 +200,51 @@ def calculate_confidence(
     if company_match:
         score += 0.05
 
-    return min(0.95, round(score, 2))
\ No newline at end of file
+    return min(0.95, round(score, 2))
+
+
+def calculate_confidence(
+    urls,
+    company_name: str,
+    title_match: bool = True,
+    company_match: bool = True
+):
+    """
+    Calculates deterministic confidence score.
+    """
+    official_domain = get_official_domain(company_name)
+    return _score(
+        urls, official_domain, _company_slug(company_name),
+        title_match, company_match, CREDIBILITY_SCORES,
+    )
+
+
+def calculate_confidence_batch(records, weights: dict | None = None, discover: bool = False):
+    """
+    Scores many ``(urls, company_name)`` records in one pass, e.g. to
+    re-score stored results after a weights change. Records may also carry
+    ``title_match`` and ``company_match`` as third and fourth items.
+
+    Each company's official domain is resolved once. By default only the
+    domain index is consulted (no network); ``discover=True`` searches for
+    companies that are not indexed yet.
+    """
+    weights = weights or CREDIBILITY_SCORES
+    domains: dict[str, str | None] = {}
+    scores = []
+
+    for record in records:
+        urls, company_name, *flags = record
+        title_match = flags[0] if len(flags) > 0 else True
+        company_match = flags[1] if len(flags) > 1 else True
+
+        if company_name not in domains:
+            domains[company_name] = (
+                get_official_domain(company_name) if discover
+                else domain_index.get_domain(company_name)
+            )
+        scores.append(_score(
+            urls, domains[company_name], _company_slug(company_name),
+            title_match, company_match, weights,
+        ))
+    return scores
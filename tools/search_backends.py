@@ -0,0 +1,371 @@
+"""
+Where search results come from.
+
+``tools.search_tool`` (caching, per-lookup sessions, the CrewAI tools) asks
+the configured backend for results:
+
+- ``ddgs``  – live DuckDuckGo via ``ddgs``, through a pool of reusable
+  clients and a process-wide adaptive rate limiter.
+- ``local`` – an on-disk SQLite FTS5 index of saved result pages. No network;
+  answers in well under a millisecond.
+- ``local,ddgs`` – try the local index first and fall back to DuckDuckGo
+  when it has nothing.
+
+Select with ``SEARCH_BACKEND`` (default ``ddgs``). With
+``SEARCH_INDEX_RECORD=1`` every live DuckDuckGo result is also saved to the
+local index, so frequent companies can later be served offline. An index
+can also be loaded from a JSON-lines file of ``{"title", "body", "href"}``
+records with ``python -m tools.search_backends index <file.jsonl>``.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import queue
+import re
+import sqlite3
+import sys
+import threading
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+
+from ddgs import DDGS
+
+from tools.alias import C_LEVEL_MAP, SENIORITY_KEYWORDS, load_title_aliases
+from tools.deadline import bounded_timeout, check
+from tools.metrics import inc, timed
+from tools.rate_limit import TokenBucket
+
+SEARCH_BACKEND = os.getenv("SEARCH_BACKEND", "ddgs")
+
+# Per-request DDGS timeout in seconds (capped by the lookup's remaining budget).
+SEARCH_TIMEOUT = float(os.getenv("SEARCH_TIMEOUT_SECONDS", "5"))
+
+# Idle DDGS clients kept for reuse by this process.
+SEARCH_POOL_SIZE = int(os.getenv("SEARCH_POOL_SIZE", "4"))
+
+# Process-wide search rate (requests/second, 0 = unlimited) and burst size.
+SEARCH_RATE_PER_SECOND = float(os.getenv("SEARCH_RATE_PER_SECOND", "2"))
+SEARCH_BURST = int(os.getenv("SEARCH_BURST", "4"))
+
+# Extra tries for a search that comes back rate limited.
+SEARCH_RATE_LIMIT_RETRIES = int(os.getenv("SEARCH_RATE_LIMIT_RETRIES", "2"))
+
+# Local full-text index of saved result pages.
+SEARCH_INDEX_PATH = os.getenv("SEARCH_INDEX_PATH", "role_scout_search.db")
+SEARCH_INDEX_RECORD = os.getenv("SEARCH_INDEX_RECORD", "0").lower() in ("1", "true", "yes")
+
+
+def is_rate_limit_error(exc: Exception) -> bool:
+    """
+    True for DDGS/LLM errors that signal rate limiting (e.g. RatelimitException, HTTP 429).
+    """
+    text = f"{type(exc).__name__} {exc}".lower()
+    return "ratelimit" in text or "rate limit" in text or "429" in text
+
+
+class SearchBackend(ABC):
+    """
+    Interface: ``text(query, max_results)`` returns a list of dicts with
+    'title', 'body' and 'href', like ``DDGS().text``.
+    """
+
+    name = "base"
+
+    @abstractmethod
+    def text(self, query: str, max_results: int = 5) -> list[dict]:
+        """Search results for ``query``, best first."""
+
+
+# -----------------------
+# DuckDuckGo
+# -----------------------
+
+class SearchClientPool:
+    """
+    Pool of idle DDGS clients, so searches reuse HTTP connections instead of
+    opening a new client each time. Mirrors agents.pool.AgentPool.
+    """
+
+    def __init__(self, max_idle: int = 4):
+        self.max_idle = max_idle
+        self._idle: queue.LifoQueue = queue.LifoQueue()
+
+    @contextmanager
+    def lease(self):
+        timeout = bounded_timeout(SEARCH_TIMEOUT)
+        if timeout < SEARCH_TIMEOUT:
+            # Short on budget: use a one-off client with a tighter timeout.
+            yield DDGS(timeout=timeout)
+            return
+
+        try:
+            client = self._idle.get_nowait()
+        except queue.Empty:
+            client = DDGS(timeout=SEARCH_TIMEOUT)
+
+        yield client
+
+        # Only clients whose last request succeeded go back to the pool.
+        if self._idle.qsize() < self.max_idle:
+            self._idle.put_nowait(client)
+
+    def clear(self) -> None:
+        while True:
+            try:
+                self._idle.get_nowait()
+            except queue.Empty:
+                return
+
+
+search_clients = SearchClientPool(max_idle=SEARCH_POOL_SIZE)
+search_limiter = TokenBucket(rate=SEARCH_RATE_PER_SECOND, burst=SEARCH_BURST)
+
+
+class DDGSBackend(SearchBackend):
+    name = "ddgs"
+
+    def __init__(self, record_to=None):
+        # Optional LocalIndexBackend that keeps a copy of every live result.
+        self.record_to = record_to
+
+    def text(self, query: str, max_results: int = 5) -> list[dict]:
+        """
+        One throttled DDGS request, retried with backoff when rate limited.
+        """
+        for attempt in range(SEARCH_RATE_LIMIT_RETRIES + 1):
+            check()
+            with timed("search_throttle"):
+                search_limiter.acquire()
+            try:
+                with timed("search"), search_clients.lease() as ddgs:
+                    results = list(ddgs.text(query, max_results=max_results))
+            except Exception as exc:
+                if not is_rate_limit_error(exc):
+                    raise
+                inc("role_scout_rate_limit_errors_total", source="search")
+                search_limiter.penalize()
+                if attempt == SEARCH_RATE_LIMIT_RETRIES:
+                    raise
+                continue
+            search_limiter.reward()
+            if self.record_to is not None:
+                try:
+                    self.record_to.add_pages(results)
+                except Exception as exc:  # noqa: B902
+                    # Recording is best-effort; never fail a search over it.
+                    print(f"Search index write failed: {exc}")
+            return results
+
+
+# -----------------------
+# Local full-text index
+# -----------------------
+
+_INDEX_SCHEMA = """
+CREATE TABLE IF NOT EXISTS pages (
+    id INTEGER PRIMARY KEY,
+    href TEXT NOT NULL UNIQUE,
+    title TEXT NOT NULL,
+    body TEXT NOT NULL,
+    saved_at REAL NOT NULL
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS pages_fts USING fts5(
+    title, body, href, content='pages', content_rowid='id'
+);
+CREATE TRIGGER IF NOT EXISTS pages_ai AFTER INSERT ON pages BEGIN
+    INSERT INTO pages_fts (rowid, title, body, href) VALUES (new.id, new.title, new.body, new.href);
+END;
+CREATE TRIGGER IF NOT EXISTS pages_ad AFTER DELETE ON pages BEGIN
+    INSERT INTO pages_fts (pages_fts, rowid, title, body, href)
+    VALUES ('delete', old.id, old.title, old.body, old.href);
+END;
+"""
+
+_FTS_TOKEN = re.compile(r"\w+", re.UNICODE)
+
+# Words dropped from queries before matching: English stopwords and the
+# boilerplate the lookup pipeline adds to its queries ("... full name
+# official website"), which saved pages rarely contain.
+def _role_words() -> frozenset:
+    words = set(SENIORITY_KEYWORDS)
+    for group in load_title_aliases():
+        for title in group:
+            words.update(_FTS_TOKEN.findall(title))
+    for abbreviation, title in C_LEVEL_MAP.items():
+        words.add(abbreviation)
+        words.update(title.split())
+    return frozenset(words)
+
+
+# Words that only say which role is wanted ("ceo", "chief", "officer").
+# Pages may spell the role differently, so these are ORed; every other
+# word (the company) must appear.
+_ROLE_WORDS = _role_words()
+
+_QUERY_STOPWORDS = frozenset({
+    "a", "an", "and", "at", "by", "for", "in", "is", "of", "on", "or", "the",
+    "to", "who", "with",
+    "announcement", "current", "full", "leadership", "linkedin", "name",
+    "news", "official", "profile", "team", "website", "wikipedia",
+})
+
+
+class LocalIndexBackend(SearchBackend):
+    """
+    Saved result pages in a SQLite FTS5 index. Stopwords are ignored; a
+    page matches when it contains every other word of the query except
+    role words, plus at least one role word if the query has any (in the
+    title, snippet or URL). Best BM25 rank first.
+    """
+
+    name = "local"
+
+    def __init__(self, path: str = SEARCH_INDEX_PATH):
+        self.path = path
+        self._local = threading.local()
+        self._schema_lock = threading.Lock()
+        self._schema_ready = False
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            if not self._schema_ready:
+                with self._schema_lock:
+                    if not self._schema_ready:
+                        conn.execute("PRAGMA journal_mode=WAL")
+                        conn.executescript(_INDEX_SCHEMA)
+                        self._schema_ready = True
+            self._local.conn = conn
+        return conn
+
+    def add_pages(self, pages) -> int:
+        """
+        Insert or replace pages (by URL). Returns how many were written.
+        """
+        # Keyed by URL, so a page saved twice in one input keeps its last copy.
+        rows = list({
+            p["href"]: (p["href"], p.get("title") or "", p.get("body") or "", time.time())
+            for p in pages
+            if p.get("href")
+        }.values())
+        if not rows:
+            return 0
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            # Delete + insert (not REPLACE) so the FTS delete trigger fires.
+            conn.executemany("DELETE FROM pages WHERE href = ?", [(r[0],) for r in rows])
+            conn.executemany(
+                "INSERT INTO pages (href, title, body, saved_at) VALUES (?, ?, ?, ?)", rows
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return len(rows)
+
+    def text(self, query: str, max_results: int = 5) -> list[dict]:
+        tokens = _FTS_TOKEN.findall(query.lower())
+        tokens = list(dict.fromkeys(t for t in tokens if t not in _QUERY_STOPWORDS) or tokens)
+        if not tokens:
+            return []
+        # Quote every word so FTS syntax in the query (AND, NEAR, "-") is
+        # inert. A page about another company must not match on "CEO" alone.
+        quoted = ['"' + t.replace('"', '""') + '"' for t in tokens]
+        required = [q for q, t in zip(quoted, tokens) if t not in _ROLE_WORDS]
+        roles = [q for q, t in zip(quoted, tokens) if t in _ROLE_WORDS]
+        if roles:
+            required.append("(" + " OR ".join(roles) + ")")
+        match = " AND ".join(required)
+        with timed("search_local"):
+            rows = self._conn().execute(
+                "SELECT p.title, p.body, p.href FROM pages_fts "
+                "JOIN pages p ON p.id = pages_fts.rowid "
+                "WHERE pages_fts MATCH ? ORDER BY bm25(pages_fts) LIMIT ?",
+                (match, max_results),
+            ).fetchall()
+        return [{"title": t, "body": b, "href": h} for t, b, h in rows]
+
+
+class FallbackBackend(SearchBackend):
+    """
+    Ask each backend in turn and return the first non-empty result.
+    """
+
+    def __init__(self, backends):
+        self.backends = list(backends)
+        self.name = ",".join(b.name for b in self.backends)
+
+    def text(self, query: str, max_results: int = 5) -> list[dict]:
+        results: list[dict] = []
+        for backend in self.backends:
+            results = backend.text(query, max_results=max_results)
+            if results:
+                return results
+        return results
+
+
+# -----------------------
+# Selection
+# -----------------------
+
+def build_backend(spec: str = SEARCH_BACKEND) -> SearchBackend:
+    """
+    Build a backend from a spec such as "ddgs", "local" or "local,ddgs".
+    """
+    local = None
+    backends = []
+    for name in (part.strip().lower() for part in spec.split(",")):
+        if name == "local":
+            local = local or LocalIndexBackend()
+            backends.append(local)
+        elif name == "ddgs":
+            backends.append(DDGSBackend())
+        elif name:
+            raise ValueError(f"Unknown search backend: {name}")
+
+    if not backends:
+        backends.append(DDGSBackend())
+    if SEARCH_INDEX_RECORD:
+        for backend in backends:
+            if isinstance(backend, DDGSBackend):
+                backend.record_to = local or LocalIndexBackend()
+    return backends[0] if len(backends) == 1 else FallbackBackend(backends)
+
+
+_backend: SearchBackend | None = None
+_backend_lock = threading.Lock()
+
+
+def get_search_backend() -> SearchBackend:
+    global _backend
+    if _backend is None:
+        with _backend_lock:
+            if _backend is None:
+                _backend = build_backend()
+    return _backend
+
+
+def set_search_backend(backend: SearchBackend | None) -> None:
+    """Swap the process-wide backend (None = rebuild from config on next use)."""
+    global _backend
+    with _backend_lock:
+        _backend = backend
+
+
+def _index_file(path: str) -> int:
+    backend = LocalIndexBackend()
+    with open(path, encoding="utf-8") as f:
+        pages = [json.loads(line) for line in f if line.strip()]
+    return backend.add_pages(pages)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3 or sys.argv[1] != "index":
+        print("Usage: python -m tools.search_backends index <pages.jsonl>")
+        sys.exit(2)
+    print(f"Indexed {_index_file(sys.argv[2])} pages into {SEARCH_INDEX_PATH}")
@@ -1,17 +1,248 @@
+import contextvars
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
 from crewai.tools import tool
-from ddgs import DDGS
+
+from tools import cache
+from tools.deadline import DeadlineExceeded
+from tools.metrics import inc
+from tools.search_backends import get_search_backend, is_rate_limit_error
+from tools.ttl_cache import TTLCache
+
+# Queries run concurrently by one multi-search call.
+SEARCH_MULTI_MAX_WORKERS = int(os.getenv("SEARCH_MULTI_MAX_WORKERS", "4"))
+
+# Shared query -> results cache: in-process LRU, optionally backed by Redis.
+SEARCH_CACHE_TTL = int(os.getenv("SEARCH_CACHE_TTL", "21600"))
+SEARCH_CACHE_SIZE = int(os.getenv("SEARCH_CACHE_SIZE", "2048"))
+SEARCH_CACHE_REDIS = os.getenv("SEARCH_CACHE_REDIS", "1").lower() not in ("0", "false", "no")
+
+# Empty results are often a soft block rather than a real answer, so they
+# are only kept briefly (0 = never cached).
+SEARCH_CACHE_EMPTY_TTL = int(os.getenv("SEARCH_CACHE_EMPTY_TTL", "60"))
+
+_query_cache = TTLCache(maxsize=SEARCH_CACHE_SIZE, ttl=SEARCH_CACHE_TTL)
+
+# Per-lookup record of searches already made (query -> results), if any.
+_session: ContextVar = ContextVar("search_session", default=None)
+
+
+@contextmanager
+def search_session(store: dict):
+    """
+    Records every search made in this context into ``store`` and answers
+    repeated queries from it, so retries do not re-run the same searches.
+    """
+    token = _session.set(store)
+    try:
+        yield store
+    finally:
+        _session.reset(token)
+
+
+# -----------------------
+# Query result cache
+# -----------------------
+
+def _search_cache_key(query: str, max_results: int) -> str:
+    return f"search:{max_results}:{' '.join(query.lower().split())}"
+
+
+def _cached_search(key: str):
+    results = _query_cache.get(key)
+    if results is not None:
+        inc("role_scout_search_cache_total", result="hit_memory")
+        return results
+
+    if SEARCH_CACHE_REDIS:
+        try:
+            data = cache.redis_client.get(key)
+        except Exception:
+            # Fail-soft if Redis is unavailable
+            data = None
+        if data:
+            try:
+                results = json.loads(data)
+            except Exception:
+                results = None
+            if isinstance(results, list):
+                # Same short lifetime for a promoted empty list as for a fresh one.
+                ttl = SEARCH_CACHE_TTL if results else SEARCH_CACHE_EMPTY_TTL
+                if ttl > 0:
+                    _query_cache.set(key, results, ttl=ttl)
+                inc("role_scout_search_cache_total", result="hit_redis")
+                return results
+
+    inc("role_scout_search_cache_total", result="miss")
+    return None
+
+
+def _store_search(key: str, results: list[dict]) -> None:
+    ttl = SEARCH_CACHE_TTL if results else SEARCH_CACHE_EMPTY_TTL
+    if ttl <= 0:
+        return
+    _query_cache.set(key, results, ttl=ttl)
+    if SEARCH_CACHE_REDIS:
+        try:
+            cache.redis_client.setex(key, ttl, json.dumps(results))
+        except Exception:
+            return
+
+
+def clear_search_cache() -> None:
+    """Drop the in-process tier (the Redis tier expires on its own)."""
+    _query_cache.clear()
+
+
+def search_text(query: str, max_results: int = 5) -> list[dict]:
+    """
+    Runs a text search on the configured backend (DuckDuckGo by default)
+    and returns the raw results (dicts with 'title', 'body' and 'href').
+
+    Raises DeadlineExceeded if the lookup's time budget is spent, including
+    while waiting for the rate limiter.
+    """
+    session = _session.get()
+    if session is not None and query in session:
+        return session[query]
+
+    key = _search_cache_key(query, max_results)
+    results = _cached_search(key)
+
+    if results is None:
+        results = get_search_backend().text(query, max_results=max_results)
+        _store_search(key, results)
+
+    if session is not None:
+        session[query] = results
+    return results
+
+
+# -----------------------
+# Multi-query search
+# -----------------------
+
+_TRACKING_PARAMS = ("utm_", "gclid", "fbclid", "ref", "mc_")
+
+
+def canonical_url(url: str) -> str:
+    """
+    Normalise a URL for de-duplication: lower-case host without "www.",
+    no fragment, no tracking parameters, no trailing slash.
+    """
+    try:
+        parts = urlsplit(url.strip())
+    except ValueError:
+        return url
+    host = parts.netloc.lower()
+    if host.startswith("www."):
+        host = host[4:]
+    query = urlencode([
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if not k.lower().startswith(_TRACKING_PARAMS)
+    ])
+    path = parts.path.rstrip("/")
+    return urlunsplit((parts.scheme.lower() or "https", host, path, query, ""))
+
+
+def search_many(queries, max_results: int = 5, return_exceptions: bool = False) -> list:
+    """
+    Run several searches in parallel and return their results in query
+    order. With ``return_exceptions`` a failed query yields its exception in
+    place of a result list; otherwise the first failure is raised.
+    """
+    queries = list(queries)
+
+    def run(query):
+        try:
+            return search_text(query, max_results=max_results)
+        except Exception as exc:
+            if not return_exceptions:
+                raise
+            return exc
+
+    if len(queries) <= 1:
+        return [run(query) for query in queries]
+
+    # Each query runs in a copy of this context so the lookup's search
+    # session and deadline follow it into the worker thread.
+    workers = min(SEARCH_MULTI_MAX_WORKERS, len(queries))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(contextvars.copy_context().run, run, query) for query in queries
+        ]
+        return [f.result() for f in futures]
+
+
+def merge_results(result_lists) -> list[dict]:
+    """
+    Flatten several result lists, keeping the first result per canonical URL.
+    """
+    merged = []
+    seen = set()
+    for results in result_lists:
+        for r in results:
+            url = r.get("href")
+            key = canonical_url(url) if url else None
+            if key in seen:
+                continue
+            if key:
+                seen.add(key)
+            merged.append(r)
+    return merged
+
+
+def format_results(results) -> str:
+    """
+    Renders search results as the compact text block handed to agents.
+    """
+    return "\n".join(
+        f"Title: {r.get('title', '')}\n"
+        f"Snippet: {r.get('body', '')}\n"
+        f"URL: {r.get('href', '')}\n"
+        for r in results
+    )
+
 
 @tool("DuckDuckGo Search")
 def duckduckgo_search_tool(query: str) -> str:
     """
     Performs a DuckDuckGo search and returns top 5 results.
     """
-    results = []
-    with DDGS() as ddgs:
-        for r in ddgs.text(query, max_results=5):
-            results.append(
-                f"Title: {r['title']}\n"
-                f"Snippet: {r['body']}\n"
-                f"URL: {r['href']}\n"
-            )
-    return "\n".join(results)
\ No newline at end of file
+    try:
+        return format_results(search_text(query, max_results=5))
+    except DeadlineExceeded:
+        return "Search skipped: the time budget for this lookup is exhausted. Answer with what you have."
+    except Exception as exc:
+        if is_rate_limit_error(exc):
+            return "Search unavailable: DuckDuckGo is rate limiting requests. Answer with what you have."
+        raise
+
+
+@tool("DuckDuckGo Multi Search")
+def duckduckgo_multi_search_tool(queries: list[str]) -> str:
+    """
+    Runs several DuckDuckGo searches in parallel and returns their top 5
+    results each, merged into one list with duplicate URLs removed. Pass all
+    queries you want to try in a single call.
+    """
+    if isinstance(queries, str):
+        queries = [queries]
+    queries = [q for q in queries or [] if q and q.strip()]
+    if not queries:
+        return "No queries given."
+    outcomes = search_many(queries, max_results=5, return_exceptions=True)
+    found = [o for o in outcomes if not isinstance(o, Exception)]
+
+    if not found:
+        if any(isinstance(o, DeadlineExceeded) for o in outcomes):
+            return "Search skipped: the time budget for this lookup is exhausted. Answer with what you have."
+        if any(is_rate_limit_error(o) for o in outcomes):
+            return "Search unavailable: DuckDuckGo is rate limiting requests. Answer with what you have."
+        raise outcomes[0]
+    return format_results(merge_results(found))
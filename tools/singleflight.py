@@ -0,0 +1,162 @@
+"""
+Single-flight coalescing for identical in-flight lookups.
+
+When several callers ask for the same key while a lookup is already running,
+only one of them (the leader) does the work; the others wait for its result.
+
+- In-process: followers block on the leader's thread and share its result.
+- Across workers: the leader holds a short-lived Redis lock and followers
+  poll the published result (the lookup cache) until the lock is released.
+
+Redis failures are fail-soft: if the lock cannot be taken or checked, the
+caller simply runs the work itself.
+"""
+
+from __future__ import annotations
+
+import copy
+import os
+import threading
+import time
+import uuid
+from typing import Any, Callable
+
+from tools import cache
+from tools.deadline import DeadlineExceeded, check, remaining
+
+# How long a leader may hold the cross-worker lock before it expires.
+LOCK_TTL = int(os.getenv("SINGLEFLIGHT_LOCK_TTL", "300"))
+
+# How often followers in other workers check for the leader's result.
+POLL_INTERVAL = float(os.getenv("SINGLEFLIGHT_POLL_INTERVAL", "0.5"))
+
+# Compare-and-delete so a leader never releases a lock it no longer owns.
+_RELEASE_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+_calls: dict[str, _Call] = {}
+_calls_lock = threading.Lock()
+
+
+# -----------------------
+# Cross-worker Redis lock
+# -----------------------
+
+def _lock_key(key: str) -> str:
+    return f"singleflight:{key}"
+
+
+def _acquire(lock_key: str, token: str) -> bool:
+    try:
+        return bool(cache.redis_client.set(lock_key, token, nx=True, ex=LOCK_TTL))
+    except Exception:
+        # Fail-soft if Redis is unavailable: act as leader.
+        return True
+
+
+def _release(lock_key: str, token: str) -> None:
+    try:
+        cache.redis_client.eval(_RELEASE_SCRIPT, 1, lock_key, token)
+    except Exception:
+        return
+
+
+def _lock_held(lock_key: str) -> bool:
+    try:
+        return bool(cache.redis_client.exists(lock_key))
+    except Exception:
+        return False
+
+
+def _wait_for_leader(lock_key: str, poll: Callable[[], Any]):
+    """
+    Wait while another worker holds the lock. Returns the leader's published
+    result, or None if the lock went away without one.
+    """
+    while True:
+        check()
+        result = poll()
+        if result is not None:
+            return result
+        if not _lock_held(lock_key):
+            return poll()
+        time.sleep(POLL_INTERVAL)
+
+
+def _run_distributed(key: str, fn: Callable[[], Any], poll: Callable[[], Any]):
+    lock_key = _lock_key(key)
+    token = uuid.uuid4().hex
+
+    waited = False
+    while True:
+        if _acquire(lock_key, token):
+            try:
+                # Another leader may have published while we were waiting.
+                # Callers have just missed the cache, so skip the re-read
+                # when the lock was free at once.
+                result = poll() if waited else None
+                if result is not None:
+                    return result
+                return fn()
+            finally:
+                _release(lock_key, token)
+
+        waited = True
+        result = _wait_for_leader(lock_key, poll)
+        if result is not None:
+            return result
+        # Leader finished without publishing (e.g. an error result); try to
+        # take over the lock ourselves.
+
+
+# -----------------------
+# Public API
+# -----------------------
+
+def coalesce(key: str, fn: Callable[[], Any], poll: Callable[[], Any]):
+    """
+    Run ``fn`` at most once per ``key`` across threads and workers.
+
+    ``poll`` returns the result a leader in another worker has published
+    (e.g. a cache read), or None if nothing is available yet.
+    """
+    with _calls_lock:
+        call = _calls.get(key)
+        leader = call is None
+        if leader:
+            call = _Call()
+            _calls[key] = call
+
+    if not leader:
+        # Followers give up when their own lookup's time budget runs out.
+        if not call.done.wait(remaining()):
+            raise DeadlineExceeded("Timed out waiting for an identical in-flight lookup")
+        if call.error is not None:
+            raise call.error
+        # Callers decorate results (e.g. with a report), so never share one dict.
+        return copy.deepcopy(call.result)
+
+    try:
+        result = _run_distributed(key, fn, poll)
+        # Keep a private copy for followers; the leader's caller may mutate its own.
+        call.result = copy.deepcopy(result)
+        return result
+    except BaseException as exc:
+        call.error = exc
+        raise
+    finally:
+        with _calls_lock:
+            _calls.pop(key, None)
+        call.done.set()